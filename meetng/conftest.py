@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+# Widget tests run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Shared QApplication for tests that build widgets"""
+    QApplication = pytest.importorskip("PyQt6.QtWidgets").QApplication
+    return QApplication.instance() or QApplication([])
@@ -1,13 +1,67 @@
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
+import copy
+import hashlib
 import json
 import logging
+import threading
+
+from .semantic_suggestion_cache import SemanticSuggestionCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ConversationTreeService")
 
+# Maximum number of parsed LLM suggestion responses kept in memory
+SUGGESTION_CACHE_SIZE = 512
+
+# Maximum number of threads a suggestion batch uses for cache and embedding
+# lookups; the LLM requests themselves go through the LangChain service one
+# at a time
+SUGGESTION_BATCH_WORKERS = 8
+
+class _SuggestionBatchSignals(QObject):
+    """Signals for _SuggestionBatchWorker (QRunnable cannot define its own)"""
+    
+    finished = pyqtSignal(object)  # The worker, with its responses filled in
+
+
+class _SuggestionBatchWorker(QRunnable):
+    """Fetches suggestions for a batch of nodes on the thread pool
+    
+    Each node is handled on a ThreadPoolExecutor thread, so semantic cache
+    lookups overlap; the LLM requests are serialized by the service.
+    """
+    
+    def __init__(self, fetch, pending, nodes, node_ids, suggestions_by_node):
+        """Create the worker
+        
+        Args:
+            fetch: Callable taking a pending item and returning (suggestions or None, semantic cache entry)
+            pending: (node_id, key, prompt, history, use_cache) items to fetch
+            nodes: The service's node dict when the batch started
+            node_ids: All requested node IDs, in order
+            suggestions_by_node: Suggestions already found in the cache
+        """
+        super().__init__()
+        self.fetch = fetch
+        self.pending = pending
+        self.nodes = nodes
+        self.node_ids = node_ids
+        self.suggestions_by_node = suggestions_by_node
+        self.responses = []
+        self.signals = _SuggestionBatchSignals()
+        
+    def run(self):
+        workers = min(SUGGESTION_BATCH_WORKERS, len(self.pending))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            self.responses = list(executor.map(self.fetch, self.pending))
+        self.signals.finished.emit(self)
+
+
 class ConversationNode:
     """Represents a node in the conversation tree"""
     
@@ -27,6 +81,16 @@ class ConversationNode:
         self.metadata = metadata or {}
         self.timestamp = time.time()
         
+    @property
+    def display_label(self) -> str:
+        """Content prefixed with the speaker, if any, for status text"""
+        return f"{self.speaker}: {self.content}" if self.speaker else self.content
+        
+    @property
+    def tiny_label(self) -> str:
+        """First 30 characters of the content, for short status text"""
+        return self.content[:30]
+        
     def add_child(self, child_id: str):
         """Add a child node ID to this node"""
         if child_id not in self.children:
@@ -70,11 +134,25 @@ class ConversationTreeService(QObject):
     suggestions_ready = pyqtSignal(list)  # List of suggestion nodes
     error_occurred = pyqtSignal(str)  # Error message
     current_position_changed = pyqtSignal(str)  # Current node ID
+    suggestions_batch_ready = pyqtSignal(list)  # Node IDs from generate_suggestions_batch
     
-    def __init__(self, langchain_service=None):
+    def __init__(self, langchain_service=None, disk_cache=None, embedder=None):
+        """Create the service
+        
+        Args:
+            langchain_service: Service used to generate suggestions
+            disk_cache: Optional SuggestionDiskCache, owned by the caller, to
+                persist suggestions in; without one they are kept in memory only
+            embedder: Optional LangChain embeddings (embed_query) used to
+                reuse suggestions when the latest utterance is reworded; it
+                sends utterances to the embeddings provider, so it is opt-in
+        """
         super().__init__()
         self.langchain_service = langchain_service
         self.nodes = {}  # Dictionary of node_id -> ConversationNode
+        # IDs of nodes added since take_added_nodes, in insertion order, or
+        # None after any other change to the nodes
+        self._added_nodes = None
         self.root_id = None
         self.current_node_id = None
         self.conversation_context = {
@@ -84,6 +162,21 @@ class ConversationTreeService(QObject):
             "goals": [],
             "settings": {}
         }
+        # Parsed suggestions by prompt hash, least recently used first
+        self._suggestion_cache = OrderedDict()
+        
+        # Running generate_suggestions_batch workers, kept alive until done
+        self._batch_workers = []
+        
+        # The LangChain service is not known to be thread-safe, so the UI
+        # thread and batch workers take turns calling it
+        self._llm_lock = threading.Lock()
+        
+        # Backing store that keeps suggestions across restarts
+        self._disk_cache = disk_cache
+        
+        # Suggestions for utterances that only differ in wording
+        self._semantic_cache = SemanticSuggestionCache(embedder) if embedder else None
         
     def create_new_conversation(self, context: Dict[str, Any]) -> bool:
         """Create a new conversation tree with the given context
@@ -126,6 +219,7 @@ class ConversationTreeService(QObject):
             
             # Reset and initialize tree
             self.nodes = {root_id: root_node}
+            self._mark_tree_replaced()
             self.root_id = root_id
             self.current_node_id = root_id
             
@@ -175,7 +269,7 @@ class ConversationTreeService(QObject):
             )
             
             # Add the new node to the tree
-            self.nodes[node_id] = new_node
+            self._store_node(new_node)
             
             # Update the parent node's children
             if self.current_node_id in self.nodes:
@@ -202,6 +296,34 @@ class ConversationTreeService(QObject):
             self.error_occurred.emit(error_msg)
             return ""
             
+    def _store_node(self, node: ConversationNode):
+        """Add a node to the tree, recording it for take_added_nodes"""
+        self.nodes[node.id] = node
+        if self._added_nodes is not None:
+            self._added_nodes[node.id] = None
+            
+    def _mark_tree_replaced(self):
+        """Make the next take_added_nodes call ask for a full refresh
+        
+        Every change to the nodes other than adding them through _store_node,
+        such as replacing, removing or editing nodes, must call this.
+        """
+        self._added_nodes = None
+            
+    def take_added_nodes(self) -> Optional[List[str]]:
+        """Get and reset the IDs of nodes added since the last call
+        
+        Lets views update incrementally on tree_updated. Only additions are
+        tracked; the current node is not, so views read current_node_id.
+        
+        Returns:
+            Optional[List[str]]: Added node IDs, parents before children, or
+            None if the nodes changed in any other way and need a full refresh
+        """
+        added = self._added_nodes
+        self._added_nodes = {}
+        return list(added) if added is not None else None
+        
     def get_node(self, node_id: str) -> Optional[ConversationNode]:
         """Get a node by its ID
         
@@ -244,17 +366,20 @@ class ConversationTreeService(QObject):
             
         return path
         
-    def get_conversation_history(self) -> List[Dict[str, Any]]:
+    def get_conversation_history(self, node_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get the conversation history as a list of utterances
         
+        Args:
+            node_id: Node to end the history at, defaults to the current node
+            
         Returns:
             List[Dict[str, Any]]: List of utterances with speaker and content
         """
         if not self.root_id:
             return []
             
-        # Get the path from root to current node
-        path = self.get_path_to_node(self.current_node_id)
+        # Get the path from root to the node
+        path = self.get_path_to_node(node_id or self.current_node_id)
         
         # Convert path to list of utterances
         history = []
@@ -293,14 +418,7 @@ class ConversationTreeService(QObject):
             logger.debug(f"Initial suggestions prompt: {prompt}")
             
             # Call LangChain service
-            response = self.langchain_service.generate_conversation_suggestions(
-                prompt=prompt,
-                num_suggestions=3,
-                context=self.conversation_context
-            )
-            
-            # Process the response
-            suggestions = self._parse_suggestions(response)
+            suggestions = self._request_suggestions(prompt, num_suggestions=3)
             logger.info(f"Received {len(suggestions)} initial suggestions")
             
             # Add suggestions as nodes
@@ -314,14 +432,20 @@ class ConversationTreeService(QObject):
             # Create fallback suggestions
             self._create_fallback_suggestions()
             
-    def _create_fallback_suggestions(self):
-        """Create fallback suggestions when LangChain fails"""
+    def _create_fallback_suggestions(self, parent_id: Optional[str] = None, emit: bool = True):
+        """Create fallback suggestions when LangChain fails
+        
+        Args:
+            parent_id: Node to attach the suggestions to, defaults to the current node
+            emit: Whether to emit suggestions_ready with the new nodes
+        """
+        parent_id = parent_id or self.current_node_id
         suggestion_nodes = []
-        fallback_suggestions = [
+        fallback_suggestions = self._without_existing_children(parent_id, [
             {"speaker": "You", "content": "Hello, how can I help you today?"},
             {"speaker": "You", "content": "Let's start by discussing your needs."},
             {"speaker": "You", "content": "I'd like to understand more about what you're looking for."}
-        ]
+        ])
         
         for i, suggestion in enumerate(fallback_suggestions):
             node_id = f"suggestion_{len(self.nodes)}_{i}"
@@ -329,81 +453,107 @@ class ConversationTreeService(QObject):
                 id=node_id,
                 content=suggestion["content"],
                 speaker=suggestion["speaker"],
-                parent_id=self.current_node_id,
+                parent_id=parent_id,
                 node_type="suggested",
                 metadata={"suggestion_index": i, "is_fallback": True}
             )
-            self.nodes[node_id] = node
-            if self.current_node_id in self.nodes:
-                self.nodes[self.current_node_id].add_child(node_id)
+            self._store_node(node)
+            if parent_id in self.nodes:
+                self.nodes[parent_id].add_child(node_id)
             suggestion_nodes.append(node)
             
         # Emit signal with fallback suggestions
-        self.suggestions_ready.emit(suggestion_nodes)
+        if emit:
+            self.suggestions_ready.emit(suggestion_nodes)
         logger.info("Fallback suggestions generated")
         
-    def _add_suggestion_nodes(self, suggestions):
+    def _without_existing_children(self, parent_id: Optional[str], suggestions):
+        """Drop suggestions whose content matches a child the parent already has
+        
+        Cached or repeated LLM responses would otherwise add duplicate children.
+        """
+        parent = self.nodes.get(parent_id)
+        if not parent or not parent.children:
+            return suggestions
+        existing = {self.nodes[child_id].content for child_id in parent.children if child_id in self.nodes}
+        return [suggestion for suggestion in suggestions if suggestion["content"] not in existing]
+        
+    def _add_suggestion_nodes(self, suggestions, parent_id: Optional[str] = None, emit: bool = True):
         """Add suggestion nodes to the tree
         
         Args:
             suggestions: List of suggestion dictionaries with speaker and content
+            parent_id: Node to attach the suggestions to, defaults to the current node
+            emit: Whether to emit suggestions_ready with the new nodes
+            
+        Returns:
+            List[ConversationNode]: The added suggestion nodes
         """
+        parent_id = parent_id or self.current_node_id
         suggestion_nodes = []
-        for i, suggestion in enumerate(suggestions):
+        for i, suggestion in enumerate(self._without_existing_children(parent_id, suggestions)):
             node_id = f"suggestion_{len(self.nodes)}_{i}"
             node = ConversationNode(
                 id=node_id,
                 content=suggestion["content"],
                 speaker=suggestion["speaker"],
-                parent_id=self.current_node_id,
+                parent_id=parent_id,
                 node_type="suggested",
                 metadata={"suggestion_index": i}
             )
-            self.nodes[node_id] = node
-            if self.current_node_id in self.nodes:
-                self.nodes[self.current_node_id].add_child(node_id)
+            self._store_node(node)
+            if parent_id in self.nodes:
+                self.nodes[parent_id].add_child(node_id)
             suggestion_nodes.append(node)
             logger.debug(f"Added suggestion node: {node_id} - {suggestion['speaker']}: {suggestion['content'][:30]}...")
             
         # Emit signal with suggestions
-        self.suggestions_ready.emit(suggestion_nodes)
+        if emit:
+            self.suggestions_ready.emit(suggestion_nodes)
         logger.info("Suggestions added successfully")
+        return suggestion_nodes
             
     def _generate_suggestions_for_current_node(self):
         """Generate suggestions for the current node"""
+        self.generate_suggestions_for_node(self.current_node_id)
+        
+    def generate_suggestions_for_node(self, node_id: str):
+        """Generate suggestions for a node without making it the current node
+        
+        suggestions_ready is only emitted for the current node, so the
+        suggestions shown to the user stay in step with the position.
+        
+        Args:
+            node_id: The ID of the node to generate suggestions for
+        """
         if not self.langchain_service:
             self.error_occurred.emit("LangChain service not available")
             return
             
+        emit = node_id == self.current_node_id
         try:
             # Check if method exists
             if not hasattr(self.langchain_service, 'generate_conversation_suggestions'):
                 logger.error("Method 'generate_conversation_suggestions' not found in LangChain service")
                 # Create fallback suggestions
-                self._create_fallback_suggestions()
+                self._create_fallback_suggestions(node_id, emit)
                 return
                 
             # Get conversation history
-            history = self.get_conversation_history()
+            history = self.get_conversation_history(node_id)
             
             # Prepare the prompt for suggestions
             prompt = self._create_suggestions_prompt(history)
             
-            # Call LangChain service - adjust number of suggestions based on mode
-            num_suggestions = 5 if hasattr(self, 'conversation_mode') and self.conversation_mode == "guided" else 3
-            
-            response = self.langchain_service.generate_conversation_suggestions(
-                prompt=prompt,
-                num_suggestions=num_suggestions,
-                context=self.conversation_context,
-                history=history
+            # Call LangChain service - adjust number of suggestions based on
+            # mode, skipping the cache if the node already has suggestions
+            suggestions = self._request_suggestions(
+                prompt, self._suggestion_count(), history,
+                use_cache=not self.nodes[node_id].children
             )
             
-            # Process the response
-            suggestions = self._parse_suggestions(response)
-            
             # Add suggestions as nodes
-            self._add_suggestion_nodes(suggestions)
+            self._add_suggestion_nodes(suggestions, node_id, emit)
             
         except Exception as e:
             error_msg = f"Failed to generate suggestions: {str(e)}"
@@ -411,8 +561,261 @@ class ConversationTreeService(QObject):
             self.error_occurred.emit(error_msg)
             
             # Create fallback suggestions
-            self._create_fallback_suggestions()
+            self._create_fallback_suggestions(node_id, emit)
+            
+    def generate_suggestions_batch(self, node_ids: List[str]):
+        """Generate suggestions for several nodes at once, in the background
+        
+        Prompts are built for every node up front and the uncached ones are
+        sent to the LLM concurrently on the thread pool, so the call returns
+        right away. When all requests are done the suggestion nodes are added
+        on this thread, with fallback suggestions for nodes whose request
+        failed, then tree_updated and suggestions_batch_ready are emitted
+        once. The current node is left unchanged.
+        
+        Args:
+            node_ids: IDs of the nodes to generate suggestions for
+        """
+        if not self.langchain_service:
+            self.error_occurred.emit("LangChain service not available")
+            return
+            
+        node_ids = [node_id for node_id in node_ids if node_id in self.nodes]
+        if not hasattr(self.langchain_service, 'generate_conversation_suggestions'):
+            logger.error("Method 'generate_conversation_suggestions' not found in LangChain service")
+            self._apply_suggestions_batch(node_ids, {})
+            return
+            
+        num_suggestions = self._suggestion_count()
+        context_hash = self._context_hash() if self._semantic_cache else None
+        # Workers must not see edits the UI thread makes to the live context
+        context = copy.deepcopy(self.conversation_context)
+        
+        # Build the prompts and answer what we can from the cache. Nodes that
+        # already have suggestions want new ones, so they skip the cache
+        suggestions_by_node = {}
+        pending = []  # (node_id, key, prompt, history, use_cache)
+        for node_id in node_ids:
+            history = self.get_conversation_history(node_id)
+            prompt = self._create_suggestions_prompt(history)
+            key = self._suggestion_cache_key(prompt, num_suggestions)
+            use_cache = not self.nodes[node_id].children
+            cached = self._get_cached_suggestions(key) if use_cache else None
+            if cached is not None:
+                suggestions_by_node[node_id] = cached
+            else:
+                pending.append((node_id, key, prompt, history, use_cache))
+                
+        if not pending:
+            self._apply_suggestions_batch(node_ids, suggestions_by_node)
+            return
+            
+        # Send the rest to the LLM off this thread
+        def fetch(item):
+            node_id, key, prompt, history, use_cache = item
+            try:
+                similar, entry = (
+                    self._find_similar_suggestions(history, num_suggestions, context_hash)
+                    if use_cache else (None, None)
+                )
+                if similar is not None:
+                    return similar, None
+                return self._fetch_suggestions(prompt, num_suggestions, history, context), entry
+            except Exception as e:
+                logger.error(f"Failed to generate suggestions for {node_id}: {str(e)}", exc_info=True)
+                return None, None
+                
+        worker = _SuggestionBatchWorker(fetch, pending, self.nodes, node_ids, suggestions_by_node)
+        worker.signals.finished.connect(self._on_suggestions_batch_fetched)
+        self._batch_workers.append(worker)
+        QThreadPool.globalInstance().start(worker)
+        
+    def _on_suggestions_batch_fetched(self, worker: _SuggestionBatchWorker):
+        """Cache and add the suggestions fetched by a batch worker"""
+        self._batch_workers.remove(worker)
+        
+        # Drop the results if the tree was replaced in the meantime, but still
+        # report the batch as done so the caller can clear its status. Node
+        # IDs are reused across trees, so none of the old ones are reported
+        if self.nodes is not worker.nodes:
+            self.suggestions_batch_ready.emit([])
+            return
+            
+        failed = 0
+        for (node_id, key, *_), (suggestions, entry) in zip(worker.pending, worker.responses):
+            if not suggestions:
+                failed += 1
+                continue
+            self._cache_suggestions(key, suggestions, entry)
+            worker.suggestions_by_node[node_id] = suggestions
+        if failed:
+            self.error_occurred.emit(f"Failed to generate suggestions for {failed} node(s)")
+            
+        self._apply_suggestions_batch(
+            [node_id for node_id in worker.node_ids if node_id in self.nodes],
+            worker.suggestions_by_node
+        )
+        
+    def _apply_suggestions_batch(self, node_ids: List[str], suggestions_by_node: Dict[str, List[Dict[str, str]]]):
+        """Add batch suggestion nodes in the requested order, with fallbacks
+        for nodes that got none, and emit the batch signals"""
+        for node_id in node_ids:
+            suggestions = suggestions_by_node.get(node_id)
+            if suggestions:
+                self._add_suggestion_nodes(suggestions, parent_id=node_id, emit=False)
+            else:
+                self._create_fallback_suggestions(node_id, emit=False)
+                
+        self.tree_updated.emit()
+        self.suggestions_batch_ready.emit(node_ids)
+        
+    def clear_suggestion_cache(self):
+        """Forget every cached suggestion, in memory and on disk"""
+        self._suggestion_cache.clear()
+        if self._semantic_cache:
+            self._semantic_cache.clear()
+        if self._disk_cache:
+            self._disk_cache.clear()
+        logger.info("Suggestion cache cleared")
+        
+    def _suggestion_count(self) -> int:
+        """Number of suggestions to request for a node in the current mode"""
+        return 5 if getattr(self, 'conversation_mode', None) == "guided" else 3
+        
+    def _suggestion_cache_key(self, prompt: str, num_suggestions: int) -> str:
+        """Hash a prompt and suggestion count into a cache key"""
+        return hashlib.blake2b(f"{num_suggestions}|{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+        
+    def _get_cached_suggestions(self, key: str) -> Optional[List[Dict[str, str]]]:
+        """Get cached suggestions for a key, marking them recently used"""
+        cached = self._suggestion_cache.get(key)
+        if cached is not None:
+            self._suggestion_cache.move_to_end(key)
+            logger.debug("Using cached suggestions")
+            return list(cached)
+            
+        # Fall back to the disk cache, keeping hits in memory
+        if self._disk_cache:
+            cached = self._disk_cache.get(key)
+            if cached:
+                logger.debug("Using suggestions from disk cache")
+                self._remember_suggestions(key, cached)
+                return list(cached)
+        return None
+        
+    def _cache_suggestions(self, key: str, suggestions: List[Dict[str, str]], entry=None):
+        """Store suggestions in memory and on disk
+        
+        Args:
+            key: Prompt hash from _suggestion_cache_key
+            suggestions: Parsed suggestions
+            entry: Semantic cache entry from _find_similar_suggestions, if any
+        """
+        # Only cache usable responses so failures are retried
+        if not suggestions:
+            return
+        self._remember_suggestions(key, suggestions)
+        if self._disk_cache:
+            self._disk_cache.set(key, suggestions)
+        if self._semantic_cache and entry is not None:
+            self._semantic_cache.add(entry, suggestions)
+            
+    def _context_hash(self) -> str:
+        """Hash the conversation context, goals included, to scope semantic cache hits"""
+        context = json.dumps(self.conversation_context, sort_keys=True, default=str)
+        return hashlib.blake2b(context.encode("utf-8"), digest_size=16).hexdigest()
+        
+    def _find_similar_suggestions(self, history: Optional[List[Dict[str, Any]]],
+                                  num_suggestions: int, context_hash: str):
+        """Look up suggestions cached after a similarly worded utterance
+        
+        Only the latest utterance is embedded. The whole history would make
+        consecutive turns look alike, since each one is the previous turn's
+        history plus one utterance. Entries only match the same suggestion
+        count, conversation context and preceding utterance, so a short turn
+        like "Okay." is not answered with suggestions from another
+        conversation or branch. Embedding is a network request, so only call
+        this off the UI thread.
+        
+        Args:
+            history: Conversation history ending with the utterance to match
+            num_suggestions: Number of suggestions requested
+            context_hash: _context_hash() taken on the UI thread
+        
+        Returns:
+            (suggestions or None, semantic cache entry or None)
+        """
+        if not self._semantic_cache or not history:
+            return None, None
+        utterance = history[-1]
+        previous = history[-2] if len(history) > 1 else {}
+        tag = (num_suggestions, context_hash, previous.get("speaker"), previous.get("content"))
+        similar, entry = self._semantic_cache.lookup(
+            f"{utterance['speaker']}: {utterance['content']}", tag
+        )
+        if similar is not None:
+            logger.debug("Using suggestions for a similar utterance")
+            return list(similar), entry
+        return None, entry
+            
+    def _remember_suggestions(self, key: str, suggestions: List[Dict[str, str]]):
+        """Store suggestions in memory, evicting the least recently used entry when full"""
+        self._suggestion_cache[key] = suggestions
+        self._suggestion_cache.move_to_end(key)
+        if len(self._suggestion_cache) > SUGGESTION_CACHE_SIZE:
+            self._suggestion_cache.popitem(last=False)
+            
+    def _fetch_suggestions(self, prompt: str, num_suggestions: int,
+                           history: Optional[List[Dict[str, Any]]] = None,
+                           context: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        """Ask the LLM for suggestions and parse the response, bypassing the cache
+        
+        Args:
+            prompt: The prompt text
+            num_suggestions: Number of suggestions to request
+            history: Optional conversation history passed to the LLM
+            context: Conversation context to send, defaults to the live one;
+                pass a copy when calling off the UI thread
+        """
+        with self._llm_lock:
+            response = self.langchain_service.generate_conversation_suggestions(
+                prompt=prompt,
+                num_suggestions=num_suggestions,
+                context=self.conversation_context if context is None else context,
+                history=history
+            )
+        return self._parse_suggestions(response)
+        
+    def _request_suggestions(self, prompt: str, num_suggestions: int,
+                             history: Optional[List[Dict[str, Any]]] = None,
+                             use_cache: bool = True) -> List[Dict[str, str]]:
+        """Get parsed suggestions for a prompt, reusing earlier LLM responses
+        
+        The prompt already contains the conversation context and history, so
+        identical prompts are answered from the in-memory LRU or disk cache.
+        This runs on the caller's thread, so the semantic cache, which needs
+        an embeddings request, is only used by generate_suggestions_batch.
+        
+        Args:
+            prompt: The prompt text
+            num_suggestions: Number of suggestions to request
+            history: Optional conversation history passed to the LLM
+            use_cache: False to always ask the LLM, e.g. for more suggestions
+                for a node that already has some; the response is still cached
             
+        Returns:
+            List[Dict[str, str]]: List of suggestions with speaker and content
+        """
+        key = self._suggestion_cache_key(prompt, num_suggestions)
+        if use_cache:
+            cached = self._get_cached_suggestions(key)
+            if cached is not None:
+                return cached
+                
+        suggestions = self._fetch_suggestions(prompt, num_suggestions, history)
+        self._cache_suggestions(key, suggestions)
+        return list(suggestions)
+        
     def _create_initial_suggestions_prompt(self) -> str:
         """Create a prompt for generating initial suggestions
         
@@ -558,14 +961,7 @@ Format your response as a JSON array with "speaker" and "content" fields.
             logger.debug(f"Guided suggestions prompt: {prompt}")
             
             # Call LangChain service with more suggestions for guided mode
-            response = self.langchain_service.generate_conversation_suggestions(
-                prompt=prompt,
-                num_suggestions=5,  # More suggestions for guided mode
-                context=self.conversation_context
-            )
-            
-            # Process the response
-            suggestions = self._parse_suggestions(response)
+            suggestions = self._request_suggestions(prompt, num_suggestions=5)
             logger.info(f"Received {len(suggestions)} guided suggestions")
             
             # Add suggestions as nodes
@@ -664,6 +1060,7 @@ Format your response as a JSON array with "speaker" and "content" fields.
             self.nodes = {}
             for node_id, node_data in data.get("nodes", {}).items():
                 self.nodes[node_id] = ConversationNode.from_dict(node_data)
+            self._mark_tree_replaced()
                 
             logger.info(f"Tree loaded successfully with {len(self.nodes)} nodes")
             self.tree_updated.emit()
@@ -0,0 +1,100 @@
+import logging
+import threading
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticSuggestionCache:
+    """In-memory cache of suggestions looked up by text similarity
+
+    Catches requests that differ only in wording, which the exact-match
+    caches miss. Texts are embedded with a LangChain-style embedder
+    (anything with embed_query(text) -> list of floats) and stored as unit
+    vectors, so a lookup is one matrix-vector product. Vectors are kept as
+    float16 to halve memory; when full, the oldest entry is overwritten.
+    Entries only match lookups with the same tag, e.g. the number of
+    suggestions requested.
+
+    embed and lookup make a network request with a remote embedder, so
+    call them off the UI thread; the cache can be used from several threads.
+    """
+
+    def __init__(self, embedder, capacity=512, threshold=0.92):
+        """Create an empty cache
+
+        Args:
+            embedder: Object with an embed_query(text) method
+            capacity: Maximum number of cached prompts
+            threshold: Minimum cosine similarity for a hit
+        """
+        self.embedder = embedder
+        self.capacity = capacity
+        self.threshold = threshold
+        self._vectors = None  # (capacity, dim) float16, allocated on first add
+        self._values = [None] * capacity
+        self._count = 0
+        self._tags = [None] * capacity
+        self._next = 0  # Row the next entry is written to
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text as a unit vector, or None if embedding fails"""
+        try:
+            vector = np.asarray(self.embedder.embed_query(text), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Failed to embed prompt: {str(e)}")
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def lookup(self, text: str, tag=None) -> Tuple[Optional[List[Dict[str, str]]], Optional[tuple]]:
+        """Find suggestions cached for similar text with the same tag
+
+        Returns:
+            (suggestions or None, entry or None) - pass the entry to add() on
+            a miss to avoid embedding the text twice
+        """
+        vector = self.embed(text)
+        if vector is None:
+            return None, None
+        entry = (vector, tag)
+        with self._lock:
+            if not self._count or vector.shape[0] != self._vectors.shape[1]:
+                return None, entry
+
+            # Accumulate in float32, float16 sums lose too much precision
+            similarities = np.matmul(self._vectors[:self._count], vector, dtype=np.float32)
+            mismatched = [i for i in range(self._count) if self._tags[i] != tag]
+            similarities[mismatched] = -1.0
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                return self._values[best], entry
+        return None, entry
+
+    def add(self, entry: Optional[tuple], suggestions: List[Dict[str, str]]):
+        """Cache suggestions under an entry from lookup()"""
+        if entry is None or not suggestions:
+            return
+        vector, tag = entry
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.capacity, vector.shape[0]), dtype=np.float16)
+            elif vector.shape[0] != self._vectors.shape[1]:
+                return
+
+            self._vectors[self._next] = vector
+            self._values[self._next] = suggestions
+            self._tags[self._next] = tag
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def clear(self):
+        """Forget every cached entry"""
+        with self._lock:
+            self._values = [None] * self.capacity
+            self._tags = [None] * self.capacity
+            self._count = 0
+            self._next = 0
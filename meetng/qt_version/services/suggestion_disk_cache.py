@@ -0,0 +1,100 @@
+import sqlite3
+import json
+import os
+import time
+import logging
+from typing import List, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SuggestionDiskCache:
+    """Persistent SQLite cache of parsed LLM conversation suggestions
+
+    Keeps suggestions across app restarts so repeated sessions with the same
+    context and history don't pay for the LLM calls again. Entries are keyed
+    by the same prompt hash as ConversationTreeService's in-memory cache and
+    the least recently used ones are evicted past max_entries.
+    """
+
+    # Run eviction once every this many writes
+    EVICT_INTERVAL = 100
+
+    def __init__(self, db_path='suggestion_cache.db', max_entries=10000):
+        """Open (creating if needed) the cache database
+
+        Args:
+            db_path: File name inside the app data directory, or an absolute path
+            max_entries: Number of entries to keep when evicting
+        """
+        if not os.path.isabs(db_path):
+            # Same app data directory as the settings database
+            app_data = os.getenv('APPDATA') if os.name == 'nt' else os.path.expanduser('~/.config')
+            db_path = os.path.join(app_data, 'PowerPlay', db_path)
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._writes = 0
+
+        # Ensure directory exists
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        with self._conn:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT,
+                    ts REAL
+                )
+            ''')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS cache_ts ON cache (ts)')
+
+    def get(self, key: str) -> Optional[List[Dict[str, str]]]:
+        """Get the suggestions stored for a key, or None if there are none"""
+        try:
+            row = self._conn.execute('SELECT value FROM cache WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                self._conn.execute('UPDATE cache SET ts = ? WHERE key = ?', (time.time(), key))
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Failed to read suggestion cache: {str(e)}")
+            return None
+
+    def set(self, key: str, suggestions: List[Dict[str, str]]):
+        """Store the suggestions for a key"""
+        try:
+            with self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)',
+                    (key, json.dumps(suggestions), time.time())
+                )
+            self._writes += 1
+            if self._writes % self.EVICT_INTERVAL == 0:
+                self.evict()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write suggestion cache: {str(e)}")
+
+    def evict(self):
+        """Delete all but the max_entries most recently used entries"""
+        with self._conn:
+            self._conn.execute(
+                'DELETE FROM cache WHERE ts < '
+                '(SELECT ts FROM cache ORDER BY ts DESC LIMIT 1 OFFSET ?)',
+                (self.max_entries - 1,)
+            )
+
+    def clear(self):
+        """Delete every cached entry"""
+        try:
+            with self._conn:
+                self._conn.execute('DELETE FROM cache')
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clear suggestion cache: {str(e)}")
+            
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
@@ -1,19 +1,149 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QFrame, QSizePolicy, QScrollArea, QCheckBox,
-    QLineEdit, QGroupBox, QFormLayout
+    QLineEdit, QGroupBox, QFormLayout, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QThread
 from PyQt6.QtGui import QPixmap, QPainter, QImage
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from wordcloud import WordCloud
 import numpy as np
 from collections import Counter
 import re
 import os
 
+try:
+    from numba import njit, types
+    from numba.typed import Dict as NumbaDict
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Transcripts at least this large go through the JIT tokenizer when numba is installed
+_NUMBA_MIN_BYTES = 256 * 1024
+
+_FNV_OFFSET = 0xcbf29ce484222325
+_FNV_PRIME = 0x100000001b3
+_UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def _fnv1a(word):
+    """FNV-1a hash of an ASCII word, as a signed 64-bit int (matches the JIT kernel)"""
+    h = _FNV_OFFSET
+    for byte in word.encode('ascii', 'ignore'):
+        h = ((h ^ byte) * _FNV_PRIME) & _UINT64_MASK
+    return h - (1 << 64) if h >= (1 << 63) else h
+
+
+# Simple stopwords list instead of using NLTK
+_DEFAULT_STOPWORDS = frozenset({'a', 'an', 'the', 'and', 'or', 'but', 'if', 'then', 'else', 'when',
+                                'at', 'from', 'by', 'for', 'with', 'about', 'against', 'between',
+                                'into', 'through', 'during', 'before', 'after', 'above', 'below',
+                                'to', 'of', 'in', 'on', 'off', 'over', 'under', 'again', 'further',
+                                'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how',
+                                'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other',
+                                'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so',
+                                'than', 'too', 'very', 's', 't', 'can', 'will', 'just', 'don',
+                                'should', 'now', 'i', 'me', 'my', 'myself', 'we', 'our', 'ours',
+                                'ourselves', 'you', 'your', 'yours', 'yourself', 'yourselves',
+                                'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 'herself',
+                                'it', 'its', 'itself', 'they', 'them', 'their', 'theirs',
+                                'themselves', 'what', 'which', 'who', 'whom', 'this', 'that',
+                                'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been',
+                                'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did',
+                                'doing', 'would', 'should', 'could', 'ought', 'i\'m', 'you\'re',
+                                'he\'s', 'she\'s', 'it\'s', 'we\'re', 'they\'re', 'i\'ve',
+                                'you\'ve', 'we\'ve', 'they\'ve', 'i\'d', 'you\'d', 'he\'d',
+                                'she\'d', 'we\'d', 'they\'d', 'i\'ll', 'you\'ll', 'he\'ll',
+                                'she\'ll', 'we\'ll', 'they\'ll', 'isn\'t', 'aren\'t', 'wasn\'t',
+                                'weren\'t', 'hasn\'t', 'haven\'t', 'hadn\'t', 'doesn\'t', 'don\'t',
+                                'didn\'t', 'won\'t', 'wouldn\'t', 'shan\'t', 'shouldn\'t', 'can\'t',
+                                'cannot', 'couldn\'t', 'mustn\'t', 'let\'s', 'that\'s', 'who\'s',
+                                'what\'s', 'here\'s', 'there\'s', 'when\'s', 'where\'s', 'why\'s',
+                                'how\'s', 'um', 'uh', 'er', 'ah', 'like', 'okay', 'right', 'yeah'})
+_DEFAULT_STOP_HASHES = frozenset(_fnv1a(w) for w in _DEFAULT_STOPWORDS)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _is_word_byte(c):
+        """True for ASCII bytes the regex \\w matches: letters, digits and '_'"""
+        return (c >= 48 and c <= 57) or (c >= 65 and c <= 90) or (c >= 97 and c <= 122) or c == 95
+
+    @njit(cache=True)
+    def _count_tokens(buf, stop_hashes, min_len):
+        """Count alphabetic tokens in an ASCII uint8 buffer keyed by their FNV-1a hash.
+
+        Tokens are whole words made only of letters, like the \\b[a-zA-Z]{n,}\\b
+        pattern used for small transcripts; words that contain digits or '_'
+        are skipped entirely. Non-ASCII input is not supported.
+
+        Returns (counts, first_offsets) where first_offsets maps each hash to the
+        start of its first occurrence packed with its length (start << 16 | length)
+        so the caller can recover the token string.
+        """
+        counts = NumbaDict.empty(key_type=types.int64, value_type=types.int64)
+        offsets = NumbaDict.empty(key_type=types.int64, value_type=types.int64)
+        n = buf.shape[0]
+        i = 0
+        while i < n:
+            if not _is_word_byte(buf[i]):
+                i += 1
+                continue
+            start = i
+            ascii_letters = True
+            h = np.uint64(_FNV_OFFSET)
+            while i < n and _is_word_byte(buf[i]):
+                c = buf[i]
+                if c >= 65 and c <= 90:
+                    c += 32
+                elif not (c >= 97 and c <= 122):
+                    ascii_letters = False
+                h = (h ^ np.uint64(c)) * np.uint64(_FNV_PRIME)
+                i += 1
+            length = i - start
+            if not ascii_letters or length < min_len or length > 0xFFFF:
+                continue
+            key = np.int64(h)
+            pos = np.searchsorted(stop_hashes, key)
+            if pos < stop_hashes.shape[0] and stop_hashes[pos] == key:
+                continue
+            if key in counts:
+                counts[key] += 1
+            else:
+                counts[key] = 1
+                offsets[key] = (np.int64(start) << 16) | np.int64(length)
+        return counts, offsets
+
+
+class _WCWorker(QThread):
+    """Worker thread that runs the WordCloud layout off the UI thread"""
+
+    result = pyqtSignal(int, np.ndarray, dict)  # generation, image, word positions
+
+    def __init__(self, generation, frequencies, parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self.freqs = dict(frequencies)
+
+    def run(self):
+        from wordcloud import WordCloud
+
+        if self.isInterruptionRequested():
+            return
+        wc = WordCloud(
+            width=800, 
+            height=600, 
+            background_color='white',
+            max_words=200,
+            contour_width=1,
+            contour_color='steelblue'
+        ).generate_from_frequencies(self.freqs)
+        if self.isInterruptionRequested():
+            return
+        # layout_ positions are (row, col); store (x, y) to match click coordinates
+        positions = {word: (col, row, size) for (word, _), size, (row, col), _, _ in wc.layout_}
+        self.result.emit(self.generation, wc.to_array(), positions)
+
+
 class WordCloudWidget(QWidget):
     """Widget for displaying and interacting with a word cloud visualization"""
     
@@ -22,34 +152,19 @@ class WordCloudWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.word_counts = Counter()
-        # Simple stopwords list instead of using NLTK
-        self.stopwords = {'a', 'an', 'the', 'and', 'or', 'but', 'if', 'then', 'else', 'when',
-                         'at', 'from', 'by', 'for', 'with', 'about', 'against', 'between',
-                         'into', 'through', 'during', 'before', 'after', 'above', 'below',
-                         'to', 'of', 'in', 'on', 'off', 'over', 'under', 'again', 'further',
-                         'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how',
-                         'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other',
-                         'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so',
-                         'than', 'too', 'very', 's', 't', 'can', 'will', 'just', 'don',
-                         'should', 'now', 'i', 'me', 'my', 'myself', 'we', 'our', 'ours',
-                         'ourselves', 'you', 'your', 'yours', 'yourself', 'yourselves',
-                         'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 'herself',
-                         'it', 'its', 'itself', 'they', 'them', 'their', 'theirs',
-                         'themselves', 'what', 'which', 'who', 'whom', 'this', 'that',
-                         'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been',
-                         'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did',
-                         'doing', 'would', 'should', 'could', 'ought', 'i\'m', 'you\'re',
-                         'he\'s', 'she\'s', 'it\'s', 'we\'re', 'they\'re', 'i\'ve',
-                         'you\'ve', 'we\'ve', 'they\'ve', 'i\'d', 'you\'d', 'he\'d',
-                         'she\'d', 'we\'d', 'they\'d', 'i\'ll', 'you\'ll', 'he\'ll',
-                         'she\'ll', 'we\'ll', 'they\'ll', 'isn\'t', 'aren\'t', 'wasn\'t',
-                         'weren\'t', 'hasn\'t', 'haven\'t', 'hadn\'t', 'doesn\'t', 'don\'t',
-                         'didn\'t', 'won\'t', 'wouldn\'t', 'shan\'t', 'shouldn\'t', 'can\'t',
-                         'cannot', 'couldn\'t', 'mustn\'t', 'let\'s', 'that\'s', 'who\'s',
-                         'what\'s', 'here\'s', 'there\'s', 'when\'s', 'where\'s', 'why\'s',
-                         'how\'s', 'um', 'uh', 'er', 'ah', 'like', 'okay', 'right', 'yeah'}
+        self.stopwords = _DEFAULT_STOPWORDS
         self.custom_stopwords = set()
         self.min_word_length = 3
+        self._tok_re = self._compile_token_pattern(self.min_word_length)
+        self._wc_generation = 0
+        self._wc_workers = set()
+        self._wc_image = None
+        app = QApplication.instance()
+        if app is not None:
+            # Embedded widgets get no closeEvent when the main window closes
+            app.aboutToQuit.connect(self._stop_wordcloud_workers)
+        self.figure = None
+        self.canvas = None
         self.init_ui()
         
     def init_ui(self):
@@ -95,24 +210,34 @@ class WordCloudWidget(QWidget):
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         
+        # Plain placeholder until real data arrives; matplotlib loads on first use
+        self.placeholder_label = QLabel("No data available")
+        self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.scroll_area.setWidget(self.placeholder_label)
+        layout.addWidget(self.scroll_area)
+        
+    def _ensure_canvas(self):
+        """Create the matplotlib figure and canvas on first use"""
+        if self.canvas is not None:
+            return
+            
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        
         self.figure = Figure(figsize=(8, 6), dpi=100)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.canvas.mpl_connect('button_press_event', self.on_word_click)
         
+        # Replaces (and deletes) the placeholder label
         self.scroll_area.setWidget(self.canvas)
-        layout.addWidget(self.scroll_area)
-        
-        # Initialize with empty plot
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_axis_off()
-        self.ax.text(0.5, 0.5, "No data available", 
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    transform=self.ax.transAxes,
-                    fontsize=14)
-        self.canvas.draw()
+        self.placeholder_label = None
         
+    @staticmethod
+    def _compile_token_pattern(min_length):
+        """Compile a word pattern that only matches words of at least min_length letters"""
+        return re.compile(rf'\b[a-zA-Z]{{{min_length},}}\b')
+
     def update_min_length(self, text):
         """Update minimum word length"""
         try:
@@ -120,6 +245,7 @@ class WordCloudWidget(QWidget):
         except ValueError:
             self.min_word_length = 3
             self.min_length_input.setText("3")
+        self._tok_re = self._compile_token_pattern(self.min_word_length)
             
     def update_custom_stopwords(self, text):
         """Update custom stopwords list"""
@@ -144,6 +270,10 @@ class WordCloudWidget(QWidget):
                     transcript_path = path.replace('.mp3', '_transcript.txt')
                 
                 if os.path.exists(transcript_path):
+                    if NUMBA_AVAILABLE and os.path.getsize(transcript_path) >= _NUMBA_MIN_BYTES:
+                        total_words += self._count_file_jit(transcript_path)
+                        continue
+
                     with open(transcript_path, 'r', encoding='utf-8') as f:
                         content = f.read()
                         
@@ -163,45 +293,101 @@ class WordCloudWidget(QWidget):
         
     def preprocess_text(self, text):
         """Preprocess text by tokenizing and removing stopwords"""
-        # Simple word tokenization
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        # Simple word tokenization; short words never match the pattern
+        words = self._tok_re.findall(text.lower())
         
-        # Filter words: remove stopwords, custom stopwords, and short words
+        # Filter words: remove stopwords and custom stopwords
         filtered_words = [
             word for word in words 
             if word not in self.stopwords 
             and word not in self.custom_stopwords
-            and len(word) >= self.min_word_length
         ]
         return filtered_words
+
+    def _count_file_jit(self, transcript_path):
+        """Tokenize a large transcript with the numba kernel and merge its counts
+
+        The kernel only classifies ASCII, so a transcript containing any other
+        character goes through preprocess_text instead.
+        """
+        with open(transcript_path, 'rb') as f:
+            data = f.read()
+        buf = np.frombuffer(data, dtype=np.uint8)
+        if buf.size and buf.max() >= 0x80:
+            words = self.preprocess_text(data.decode('utf-8'))
+            self.word_counts.update(words)
+            return len(words)
+
+        # Non-ASCII stopwords can never match an ASCII token
+        if self.stopwords is _DEFAULT_STOPWORDS:
+            hashes = set(_DEFAULT_STOP_HASHES)
+        else:
+            hashes = {_fnv1a(w) for w in self.stopwords if w.isascii()}
+        hashes.update(_fnv1a(w) for w in self.custom_stopwords if w.isascii())
+        stop_hashes = np.array(sorted(hashes), dtype=np.int64)
+        counts, offsets = _count_tokens(buf, stop_hashes, self.min_word_length)
+
+        total = 0
+        for key, count in counts.items():
+            packed = offsets[key]
+            start, length = packed >> 16, packed & 0xFFFF
+            word = buf[start:start + length].tobytes().decode('ascii').lower()
+            self.word_counts[word] += count
+            total += count
+        return total
         
     def generate_wordcloud(self):
-        """Generate and display the word cloud"""
+        """Generate the word cloud in a worker thread and display it when ready"""
         if not self.word_counts:
             return
             
-        # Clear the figure
-        self.figure.clear()
-        self.ax = self.figure.add_subplot(111)
-        
-        # Generate word cloud
-        wordcloud = WordCloud(
-            width=800, 
-            height=600, 
-            background_color='white',
-            max_words=200,
-            contour_width=1,
-            contour_color='steelblue'
-        ).generate_from_frequencies(self.word_counts)
-        
+        # Newer requests supersede pending ones; stale results are dropped
+        self._wc_generation += 1
+        for previous in self._wc_workers:
+            previous.requestInterruption()
+        worker = _WCWorker(self._wc_generation, self.word_counts, self)
+        worker.result.connect(self._on_wordcloud_ready)
+        worker.finished.connect(self._on_wordcloud_worker_finished)
+        worker.finished.connect(worker.deleteLater)
+        self._wc_workers.add(worker)
+        worker.start()
+        
+    def _on_wordcloud_worker_finished(self):
+        """Forget a finished layout thread; deleteLater frees it"""
+        self._wc_workers.discard(self.sender())
+        
+    def _stop_wordcloud_workers(self):
+        """Interrupt and wait for layout threads so none outlives the widget"""
+        for worker in list(self._wc_workers):
+            worker.requestInterruption()
+            worker.quit()
+            worker.wait()
+        self._wc_workers.clear()
+        
+    def closeEvent(self, event):
+        """Stop any running layout thread before the widget goes away"""
+        self._stop_wordcloud_workers()
+        super().closeEvent(event)
+        
+    def _on_wordcloud_ready(self, generation, image, positions):
+        """Display a finished word cloud image unless a newer one was requested"""
+        if generation != self._wc_generation:
+            return
+            
         # Store word positions for click detection
-        self.word_positions = wordcloud.layout_
-        
-        # Display the word cloud
-        self.ax.imshow(wordcloud, interpolation='bilinear')
-        self.ax.set_axis_off()
-        self.figure.tight_layout(pad=0)
-        self.canvas.draw()
+        self.word_positions = positions
+        
+        if self._wc_image is None:
+            # First image: replace the placeholder axes
+            self._ensure_canvas()
+            self.figure.clear()
+            self.ax = self.figure.add_subplot(111)
+            self._wc_image = self.ax.imshow(image, interpolation='bilinear')
+            self.ax.set_axis_off()
+            self.figure.tight_layout(pad=0)
+        else:
+            self._wc_image.set_data(image)
+        self.canvas.draw_idle()
         
     def regenerate_wordcloud(self):
         """Regenerate the word cloud with current settings"""
@@ -233,6 +419,14 @@ class WordCloudWidget(QWidget):
     def clear(self):
         """Clear the word cloud"""
         self.word_counts = Counter()
+        self._wc_generation += 1
+        for worker in self._wc_workers:
+            worker.requestInterruption()
+        self._wc_image = None
+        self.status_label.setText("No data loaded")
+        if self.canvas is None:
+            return
+            
         self.figure.clear()
         self.ax = self.figure.add_subplot(111)
         self.ax.set_axis_off()
@@ -242,7 +436,6 @@ class WordCloudWidget(QWidget):
                     transform=self.ax.transAxes,
                     fontsize=14)
         self.canvas.draw()
-        self.status_label.setText("No data loaded")
 
 
 class TopWordsWidget(QWidget):
@@ -254,6 +447,9 @@ class TopWordsWidget(QWidget):
         super().__init__(parent)
         self.word_counts = Counter()
         self.top_n = 20  # Default number of top words to show
+        self._last_top_n = None  # top_n of the chart currently laid out
+        self.figure = None
+        self.canvas = None
         self.init_ui()
         
     def init_ui(self):
@@ -280,23 +476,29 @@ class TopWordsWidget(QWidget):
         
         layout.addLayout(controls_layout)
         
+        # Plain placeholder until real data arrives; matplotlib loads on first use
+        self.placeholder_label = QLabel("No data available")
+        self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.placeholder_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        layout.addWidget(self.placeholder_label)
+        
+    def _ensure_canvas(self):
+        """Create the matplotlib figure and canvas on first use"""
+        if self.canvas is not None:
+            return
+            
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        
         # Chart display area
         self.figure = Figure(figsize=(8, 6), dpi=100)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.canvas.mpl_connect('button_press_event', self.on_bar_click)
         
-        layout.addWidget(self.canvas)
-        
-        # Initialize with empty plot
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_title("Top Words")
-        self.ax.text(0.5, 0.5, "No data available", 
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    transform=self.ax.transAxes,
-                    fontsize=14)
-        self.canvas.draw()
+        self.layout().replaceWidget(self.placeholder_label, self.canvas)
+        self.placeholder_label.deleteLater()
+        self.placeholder_label = None
         
     def update_top_n(self, text):
         """Update number of top words to display"""
@@ -316,15 +518,30 @@ class TopWordsWidget(QWidget):
         if not self.word_counts:
             return
             
+        # Get top N words
+        top_words = dict(self.word_counts.most_common(self.top_n))
+        words = list(top_words.keys())
+        counts = list(top_words.values())
+        
+        # Same layout as last time: update bars in place, skip the layout solver
+        if self._last_top_n == self.top_n and len(self.bars) == len(words):
+            for bar, count in zip(self.bars, counts):
+                bar.set_height(count)
+            self.ax.set_xticks(range(len(words)))
+            self.ax.set_xticklabels(words)
+            self._style_xticklabels()
+            self.ax.set_ylim(0, max(counts) * 1.05)
+            self.bar_labels = words
+            self.canvas.draw_idle()
+            return
+            
         # Clear the figure
+        self._ensure_canvas()
         self.figure.clear()
         self.ax = self.figure.add_subplot(111)
         
-        # Get top N words
-        top_words = dict(self.word_counts.most_common(self.top_n))
-        
         # Create bar chart
-        bars = self.ax.bar(list(top_words.keys()), list(top_words.values()))
+        bars = self.ax.bar(words, counts)
         
         # Add labels and title
         self.ax.set_title(f"Top {self.top_n} Words")
@@ -332,15 +549,23 @@ class TopWordsWidget(QWidget):
         self.ax.set_ylabel("Frequency")
         
         # Rotate x-axis labels for better readability
-        plt.setp(self.ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
+        self.ax.tick_params(axis='x', labelrotation=45)
+        self._style_xticklabels()
         
         # Store bar positions for click detection
         self.bars = bars
-        self.bar_labels = list(top_words.keys())
+        self.bar_labels = words
         
         # Adjust layout
         self.figure.tight_layout()
         self.canvas.draw()
+        self._last_top_n = self.top_n
+        
+    def _style_xticklabels(self):
+        """Anchor rotated tick labels at their right edge"""
+        for label in self.ax.get_xticklabels():
+            label.set_horizontalalignment('right')
+            label.set_rotation_mode('anchor')
         
     def regenerate_chart(self):
         """Regenerate the chart with current settings"""
@@ -362,6 +587,11 @@ class TopWordsWidget(QWidget):
     def clear(self):
         """Clear the chart"""
         self.word_counts = Counter()
+        self._last_top_n = None
+        self.status_label.setText("No data loaded")
+        if self.canvas is None:
+            return
+            
         self.figure.clear()
         self.ax = self.figure.add_subplot(111)
         self.ax.set_title("Top Words")
@@ -371,4 +601,3 @@ class TopWordsWidget(QWidget):
                     transform=self.ax.transAxes,
                     fontsize=14)
         self.canvas.draw()
-        self.status_label.setText("No data loaded")
@@ -1,19 +1,130 @@
+"""
+Setup wizard for a new Conversation Compass session.
+
+Slots connected to QPushButton.clicked take an optional ``_checked`` argument:
+PyQt6 passes the checked state to slots that can accept it, and compiled
+(e.g. cythonized) methods reject the extra positional argument otherwise.
+"""
+
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
+    QDialog, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
     QComboBox, QLineEdit, QTextEdit, QStackedWidget, QFormLayout,
     QGroupBox, QRadioButton, QButtonGroup, QCheckBox, QListWidget,
     QListWidgetItem, QDialogButtonBox, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSettings
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QSettings, QObject, QRunnable, QThreadPool, QTimer
+)
+
+# Sample starting templates (this would normally load from a template service)
+_TEMPLATES = (
+    "Sales - Discovery Call",
+    "Sales - Product Demo",
+    "Interview - Technical",
+    "Interview - Behavioral",
+    "Support - Problem Resolution",
+    "Negotiation - Salary",
+    "General - Information Gathering"
+)
+
+# Default QListWidgetItem flags plus user-checkable, combined once
+_TEMPLATE_FLAGS = (
+    Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled |
+    Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsUserCheckable
+)
+
+# Mode button ids; "guided" is the name templates use for guidance mode
+_MODE_IDS = {"tracking": 0, "guidance": 1, "guided": 1, "preparation": 2, "analysis": 3}
+
+# Compass modes (mode, label, description) in display order
+_MODES = (
+    ("tracking", "Tracking Mode", "- Follows your actual conversation without pre-generating paths"),
+    ("guidance", "Guidance Mode", "- Pre-generates potential conversation paths and suggests responses"),
+    ("preparation", "Preparation Mode", "- Creates a complete conversation map before you start talking"),
+    ("analysis", "Analysis Mode", "- Works with existing transcripts to show what happened and alternatives")
+)
+
+# Initial tree states, indexed by their button id in the expand group
+_TREE_STATES = ('expand_all', 'expand_first_level', 'collapse_all')
+
+
+def _qdebounced(fn, ms=150, parent=None):
+    """Wrap fn so bursts of calls collapse into one call after ms of quiet.
+    
+    Returns (trigger, timer); the caller must keep the timer alive.
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(ms)
+    timer.timeout.connect(fn)
+    
+    def trigger(*args, **kwargs):
+        timer.start()
+    
+    return trigger, timer
+
+
+class _TemplateLoaderSignals(QObject):
+    """Signals for _TemplateLoader (QRunnable cannot define its own)"""
+    
+    loaded = pyqtSignal(list)  # template names
+
+
+class _TemplateLoader(QRunnable):
+    """Fetches template names from a template source on the thread pool"""
+    
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self.signals = _TemplateLoaderSignals()
+        
+    def run(self):
+        try:
+            names = list(self.source())
+        except Exception as e:
+            print(f"Error loading templates: {e}")
+            names = list(_TEMPLATES)
+        self.signals.loaded.emit(names)
+
 
 class ConversationCompassSetupDialog(QDialog):
     """Dialog for setting up a new Conversation Compass session"""
     
-    def __init__(self, parent=None, langchain_service=None):
+    # Emitted once typing in the goal, topics or additional context fields pauses;
+    # validators and previews connect here instead of to textChanged
+    context_edited = pyqtSignal()
+    
+    # (result key, widget attribute, getter) gathered by finish_setup
+    _FIELD_MAP = (
+        # Step 1: Conversation Type
+        ('conversation_type', 'type_combo', 'currentText'),
+        
+        # Step 2: Context
+        ('goal', 'goal_input', 'text'),
+        ('topics', 'topics_input', 'text'),
+        ('duration', 'duration_combo', 'currentText'),
+        ('additional_context', 'additional_context', 'toPlainText'),
+        
+        # Step 3: Mode - Explicitly include the mode selection
+        ('mode', 'mode_group', 'checkedId'),
+        
+        # Step 4: Visualization
+        ('detail_level', 'detail_combo', 'currentText'),
+        ('layout_type', 'layout_combo', 'currentText'),
+        ('focus_questions', 'focus_questions', 'isChecked'),
+        ('focus_objections', 'focus_objections', 'isChecked'),
+        ('focus_decisions', 'focus_decisions', 'isChecked'),
+    )
+    
+    def __init__(self, parent=None, langchain_service=None, template_source=None):
         super().__init__(parent)
         self.setWindowTitle("New Conversation Compass")
         self.setMinimumSize(600, 500)
         self.langchain_service = langchain_service
+        # Optional callable returning template names; runs off the UI thread
+        self.template_source = template_source
+        self._template_loader = None
+        self._debouncers = []  # keeps debounce timers alive
         self.setup_result = {}
         
         # Create layout
@@ -22,11 +133,19 @@ class ConversationCompassSetupDialog(QDialog):
         # Create step widget
         self.steps = QStackedWidget()
         
-        # Add steps
-        self.add_type_selection_step()
-        self.add_context_input_step()
-        self.add_mode_selection_step()
-        self.add_visualization_config_step()
+        # Add steps; each one is built the first time it is shown and
+        # holds an empty placeholder until then
+        self._step_builders = [
+            self.add_type_selection_step,
+            self.add_context_input_step,
+            self.add_mode_selection_step,
+            self.add_visualization_config_step
+        ]
+        self._n_steps = len(self._step_builders)
+        self._built = [False] * self._n_steps
+        for _ in self._step_builders:
+            self.steps.addWidget(QWidget())
+        self._ensure_step_built(0)
         
         # Navigation buttons
         nav_layout = QHBoxLayout()
@@ -54,7 +173,7 @@ class ConversationCompassSetupDialog(QDialog):
         self.update_navigation_buttons()
     
     def add_type_selection_step(self):
-        """Add conversation type selection step"""
+        """Build the conversation type selection step"""
         step_widget = QGroupBox("Conversation Type")
         layout = QVBoxLayout(step_widget)
         
@@ -84,10 +203,10 @@ class ConversationCompassSetupDialog(QDialog):
         self.type_combo.currentTextChanged.connect(self.on_type_changed)
         
         layout.addStretch()
-        self.steps.addWidget(step_widget)
+        return step_widget
     
     def add_context_input_step(self):
-        """Add context input step"""
+        """Build the context input step"""
         step_widget = QGroupBox("Conversation Context")
         layout = QVBoxLayout(step_widget)
         
@@ -119,11 +238,18 @@ class ConversationCompassSetupDialog(QDialog):
         self.additional_context.setMaximumHeight(150)
         layout.addWidget(self.additional_context)
         
+        # Signal context edits once typing pauses rather than on every keystroke
+        edited, timer = _qdebounced(self.context_edited.emit, 200, self)
+        self._debouncers.append(timer)
+        self.goal_input.textChanged.connect(edited)
+        self.topics_input.textChanged.connect(edited)
+        self.additional_context.textChanged.connect(edited)
+        
         layout.addStretch()
-        self.steps.addWidget(step_widget)
+        return step_widget
     
     def add_mode_selection_step(self):
-        """Add mode selection step"""
+        """Build the mode selection step"""
         step_widget = QGroupBox("Compass Mode")
         layout = QVBoxLayout(step_widget)
         
@@ -136,54 +262,30 @@ class ConversationCompassSetupDialog(QDialog):
         # Create a more prominent mode selection with descriptions
         mode_frame = QFrame()
         mode_frame.setFrameStyle(QFrame.Shape.StyledPanel)
-        mode_frame.setStyleSheet("QFrame { background-color: #f5f5f5; border-radius: 5px; }")
+        mode_frame.setStyleSheet(
+            "QFrame { background-color: #f5f5f5; border-radius: 5px; } "
+            "QRadioButton { font-weight: bold; }"
+        )
         mode_layout = QVBoxLayout(mode_frame)
         
-        # Tracking mode
-        tracking_layout = QHBoxLayout()
-        tracking_mode = QRadioButton("Tracking Mode")
-        tracking_mode.setStyleSheet("font-weight: bold;")
-        self.mode_group.addButton(tracking_mode, 0)
-        tracking_layout.addWidget(tracking_mode)
-        tracking_layout.addWidget(QLabel("- Follows your actual conversation without pre-generating paths"))
-        mode_layout.addLayout(tracking_layout)
-        
-        # Guidance mode
-        guidance_layout = QHBoxLayout()
-        guidance_mode = QRadioButton("Guidance Mode")
-        guidance_mode.setStyleSheet("font-weight: bold;")
-        self.mode_group.addButton(guidance_mode, 1)
-        guidance_layout.addWidget(guidance_mode)
-        guidance_layout.addWidget(QLabel("- Pre-generates potential conversation paths and suggests responses"))
-        mode_layout.addLayout(guidance_layout)
-        
-        # Preparation mode
-        preparation_layout = QHBoxLayout()
-        preparation_mode = QRadioButton("Preparation Mode")
-        preparation_mode.setStyleSheet("font-weight: bold;")
-        self.mode_group.addButton(preparation_mode, 2)
-        preparation_layout.addWidget(preparation_mode)
-        preparation_layout.addWidget(QLabel("- Creates a complete conversation map before you start talking"))
-        mode_layout.addLayout(preparation_layout)
-        
-        # Analysis mode
-        analysis_layout = QHBoxLayout()
-        analysis_mode = QRadioButton("Analysis Mode")
-        analysis_mode.setStyleSheet("font-weight: bold;")
-        self.mode_group.addButton(analysis_mode, 3)
-        analysis_layout.addWidget(analysis_mode)
-        analysis_layout.addWidget(QLabel("- Works with existing transcripts to show what happened and alternatives"))
-        mode_layout.addLayout(analysis_layout)
-        
-        # Set default
-        tracking_mode.setChecked(True)
+        for mode, name, description in _MODES:
+            row_layout = QHBoxLayout()
+            mode_radio = QRadioButton(name)
+            self.mode_group.addButton(mode_radio, _MODE_IDS[mode])
+            row_layout.addWidget(mode_radio)
+            row_layout.addWidget(QLabel(description))
+            mode_layout.addLayout(row_layout)
+            
+            # Tracking mode is the default
+            if mode == "tracking":
+                mode_radio.setChecked(True)
         
         layout.addWidget(mode_frame)
         layout.addStretch()
-        self.steps.addWidget(step_widget)
+        return step_widget
     
     def add_visualization_config_step(self):
-        """Add visualization configuration step"""
+        """Build the visualization configuration step"""
         step_widget = QGroupBox("Visualization Settings")
         layout = QVBoxLayout(step_widget)
         
@@ -227,10 +329,10 @@ class ConversationCompassSetupDialog(QDialog):
         self.expand_first_level_radio.setChecked(True)
         self.collapse_all_radio = QRadioButton("Collapse All")
         
-        expand_group = QButtonGroup(self)
-        expand_group.addButton(self.expand_all_radio)
-        expand_group.addButton(self.expand_first_level_radio)
-        expand_group.addButton(self.collapse_all_radio)
+        self._expand_group = QButtonGroup(self)
+        self._expand_group.addButton(self.expand_all_radio, 0)
+        self._expand_group.addButton(self.expand_first_level_radio, 1)
+        self._expand_group.addButton(self.collapse_all_radio, 2)
         
         layout.addWidget(self.expand_all_radio)
         layout.addWidget(self.expand_first_level_radio)
@@ -239,47 +341,66 @@ class ConversationCompassSetupDialog(QDialog):
         # Template selection
         layout.addWidget(QLabel("Starting Templates:"))
         self.templates_list = QListWidget()
-        self.load_templates()
         layout.addWidget(self.templates_list)
         
+        # Fill the list once the step is on screen
+        QTimer.singleShot(0, self._populate_templates)
+        
         layout.addStretch()
-        self.steps.addWidget(step_widget)
+        return step_widget
+    
+    def _populate_templates(self):
+        """Populate the templates list from the sample list or the template source"""
+        if self.template_source is None:
+            self.load_templates()
+            return
+            
+        self._template_loader = _TemplateLoader(self.template_source)
+        self._template_loader.signals.loaded.connect(self.load_templates)
+        QThreadPool.globalInstance().start(self._template_loader)
     
-    def load_templates(self):
+    def load_templates(self, templates=_TEMPLATES):
         """Load available templates for conversation compass"""
-        # This would normally load from a template service
-        # For now, we'll add some sample templates
-        templates = [
-            "Sales - Discovery Call",
-            "Sales - Product Demo",
-            "Interview - Technical",
-            "Interview - Behavioral",
-            "Support - Problem Resolution",
-            "Negotiation - Salary",
-            "General - Information Gathering"
-        ]
-        
+        unchecked = Qt.CheckState.Unchecked
+        add_item = self.templates_list.addItem
         for template in templates:
             item = QListWidgetItem(template)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            self.templates_list.addItem(item)
+            item.setFlags(_TEMPLATE_FLAGS)
+            item.setCheckState(unchecked)
+            add_item(item)
+    
+    def _ensure_step_built(self, index):
+        """Replace the placeholder for a step with its real widget if not built yet"""
+        if self._built[index]:
+            return
+            
+        step_widget = self._step_builders[index]()
+        placeholder = self.steps.widget(index)
+        
+        # Removing and inserting pages moves the current index, so restore it
+        current = self.steps.currentIndex()
+        self.steps.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.steps.insertWidget(index, step_widget)
+        self.steps.setCurrentIndex(current)
+        self._built[index] = True
     
     def on_type_changed(self, text):
         """Handle conversation type change"""
         self.custom_type_input.setVisible(text == "Custom")
     
-    def go_previous_step(self):
+    def go_previous_step(self, _checked=False):
         """Go to previous step"""
         if self.current_step > 0:
             self.current_step -= 1
             self.steps.setCurrentIndex(self.current_step)
             self.update_navigation_buttons()
     
-    def go_next_step(self):
+    def go_next_step(self, _checked=False):
         """Go to next step"""
-        if self.current_step < self.steps.count() - 1:
+        if self.current_step < self._n_steps - 1:
             self.current_step += 1
+            self._ensure_step_built(self.current_step)
             self.steps.setCurrentIndex(self.current_step)
             self.update_navigation_buttons()
     
@@ -287,41 +408,34 @@ class ConversationCompassSetupDialog(QDialog):
         """Update navigation button states"""
         self.back_btn.setEnabled(self.current_step > 0)
         
-        is_last_step = self.current_step == self.steps.count() - 1
+        is_last_step = self.current_step == self._n_steps - 1
         self.next_btn.setVisible(not is_last_step)
         self.finish_btn.setVisible(is_last_step)
     
-    def finish_setup(self):
+    def finish_setup(self, _checked=False):
         """Complete setup and return results"""
-        # Gather all settings
-        self.setup_result = {
-            # Step 1: Conversation Type
-            'conversation_type': self.type_combo.currentText(),
-            'custom_type': self.custom_type_input.text() if self.type_combo.currentText() == "Custom" else "",
-            
-            # Step 2: Context
-            'goal': self.goal_input.text(),
-            'topics': self.topics_input.text(),
-            'duration': self.duration_combo.currentText(),
-            'additional_context': self.additional_context.toPlainText(),
-            
-            # Step 3: Mode - Explicitly include the mode selection
-            'mode': self.mode_group.checkedId(),
+        # Steps never shown still supply their default widget values
+        for index in range(self._n_steps):
+            self._ensure_step_built(index)
             
-            # Step 4: Visualization
-            'detail_level': self.detail_combo.currentText(),
-            'layout_type': self.layout_combo.currentText(),
-            'focus_questions': self.focus_questions.isChecked(),
-            'focus_objections': self.focus_objections.isChecked(),
-            'focus_decisions': self.focus_decisions.isChecked(),
-            'initial_tree_state': 'expand_all' if self.expand_all_radio.isChecked() else 
-                                ('expand_first_level' if self.expand_first_level_radio.isChecked() else 'collapse_all'),
-            'templates': [
-                self.templates_list.item(i).text() 
-                for i in range(self.templates_list.count()) 
-                if self.templates_list.item(i).checkState() == Qt.CheckState.Checked
-            ]
+        # Gather all settings
+        result = {
+            key: getattr(getattr(self, widget), getter)()
+            for key, widget, getter in self._FIELD_MAP
         }
+        result['custom_type'] = (
+            self.custom_type_input.text() if result['conversation_type'] == "Custom" else ""
+        )
+        result['initial_tree_state'] = _TREE_STATES[self._expand_group.checkedId()]
+        
+        templates_list = self.templates_list
+        checked = Qt.CheckState.Checked
+        result['templates'] = [
+            item.text()
+            for i in range(templates_list.count())
+            if (item := templates_list.item(i)).checkState() == checked
+        ]
+        self.setup_result = result
         
         # Add template information if a template is selected
         selected_templates = self.setup_result['templates']
@@ -340,9 +454,9 @@ class ConversationCompassSetupDialog(QDialog):
                     if "conversation_mode" in template:
                         print(f"Using template conversation mode: {template['conversation_mode']}")
                         # Map string mode to numeric mode ID
-                        mode_mapping = {"tracking": 0, "guided": 1}
-                        if template['conversation_mode'] in mode_mapping:
-                            self.setup_result['mode'] = mode_mapping[template['conversation_mode']]
+                        mode_id = _MODE_IDS.get(template['conversation_mode'])
+                        if mode_id is not None:
+                            self.setup_result['mode'] = mode_id
         
         self.accept()
     
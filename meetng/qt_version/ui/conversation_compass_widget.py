@@ -32,13 +32,73 @@ from PyQt6.QtWidgets import (
     QSplitter, QFrame, QToolButton, QMenu, QScrollArea,
     QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsTextItem,
     QGraphicsPathItem, QGraphicsItem, QDialog, QFormLayout, QLineEdit,
-    QTextEdit, QDialogButtonBox, QComboBox, QGraphicsRectItem
+    QTextEdit, QDialogButtonBox, QComboBox, QGraphicsRectItem, QStyleOptionGraphicsItem,
+    QApplication, QToolTip, QMessageBox, QFileDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF, QSizeF, QEasingCurve, QPropertyAnimation
-from PyQt6.QtGui import QPainterPath, QPen, QBrush, QColor, QFont, QPainter
+from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF, QSizeF, QEasingCurve, QTimeLine, QTimer
+from PyQt6.QtGui import QPainterPath, QPen, QBrush, QColor, QFont, QPainter, QPixmap, QStaticText, QCursor
 from PyQt6.QtWidgets import QGraphicsOpacityEffect
+
+# Optional GPU-backed viewport for the tree view
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+    OPENGL_AVAILABLE = True
+except ImportError:
+    OPENGL_AVAILABLE = False
 from math import cos, sin, pi
+from collections import deque
 import random
+import re
+import sys
+import logging
+import numpy as np
+
+from .layout_core import compute_positions, NUMBA_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+# Comma separator for participant names, absorbing surrounding whitespace
+_PARTICIPANT_SEP = re.compile(r'\s*,\s*')
+
+# Spoken number triggers such as "option 1", "number 2", "choice 3" or a
+# bare "1", matched in a single pass
+_NUMBER_TRIGGER = re.compile(r'(?P<kind>option|number|choice)\s+(?P<num>\d+)|\b(?P<bare>\d+)\b', re.IGNORECASE)
+_NUMBER_TRIGGER_PRIORITY = ("option", "number", "choice", None)
+
+# Every number trigger contains a digit, so text without one can skip the regex
+_DIGITS = frozenset('0123456789')
+
+# Spoken keywords that navigate to nodes of each type, checked in order.
+# Keywords are lowercase and may be multi-word phrases
+_KEYWORD_TRIGGERS = (
+    ("question", ("question", "ask", "inquiry", "wondering")),
+    ("decision", ("decide", "decision", "choose", "select", "option")),
+    ("objection", ("object", "concern", "issue", "problem", "disagree")),
+    ("statement", ("statement", "point", "mention", "note")),
+)
+
+
+def _compile_keyword_triggers(triggers):
+    """Build the matcher for a keyword trigger table
+    
+    Args:
+        triggers: (node_type, keywords) pairs in priority order
+        
+    Returns:
+        (ranks, pattern) where ranks maps each keyword to (priority, node_type)
+        and pattern.findall(lowercased_text) returns every keyword occurrence
+        in one scan. The lookahead keeps overlapping occurrences and longer
+        keywords are tried first, so a phrase wins over a word it starts with.
+    """
+    keywords = [(node_type, word) for node_type, words in triggers for word in words]
+    ranks = {word: (rank, node_type) for rank, (node_type, word) in enumerate(keywords)}
+    alternation = '|'.join(sorted(map(re.escape, ranks), key=len, reverse=True))
+    return ranks, re.compile('(?=(' + alternation + '))')
+
+_KEYWORD_RANKS, _KEYWORD_PATTERN = _compile_keyword_triggers(_KEYWORD_TRIGGERS)
+
+# Option references such as "Option 2" or "#2" in node content
+_OPTION_REF = re.compile(r'(?:Option |#)([0-9]+)')
 
 class ConversationCompassSetupDialog(QDialog):
     """Dialog for setting up a new conversation compass session"""
@@ -97,7 +157,7 @@ class ConversationCompassSetupDialog(QDialog):
     def get_setup_result(self):
         """Get the setup result as a dictionary"""
         # Parse participants (comma-separated)
-        participants = [p.strip() for p in self.participants_edit.text().split(",") if p.strip()]
+        participants = [p for p in _PARTICIPANT_SEP.split(self.participants_edit.text().strip()) if p]
         
         return {
             "conversation_type": self.type_combo.currentText(),
@@ -106,6 +166,116 @@ class ConversationCompassSetupDialog(QDialog):
             "participants": participants
         }
 
+class _QuadTree:
+    """Barnes-Hut quadtree over node positions for approximate repulsion
+    
+    Each cell tracks how many nodes it holds and their center of mass, so a
+    distant cell can act on a node as a single body.
+    """
+    
+    __slots__ = ('x', 'y', 'size', 'mass', 'com_x', 'com_y', 'children', 'bodies')
+    
+    MIN_SIZE = 1e-3  # Cells this small stop splitting (coincident nodes share a leaf)
+    
+    def __init__(self, x, y, size):
+        self.x = x          # Top-left corner
+        self.y = y
+        self.size = size    # Side length
+        self.mass = 0
+        self.com_x = 0.0
+        self.com_y = 0.0
+        self.children = None
+        self.bodies = []    # (index, x, y) while this cell is a leaf
+        
+    @classmethod
+    def build(cls, points):
+        """Build a quadtree containing every (x, y) in points"""
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        min_x, min_y = min(xs), min(ys)
+        size = max(max(xs) - min_x, max(ys) - min_y) + 1
+        
+        root = cls(min_x, min_y, size)
+        for index, (x, y) in enumerate(points):
+            root.insert(index, x, y)
+        return root
+        
+    def insert(self, index, x, y):
+        """Insert a body and update this cell's center of mass"""
+        self.com_x = (self.com_x * self.mass + x) / (self.mass + 1)
+        self.com_y = (self.com_y * self.mass + y) / (self.mass + 1)
+        self.mass += 1
+        
+        if self.children is None:
+            if not self.bodies or self.size <= self.MIN_SIZE:
+                self.bodies.append((index, x, y))
+                return
+                
+            # Split the leaf and push its body down a level
+            self.children = [None, None, None, None]
+            bodies, self.bodies = self.bodies, []
+            for body in bodies:
+                self._insert_child(*body)
+                
+        self._insert_child(index, x, y)
+        
+    def _insert_child(self, index, x, y):
+        half = self.size / 2
+        right = x >= self.x + half
+        bottom = y >= self.y + half
+        quadrant = right + 2 * bottom
+        
+        child = self.children[quadrant]
+        if child is None:
+            child = _QuadTree(self.x + half * right, self.y + half * bottom, half)
+            self.children[quadrant] = child
+        child.insert(index, x, y)
+        
+    def apply_force(self, index, x, y, theta, repulsion):
+        """Approximate the total repulsion on body index at (x, y)
+        
+        Returns:
+            (fx, fy) force vector
+        """
+        fx = fy = 0.0
+        theta_sq = theta * theta
+        stack = [self]
+        
+        while stack:
+            cell = stack.pop()
+            
+            if cell.children is None:
+                # Leaf: exact interaction with each body
+                for other, bx, by in cell.bodies:
+                    if other == index:
+                        continue
+                    dx = x - bx
+                    dy = y - by
+                    distance_sq = dx*dx + dy*dy
+                    if distance_sq < 1:  # Avoid division by zero
+                        dx = random.uniform(-1, 1)
+                        dy = random.uniform(-1, 1)
+                        distance_sq = dx*dx + dy*dy
+                    force = repulsion / (distance_sq * distance_sq ** 0.5)
+                    fx += force * dx
+                    fy += force * dy
+                continue
+                
+            dx = x - cell.com_x
+            dy = y - cell.com_y
+            distance_sq = dx*dx + dy*dy
+            
+            if distance_sq > 0 and cell.size * cell.size < theta_sq * distance_sq:
+                # Far enough away: treat the whole cell as one body
+                force = repulsion * cell.mass / (distance_sq * distance_sq ** 0.5)
+                fx += force * dx
+                fy += force * dy
+            else:
+                stack.extend(child for child in cell.children if child is not None)
+                
+        return fx, fy
+
+
 class TreeLayoutManager:
     """Manages different layout strategies for conversation trees"""
     
@@ -116,6 +286,16 @@ class TreeLayoutManager:
         self.min_node_distance = 80  # Minimum distance between any two nodes
         self.layout_strategy = "hierarchical"  # Default layout strategy
         
+        # Barnes-Hut approximation for repulsion on large trees; smaller trees
+        # use the exact vectorized all-pairs computation
+        self.barnes_hut_optimize = True
+        self.barnes_hut_theta = 0.5
+        self.barnes_hut_min_nodes = 500
+        
+        # Trees at least this large use the compiled array layout kernel
+        # for the hierarchical layout when Numba is installed
+        self.compiled_layout_min_nodes = 1000
+        
     def layout_tree(self, root_id=None):
         """Layout the entire tree using the current strategy"""
         if not root_id:
@@ -126,15 +306,20 @@ class TreeLayoutManager:
                 return
             root_id = root_nodes[0]
             
-        # Reset all node positions for a fresh layout
-        self._reset_node_positions()
+        # Snapshot node geometry once and lay out into plain float positions,
+        # starting every node from (0, 0) for a fresh layout
+        geometry = self._snapshot_geometry()
+        positions = dict.fromkeys(geometry, (0.0, 0.0))
         
         # Apply the selected layout strategy
         if self.layout_strategy == "radial":
-            self._apply_radial_layout(root_id)
+            self._apply_radial_layout(root_id, geometry, positions)
         else:
             # Default hierarchical layout
-            self._apply_hierarchical_layout(root_id)
+            self._apply_hierarchical_layout(root_id, geometry, positions)
+        
+        # Push the final positions to the nodes in one pass
+        self._apply_positions(positions.items())
         
         # Update all edges
         self.tree_view._update_all_edges()
@@ -142,29 +327,53 @@ class TreeLayoutManager:
         # Update scene rect to fit all nodes
         self.tree_view.scene.setSceneRect(self.tree_view.scene.itemsBoundingRect().adjusted(-50, -50, 50, 50))
     
-    def _apply_hierarchical_layout(self, root_id):
+    def _snapshot_geometry(self):
+        """Read every node's position and size once as plain floats
+        
+        Returns:
+            Dictionary mapping node_id to (x, y, width, height)
+        """
+        geometry = {}
+        for node_id, node in self.tree_view.nodes.items():
+            pos = node.pos()
+            rect = node.rect()
+            geometry[node_id] = (pos.x(), pos.y(), rect.width(), rect.height())
+        return geometry
+        
+    def _apply_positions(self, positions):
+        """Move nodes to their computed positions
+        
+        Args:
+            positions: Iterable of (node_id, (x, y)) pairs
+        """
+        nodes = self.tree_view.nodes
+        for node_id, (x, y) in positions:
+            nodes[node_id].setPos(x, y)
+    
+    def _apply_hierarchical_layout(self, root_id, geometry, positions):
         """Apply the traditional hierarchical layout"""
         # Position the root node at the center top
-        root_node = self.tree_view.nodes.get(root_id)
-        if not root_node:
+        if root_id not in geometry:
             return
             
         scene_rect = self.tree_view.scene.sceneRect()
-        root_node.setPos((scene_rect.width() - root_node.rect().width()) / 2, 20)
+        positions[root_id] = ((scene_rect.width() - geometry[root_id][2]) / 2, 20)
+        
+        if NUMBA_AVAILABLE and len(geometry) >= self.compiled_layout_min_nodes:
+            self._position_subtree_compiled(root_id, geometry, positions)
+            return
         
         # Calculate subtree sizes first (bottom-up pass)
-        subtree_sizes = self._calculate_subtree_sizes(root_id)
+        subtree_sizes = {}
+        self._calculate_subtree_sizes(root_id, subtree_sizes, geometry)
         
         # Position all nodes (top-down pass)
-        self._position_subtree(root_id, 0, subtree_sizes)
+        self._position_subtree(root_id, subtree_sizes, geometry, positions)
     
-    def _apply_radial_layout(self, root_id):
+    def _apply_radial_layout(self, root_id, geometry, positions):
         """Apply a radial layout with root at center and children in concentric circles"""
-        from math import cos, sin, pi
-        
         # Get the root node
-        root_node = self.tree_view.nodes.get(root_id)
-        if not root_node:
+        if root_id not in geometry:
             return
             
         # Get scene dimensions
@@ -173,117 +382,131 @@ class TreeLayoutManager:
         center_y = scene_rect.height() / 2
         
         # Position root node at center
-        root_node.setPos(
-            center_x - root_node.rect().width() / 2,
-            center_y - root_node.rect().height() / 2
-        )
+        _, _, root_width, root_height = geometry[root_id]
+        positions[root_id] = (center_x - root_width / 2, center_y - root_height / 2)
         
         # Calculate the maximum depth of the tree
         max_depth = self._calculate_max_depth(root_id)
         
         # Position all other nodes in concentric circles
-        self._position_nodes_radial(root_id, center_x, center_y, 0, max_depth)
+        self._position_nodes_radial(root_id, center_x, center_y, max_depth, geometry, positions)
+    
+    def _calculate_max_depth(self, node_id):
+        """Calculate the maximum depth of the tree from the given node
         
-    def _reset_node_positions(self):
-        """Reset all node positions"""
-        for node in self.tree_view.nodes.values():
-            # Don't actually move them yet, just reset internal positions
-            node.setPos(0, 0)
+        Walks the subtree post-order with an explicit stack, memoizing the
+        height of each node so shared subtrees are only measured once.
+        """
+        nodes = self.tree_view.nodes
+        depths = {}
+        stack = [(node_id, False)]
+        while stack:
+            current_id, children_done = stack.pop()
+            if current_id in depths:
+                continue
+            node = nodes.get(current_id)
+            if not node or not node.children:
+                depths[current_id] = 0
+            elif children_done:
+                depths[current_id] = 1 + max(depths[child_id] for child_id in node.children)
+            else:
+                stack.append((current_id, True))
+                stack.extend((child_id, False) for child_id in node.children
+                             if child_id not in depths)
+        return depths[node_id]
     
-    def _calculate_max_depth(self, node_id, current_depth=0):
-        """Calculate the maximum depth of the tree from the given node"""
-        node = self.tree_view.nodes.get(node_id)
-        if not node or not node.children:
-            return current_depth
-            
-        child_depths = [self._calculate_max_depth(child_id, current_depth + 1) 
-                        for child_id in node.children]
-        return max(child_depths) if child_depths else current_depth
+    def _walk_breadth_first(self, root_id):
+        """Walk the tree breadth-first from root_id
+        
+        Returns:
+            List of (node_id, depth, sibling_rank, sibling_count) tuples in BFS
+            order, where sibling_rank is the node's index in its parent's
+            children and sibling_count is the length of that list
+        """
+        nodes = self.tree_view.nodes
+        if root_id not in nodes:
+            return []
+            
+        walk = [(root_id, 0, 0, 1)]
+        queue = deque(walk)
+        while queue:
+            node_id, depth, _, _ = queue.popleft()
+            children = nodes[node_id].children
+            sibling_count = len(children)
+            for rank, child_id in enumerate(children):
+                if child_id in nodes:
+                    entry = (child_id, depth + 1, rank, sibling_count)
+                    walk.append(entry)
+                    queue.append(entry)
+        return walk
     
-    def _position_nodes_radial(self, node_id, center_x, center_y, depth, max_depth):
+    def _position_nodes_radial(self, root_id, center_x, center_y, max_depth, geometry, positions):
         """Position nodes in a radial layout with improved alignment
         
         Args:
-            node_id: ID of the current node
+            root_id: ID of the root node (already positioned at center)
             center_x, center_y: Center coordinates of the layout
-            depth: Current depth level (0 for root)
             max_depth: Maximum depth of the tree
+            geometry: Node geometry snapshot from _snapshot_geometry
+            positions: Dictionary of node positions to fill in
         """
-        from math import cos, sin, pi
-        
-        node = self.tree_view.nodes.get(node_id)
-        if not node:
-            return
-            
         # Skip root node (already positioned at center)
-        if depth > 0:
-            # Calculate radius for this level (increases with depth)
-            # Use a non-linear scale to give more space to outer rings
-            radius = 150 * (depth / max_depth) ** 0.8 if max_depth > 0 else 150
-            
-            # Get number of children for the parent
-            parent = self.tree_view.nodes.get(node.parent_id)
-            if not parent:
-                return
-                
-            # Find position of this node among siblings
-            siblings = parent.children
-            position = siblings.index(node_id) if node_id in siblings else 0
-            total_siblings = len(siblings)
-            
-            # Calculate angle based on position among siblings
-            # Distribute nodes evenly around the circle
-            angle_start = 0  # Start angle in radians
-            angle_step = 2 * pi / total_siblings if total_siblings > 0 else 0
-            
-            # Ensure even distribution by using fixed angles
-            # This creates a more balanced layout
-            angle = angle_start + position * angle_step
-            
-            # Calculate position using polar coordinates
-            x = center_x + radius * cos(angle)
-            y = center_y + radius * sin(angle)
+        walk = self._walk_breadth_first(root_id)[1:]
+        if not walk:
+            return
             
-            # Adjust for node size
-            x -= node.rect().width() / 2
-            y -= node.rect().height() / 2
+        node_ids, depth, rank, sibling_count = zip(*walk)
+        depth = np.array(depth, dtype=np.intp)
+        rank, sibling_count = (np.array(column, dtype=np.float64) for column in (rank, sibling_count))
+        
+        # Calculate radius once per level (increases with depth)
+        # Use a non-linear scale to give more space to outer rings
+        if max_depth > 0:
+            level_radius = 150 * (np.arange(max_depth + 1) / max_depth) ** 0.8
+        else:
+            level_radius = np.full(1, 150.0)
+        radius = level_radius[depth]
             
-            # Set node position
-            node.setPos(x, y)
+        # Distribute siblings evenly around the circle using fixed angles
+        angle = rank * (2 * np.pi / sibling_count)
         
-        # Recursively position children
-        for child_id in node.children:
-            self._position_nodes_radial(child_id, center_x, center_y, depth + 1, max_depth)
+        # Calculate positions using polar coordinates, adjusted for node size
+        sizes = np.array([geometry[node_id][2:] for node_id in node_ids], dtype=np.float64)
+        xs = center_x + radius * np.cos(angle) - sizes[:, 0] / 2
+        ys = center_y + radius * np.sin(angle) - sizes[:, 1] / 2
+        
+        positions.update(zip(node_ids, zip(xs.tolist(), ys.tolist())))
             
-    def _calculate_subtree_sizes(self, node_id):
+    def _calculate_subtree_sizes(self, node_id, out, geometry):
         """Calculate the size requirements of each subtree
         
-        Returns a dictionary mapping node_id to (width, height, num_leaves)
+        Fills out with a mapping of node_id to (width, height, num_leaves)
+        for this node and all its descendants.
+        
+        Returns:
+            This node's (width, height, num_leaves), or None if it doesn't exist
         """
         node = self.tree_view.nodes.get(node_id)
         if not node:
-            return {}
+            return None
             
-        result = {}
+        _, _, node_width, node_height = geometry[node_id]
         
         if not node.children:
             # Leaf node
-            result[node_id] = (node.rect().width(), node.rect().height(), 1)
-            return result
+            out[node_id] = (node_width, node_height, 1)
+            return out[node_id]
             
         # Calculate sizes for all children first
-        child_sizes = {}
         total_width = 0
         max_height = 0
         total_leaves = 0
         
         for child_id in node.children:
             # Recursively calculate child subtree sizes
-            subtree_sizes = self._calculate_subtree_sizes(child_id)
-            child_sizes.update(subtree_sizes)
-            
-            if child_id in subtree_sizes:
-                child_width, child_height, child_leaves = subtree_sizes[child_id]
+            child_size = self._calculate_subtree_sizes(child_id, out, geometry)
+            if child_size:
+                child_width, child_height, child_leaves = child_size
                 total_width += child_width
                 max_height = max(max_height, child_height)
                 total_leaves += child_leaves
@@ -293,53 +516,79 @@ class TreeLayoutManager:
             total_width += self.node_spacing_x * (len(node.children) - 1)
             
         # Calculate this node's subtree size
-        width = max(node.rect().width(), total_width)
-        height = node.rect().height() + self.level_spacing_y + max_height
+        width = max(node_width, total_width)
+        height = node_height + self.level_spacing_y + max_height
         
-        result[node_id] = (width, height, total_leaves)
-        result.update(child_sizes)
+        out[node_id] = (width, height, total_leaves)
+        return out[node_id]
         
-        return result
+    def _position_subtree(self, root_id, subtree_sizes, geometry, positions):
+        """Position all descendants of a node, level by level
         
-    def _position_subtree(self, node_id, level, subtree_sizes, x_offset=0):
-        """Position a node and all its children recursively
+        Each child is centered within the horizontal slot reserved for its
+        subtree, with slots laid out left to right under the parent's slot.
         
         Args:
-            node_id: ID of the node to position
-            level: Current tree level (0 for root)
+            root_id: ID of the subtree root (already positioned)
             subtree_sizes: Dictionary of subtree size requirements
-            x_offset: Horizontal offset for this subtree
-        
-        Returns:
-            The total width used by this subtree
+            geometry: Node geometry snapshot from _snapshot_geometry
+            positions: Dictionary of node positions to fill in
         """
-        node = self.tree_view.nodes.get(node_id)
-        if not node:
-            return 0
-            
-        # Position this node
-        y_pos = level * self.level_spacing_y
+        nodes = self.tree_view.nodes
+        queue = deque([(root_id, 0, 0)])  # (node_id, level, x_offset)
         
-        if level == 0:
+        while queue:
+            node_id, level, x_offset = queue.popleft()
+            node = nodes.get(node_id)
+            if not node:
+                continue
+                
             # Root node is already positioned
-            node_width = node.rect().width()
-        else:
-            # Position based on parent and siblings
-            node_width = node.rect().width()
-            node.setPos(x_offset + (subtree_sizes[node_id][0] - node_width) / 2, y_pos)
-            
-        if not node.children:
-            return subtree_sizes[node_id][0] if node_id in subtree_sizes else node_width
-            
-        # Position all children
-        current_x = x_offset
-        for child_id in node.children:
-            if child_id in subtree_sizes:
-                child_width = subtree_sizes[child_id][0]
-                self._position_subtree(child_id, level + 1, subtree_sizes, current_x)
-                current_x += child_width + self.node_spacing_x
+            if level > 0:
+                node_width = geometry[node_id][2]
+                positions[node_id] = (x_offset + (subtree_sizes[node_id][0] - node_width) / 2,
+                                      level * self.level_spacing_y)
                 
-        return subtree_sizes[node_id][0] if node_id in subtree_sizes else node_width
+            # Queue all children in their slots
+            current_x = x_offset
+            for child_id in node.children:
+                if child_id in subtree_sizes:
+                    queue.append((child_id, level + 1, current_x))
+                    current_x += subtree_sizes[child_id][0] + self.node_spacing_x
+        
+    def _position_subtree_compiled(self, root_id, geometry, positions):
+        """Position all descendants of a node with the compiled layout kernel
+        
+        Same layout as _calculate_subtree_sizes + _position_subtree, computed
+        on arrays indexed in breadth-first order.
+        """
+        nodes = self.tree_view.nodes
+        node_ids = [entry[0] for entry in self._walk_breadth_first(root_id)]
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        
+        # Children as linked lists over the breadth-first indices
+        first_child = np.full(len(node_ids), -1, dtype=np.int64)
+        next_sibling = np.full(len(node_ids), -1, dtype=np.int64)
+        for i, node_id in enumerate(node_ids):
+            prev = -1
+            for child_id in nodes[node_id].children:
+                child = index.get(child_id, -1)
+                if child <= i:
+                    continue
+                if prev == -1:
+                    first_child[i] = child
+                else:
+                    next_sibling[prev] = child
+                prev = child
+                
+        # Spacing counts every listed child, like _calculate_subtree_sizes
+        child_counts = np.array([len(nodes[node_id].children) for node_id in node_ids], dtype=np.int64)
+        widths = np.array([geometry[node_id][2] for node_id in node_ids], dtype=np.float64)
+        xs, ys = compute_positions(first_child, next_sibling, child_counts, widths,
+                                   float(self.level_spacing_y), float(self.node_spacing_x))
+        
+        # Root node is already positioned
+        positions.update(zip(node_ids[1:], zip(xs[1:].tolist(), ys[1:].tolist())))
         
     def apply_force_directed_adjustments(self, iterations=10):
         """Apply force-directed layout adjustments to prevent node overlap"""
@@ -351,97 +600,147 @@ class TreeLayoutManager:
         attraction = 0.1  # Attraction force to ideal positions
         damping = 0.9     # Damping factor to prevent oscillation
         
-        # Store original positions
-        original_positions = {node_id: node.pos() for node_id, node in self.tree_view.nodes.items()}
-        
-        # Create a working copy of current positions
-        positions = {node_id: QPointF(node.pos()) for node_id, node in self.tree_view.nodes.items()}
+        # Working positions as an (N, 2) array; original positions are kept
+        # to pull nodes back towards them and to pin each node to its level
+        geometry = self._snapshot_geometry()
+        node_ids = list(geometry)
+        positions = np.array([geometry[node_id][:2] for node_id in node_ids], dtype=np.float64)
+        original_positions = positions.copy()
+        use_barnes_hut = self.barnes_hut_optimize and len(node_ids) >= self.barnes_hut_min_nodes
         
         # Calculate forces and update positions
         for _ in range(iterations):
-            # Calculate repulsion forces between all pairs of nodes
-            forces = {node_id: QPointF(0, 0) for node_id in self.tree_view.nodes}
-            
-            # Repulsion between nodes
-            node_ids = list(self.tree_view.nodes.keys())
-            for i, node_id1 in enumerate(node_ids):
-                node1 = self.tree_view.nodes[node_id1]
-                pos1 = positions[node_id1]
-                
-                for node_id2 in node_ids[i+1:]:
-                    node2 = self.tree_view.nodes[node_id2]
-                    pos2 = positions[node_id2]
-                    
-                    # Calculate distance and direction
-                    dx = pos1.x() - pos2.x()
-                    dy = pos1.y() - pos2.y()
-                    distance_sq = dx*dx + dy*dy
-                    
-                    if distance_sq < 1:  # Avoid division by zero
-                        dx = random.uniform(-1, 1)
-                        dy = random.uniform(-1, 1)
-                        distance_sq = dx*dx + dy*dy
-                        
-                    # Calculate repulsion force (inverse square law)
-                    force = repulsion / distance_sq
-                    
-                    # Apply force in the direction of the vector between nodes
-                    distance = (distance_sq) ** 0.5
-                    fx = force * dx / distance
-                    fy = force * dy / distance
-                    
-                    # Add to total forces
-                    forces[node_id1] += QPointF(fx, fy)
-                    forces[node_id2] += QPointF(-fx, -fy)
+            if use_barnes_hut:
+                forces = self._barnes_hut_repulsion(positions, repulsion)
+            else:
+                forces = self._pairwise_repulsion(positions, repulsion)
             
             # Attraction to original positions (maintain hierarchy)
-            for node_id, pos in positions.items():
-                orig_pos = original_positions[node_id]
-                dx = orig_pos.x() - pos.x()
-                dy = orig_pos.y() - pos.y()
-                
-                forces[node_id] += QPointF(dx * attraction, dy * attraction)
-                
-            # Update positions based on forces
-            for node_id, force in forces.items():
-                # Apply damping to the force
-                force *= damping
-                
-                # Update position
-                positions[node_id] += force
-                
-                # Ensure y-position maintains hierarchy (nodes stay at their level)
-                positions[node_id].setY(original_positions[node_id].y())
+            forces += (original_positions - positions) * attraction
+            
+            # Update positions with damped forces
+            positions += forces * damping
+            
+            # Ensure y-position maintains hierarchy (nodes stay at their level)
+            positions[:, 1] = original_positions[:, 1]
                 
         # Apply the final positions to the actual nodes
-        for node_id, pos in positions.items():
-            self.tree_view.nodes[node_id].setPos(pos)
+        self._apply_positions(zip(node_ids, positions.tolist()))
             
         # Update all edges
         self.tree_view._update_all_edges()
+        
+    def _pairwise_repulsion(self, positions, repulsion):
+        """Exact repulsion on every node from every other node, O(N^2)"""
+        # Pairwise vectors between all nodes: delta[i, j] = pos[i] - pos[j]
+        delta = positions[:, None, :] - positions[None, :, :]
+        distance_sq = np.einsum('ijk,ijk->ij', delta, delta)
+        
+        # Nudge coincident pairs apart in a random direction (equal and opposite)
+        too_close = (distance_sq < 1) & ~np.eye(len(positions), dtype=bool)
+        if too_close.any():
+            jitter = np.random.uniform(-1, 1, delta.shape)
+            jitter = (jitter - jitter.transpose(1, 0, 2)) / 2
+            delta = np.where(too_close[..., None], jitter, delta)
+            distance_sq = np.einsum('ijk,ijk->ij', delta, delta)
+            
+        # Repulsion force (inverse square law) along the vector between nodes
+        np.fill_diagonal(distance_sq, np.inf)
+        scale = repulsion / (distance_sq * np.sqrt(distance_sq))
+        return (delta * scale[..., None]).sum(axis=1)
+        
+    def _barnes_hut_repulsion(self, positions, repulsion):
+        """Approximate repulsion using a Barnes-Hut quadtree, O(N log N)"""
+        points = positions.tolist()
+        tree = _QuadTree.build(points)
+        theta = self.barnes_hut_theta
+        return np.array([
+            tree.apply_force(index, x, y, theta, repulsion)
+            for index, (x, y) in enumerate(points)
+        ], dtype=np.float64)
+
+_BLACK_PEN = QPen(Qt.GlobalColor.black, 1)
+_DEFAULT_BRUSH = QBrush(QColor(240, 240, 240))  # Default light gray
 
-class ConversationNode(QGraphicsRectItem):
-    """A node in the conversation tree"""
+class ConversationNode(QGraphicsItem):
+    """A node in the conversation tree
+    
+    The background, text and navigation indicator are all drawn by a single
+    paint() call instead of separate child items.
+    """
+    
+    # Shared fill brushes per node type
+    _BRUSHES = {
+        "statement": QBrush(QColor(200, 230, 255)),  # Light blue
+        "question": QBrush(QColor(255, 230, 200)),   # Light orange
+        "objection": QBrush(QColor(255, 200, 200)),  # Light red
+        "decision": QBrush(QColor(200, 255, 200)),   # Light green
+        "current": QBrush(QColor(255, 255, 150)),    # Light yellow
+        "suggested": QBrush(QColor(230, 255, 230)),  # Pale green
+        "actual": QBrush(QColor(220, 240, 255))      # Pale blue
+    }
+    
+    # Navigation indicator styling
+    _INDICATOR_SIZE = 24
+    _INDICATOR_BRUSH = QBrush(QColor(0, 120, 215))
+    _INDICATOR_PEN = QPen(QColor(255, 255, 255))
+    _indicator_font = None  # Created on first use, fonts need a QGuiApplication
+    
+    # Below this level of detail a node is just a filled rectangle
+    MIN_TEXT_DETAIL = 0.4
     
     def __init__(self, x, y, width, height, text, node_type="statement", parent=None):
-        super().__init__(0, 0, width, height, parent)
-        self.setPos(x, y)
-        self.setBrush(QBrush(self._get_color_for_type(node_type)))
-        self.setPen(QPen(Qt.GlobalColor.black, 1))
+        super().__init__(parent)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
+        # Needed for paint() to get an accurate exposedRect
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
         # Disable node dragging to prevent users from moving nodes
         
-        # Add text
-        self.text_item = QGraphicsTextItem(self)
-        self.text_item.setPlainText(text)
-        self.text_item.setTextWidth(width - 10)
+        # Called with this node whenever it moves or resizes, and the row
+        # the listener keeps its geometry in
+        self.geometry_listener = None
+        self.geometry_index = None
         
-        # Center text
-        text_rect = self.text_item.boundingRect()
-        self.text_item.setPos(
-            (width - text_rect.width()) / 2,
-            (height - text_rect.height()) / 2
-        )
+        # Add text, laid out once and cached until it changes
+        self._static_text = QStaticText()
+        self._static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        self._rect = QRectF()
+        self.nav_number = None
+        
+        # Collapsible state
+        self.collapse_button = None
+        self._create_collapse_button()
+        
+        self.reset(x, y, width, height, text, node_type)
+        
+    def reset(self, x, y, width, height, text, node_type="statement"):
+        """Reinitialize this node for new content
+        
+        Lets the tree view reuse node items from a pool instead of creating
+        new ones. The node must not be in a scene or have a geometry listener.
+        """
+        # Node types often come from parsed LLM output; interning them
+        # shares one string per type and lets the type-keyed dict lookups
+        # here and in the tree view's index match by identity
+        node_type = sys.intern(node_type)
+        
+        self.prepareGeometryChange()
+        self._rect = QRectF(0, 0, width, height)
+        self._brush = self._get_brush_for_type(node_type)
+        self._pen = _BLACK_PEN
+        self.setPos(x, y)
+        self.setVisible(True)
+        self.setSelected(False)
+        
+        self._static_text.setTextWidth(width - 10)
+        self._text_pos = QPointF()
+        self._plain_text = text
+        self._set_text(text, Qt.TextFormat.PlainText)
+        
+        # Rasterized copy of the text drawn instead of it at low zoom
+        self._text_pixmap = None
+        self._low_detail = False
         
         # Set tooltip with full text for better readability on hover
         self.setToolTip(text)
@@ -454,14 +753,105 @@ class ConversationNode(QGraphicsRectItem):
         self.speaker = ""
         self.content = text
         self.node_number = None  # Will be set when added to the tree
-        
-        # Collapsible state
         self.is_collapsed = False
-        self.collapse_button = None
-        self._create_collapse_button()
         
-        # Navigation indicator
-        self.nav_indicator = None
+        # Navigation indicator number, None when not shown
+        self.nav_number = None
+        
+    def rect(self):
+        """Get the node rectangle in item coordinates"""
+        return QRectF(self._rect)
+        
+    def setRect(self, *args):
+        """Set the node rectangle from a QRectF or x, y, width, height"""
+        self.prepareGeometryChange()
+        self._rect = QRectF(*args)
+        self._static_text.setTextWidth(self._rect.width() - 10)
+        self._center_text()
+        self._text_pixmap = None
+        if self.geometry_listener:
+            self.geometry_listener(self)
+            
+    def itemChange(self, change, value):
+        """Report position changes to the geometry listener"""
+        if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged and self.geometry_listener:
+            self.geometry_listener(self)
+        return super().itemChange(change, value)
+        
+    def brush(self):
+        """Get the fill brush"""
+        return self._brush
+        
+    def setBrush(self, brush):
+        """Set the fill brush, skipping the repaint if it is unchanged"""
+        if brush == self._brush:
+            return
+        self._brush = brush
+        self.update()
+        
+    def pen(self):
+        """Get the outline pen"""
+        return self._pen
+        
+    def setPen(self, pen):
+        """Set the outline pen, skipping the repaint if it is unchanged"""
+        if pen == self._pen:
+            return
+        self._pen = pen
+        self.update()
+        
+    def boundingRect(self):
+        """Get the area painted by this node, including the indicator"""
+        margin = self._pen.widthF() / 2
+        top = self._INDICATOR_SIZE / 2 if self.nav_number is not None else 0
+        return self._rect.adjusted(-margin, -margin - top, margin, margin)
+        
+    def paint(self, painter, option, widget=None):
+        """Paint the background, text and navigation indicator"""
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < self.MIN_TEXT_DETAIL:
+            # Text and indicator would be unreadable; skip laying them out
+            painter.fillRect(self._rect, self._brush)
+            return
+            
+        # The views skip saving painter state around each item
+        # (DontSavePainterState), so set everything this paint relies on
+        # rather than inherit the previous item's pen, brush and font
+        painter.setPen(self._pen)
+        painter.setBrush(self._brush)
+        painter.setFont(widget.font() if widget is not None else QFont())
+        painter.drawRect(self._rect)
+        
+        # Only draw the parts inside the area being repainted
+        exposed = option.exposedRect
+        if self._low_detail:
+            if exposed.intersects(self._rect):
+                if self._text_pixmap is None:
+                    self._render_text_pixmap()
+                painter.drawPixmap(self._rect.topLeft(), self._text_pixmap)
+        elif exposed.intersects(QRectF(self._text_pos, self._static_text.size())):
+            painter.drawStaticText(self._text_pos, self._static_text)
+            
+        if self.nav_number is not None:
+            circle = self._indicator_rect()
+            if exposed.intersects(circle):
+                self._paint_navigation_indicator(painter, circle)
+                
+    def _indicator_rect(self):
+        """Get the navigation indicator circle's bounds at the top-right corner"""
+        size = self._INDICATOR_SIZE
+        return QRectF(self._rect.width() - 30, -size / 2, size, size)
+            
+    def _paint_navigation_indicator(self, painter, circle):
+        """Paint the numbered circle"""
+        painter.setPen(self._INDICATOR_PEN)
+        painter.setBrush(self._INDICATOR_BRUSH)
+        painter.drawEllipse(circle)
+        
+        if ConversationNode._indicator_font is None:
+            ConversationNode._indicator_font = QFont("Arial", 10, QFont.Weight.Bold)
+        painter.setFont(ConversationNode._indicator_font)
+        painter.drawText(circle, int(Qt.AlignmentFlag.AlignCenter), str(self.nav_number))
         
     def _create_collapse_button(self):
         """Create a collapse/expand button for this node"""
@@ -485,26 +875,21 @@ class ConversationNode(QGraphicsRectItem):
         node_rect = QRectF(
             self.pos().x(),
             self.pos().y(),
-            self.rect().width(),
-            self.rect().height()
+            self._rect.width(),
+            self._rect.height()
         )
         if node_rect.contains(point):
             return "node"
             
         return None
         
-    def _get_color_for_type(self, node_type):
-        """Get color based on node type"""
-        colors = {
-            "statement": QColor(200, 230, 255),  # Light blue
-            "question": QColor(255, 230, 200),   # Light orange
-            "objection": QColor(255, 200, 200),  # Light red
-            "decision": QColor(200, 255, 200),   # Light green
-            "current": QColor(255, 255, 150),    # Light yellow
-            "suggested": QColor(230, 255, 230),  # Pale green
-            "actual": QColor(220, 240, 255)      # Pale blue
-        }
-        return colors.get(node_type, QColor(240, 240, 240))  # Default light gray
+    def _get_brush_for_type(self, node_type):
+        """Get the shared fill brush for a node type"""
+        return ConversationNode._BRUSHES.get(node_type, _DEFAULT_BRUSH)
+        
+    def plain_text(self):
+        """Get the displayed text without markup"""
+        return self._plain_text
         
     def set_speaker(self, speaker):
         """Set the speaker for this node"""
@@ -522,78 +907,102 @@ class ConversationNode(QGraphicsRectItem):
         number_prefix = f"#{self.node_number}: " if self.node_number else ""
         
         if self.speaker:
-            self.text_item.setHtml(f"<b>{number_prefix}{self.speaker}</b><br>{display_text}")
+            self._set_text(f"<b>{number_prefix}{self.speaker}</b><br>{display_text}", Qt.TextFormat.RichText)
+            self._plain_text = f"{number_prefix}{self.speaker}\n{display_text}"
         else:
-            self.text_item.setHtml(f"<b>{number_prefix}</b>{display_text}")
-        
-        # Recenter text
-        text_rect = self.text_item.boundingRect()
-        self.text_item.setPos(
-            (self.rect().width() - text_rect.width()) / 2,
-            (self.rect().height() - text_rect.height()) / 2
-        )
+            self._set_text(f"<b>{number_prefix}</b>{display_text}", Qt.TextFormat.RichText)
+            self._plain_text = f"{number_prefix}{display_text}"
         
         # Always set full text as tooltip
         full_text = f"{self.speaker}: {self.content}" if self.speaker else self.content
         self.setToolTip(full_text)
         
+        # Re-render the low-zoom pixmap on next paint
+        self._text_pixmap = None
+        
+    def _set_text(self, text, text_format):
+        """Set the static text and recenter it"""
+        self._static_text.setTextFormat(text_format)
+        self._static_text.setText(text)
+        self._center_text()
+        
+    def _center_text(self):
+        """Center the static text within the node"""
+        text_size = self._static_text.size()
+        self._text_pos = QPointF(
+            (self._rect.width() - text_size.width()) / 2,
+            (self._rect.height() - text_size.height()) / 2
+        )
+        self.update()
+        
+    def set_low_detail(self, low_detail):
+        """Draw the cached text pixmap instead of the static text when zoomed out"""
+        if low_detail == self._low_detail:
+            return
+        self._low_detail = low_detail
+        self.update()
+        
+    def _render_text_pixmap(self):
+        """Rasterize the node text into a pixmap the size of the node"""
+        width = int(self._rect.width())
+        height = int(self._rect.height())
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, False)
+        painter.drawText(
+            QRectF(5, 5, width - 10, height - 10),
+            int(Qt.AlignmentFlag.AlignCenter) | int(Qt.TextFlag.TextWordWrap),
+            self._plain_text
+        )
+        painter.end()
+        
+        self._text_pixmap = pixmap
+        
     def add_navigation_indicator(self, number):
         """Add a visual indicator showing this node can be navigated to by number
         
         Args:
             number: The number to display, or None to remove the indicator
         """
-        # Remove existing indicator if any
-        if hasattr(self, 'nav_indicator') and self.nav_indicator:
-            self.scene().removeItem(self.nav_indicator)
-            self.nav_indicator = None
-            
-        # If number is None, just remove the indicator
-        if number is None:
+        if number == self.nav_number:
             return
             
-        # Create a circular indicator with number
-        from PyQt6.QtWidgets import QGraphicsEllipseItem, QGraphicsTextItem
-        from PyQt6.QtCore import QRectF
-        from PyQt6.QtGui import QBrush, QColor, QPen, QFont
-        
-        # Create circle
-        self.nav_indicator = QGraphicsEllipseItem(0, 0, 24, 24, self)
-        self.nav_indicator.setBrush(QBrush(QColor(0, 120, 215)))
-        self.nav_indicator.setPen(QPen(QColor(255, 255, 255)))
-        
-        # Position at top-right corner
-        self.nav_indicator.setPos(self.rect().width() - 30, -12)
-        
-        # Add number text
-        text = QGraphicsTextItem(str(number), self.nav_indicator)
-        text.setDefaultTextColor(QColor(255, 255, 255))
-        text.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-        
-        # Center text in circle
-        text_rect = text.boundingRect()
-        text.setPos(
-            (24 - text_rect.width()) / 2,
-            (24 - text_rect.height()) / 2
-        )
+        # The indicator sticks out above the node, so the bounds change
+        if (number is None) != (self.nav_number is None):
+            self.prepareGeometryChange()
+        self.nav_number = number
+        self.update()
 
 class TreeMinimap(QGraphicsView):
     """A minimap showing the entire tree with current viewport"""
     
     viewport_clicked = pyqtSignal(QPointF)  # Signal when minimap is clicked
     
+    # Shared styles for minimap nodes
+    _NODE_PEN = QPen(Qt.GlobalColor.black, 0.5)
+    _CURRENT_PEN = QPen(Qt.GlobalColor.red, 1)
+    _CURRENT_BRUSH = QBrush(QColor(255, 0, 0, 100))
+    
     def __init__(self, main_view):
         super().__init__()
         self.main_view = main_view
         self.setFixedSize(150, 150)
         self.setStyleSheet("background-color: #f0f0f0; border: 1px solid #ccc; border-radius: 5px;")
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.setOptimizationFlags(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing |
+                                  QGraphicsView.OptimizationFlag.DontSavePainterState)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
         self.setFrameShape(QFrame.Shape.NoFrame)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
-        # Create scene that mirrors the main scene
+        # Create scene that mirrors the main scene. The minimap is tiny and
+        # never hit-tested, so skip the BSP index: inserts become O(1) at the
+        # cost of linear item queries.
         self.scene = QGraphicsScene(self)
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self.scene)
         
         # Add viewport rectangle
@@ -602,87 +1011,114 @@ class TreeMinimap(QGraphicsView):
         self.viewport_rect.setBrush(QBrush(QColor(255, 0, 0, 30)))
         self.scene.addItem(self.viewport_rect)
         
+        # Mini node items kept between updates, keyed by node id, and one
+        # path item drawing every edge
+        self._mini_nodes = {}
+        self._mini_edges_item = QGraphicsPathItem()
+        self._mini_edges_item.setPen(QPen(Qt.GlobalColor.darkGray, 0.5))
+        self.scene.addItem(self._mini_edges_item)
+        self._scale = 1.0
+        self._dirty = True
+        
+    def mark_dirty(self):
+        """Flag that the main tree changed and mini items need a resync"""
+        self._dirty = True
+        
     def update_minimap(self):
-        """Update the minimap with current tree and viewport"""
+        """Update the minimap with current tree and viewport
+        
+        Node and edge items are only resynced when the main tree has been
+        marked dirty; otherwise just the viewport rectangle is moved.
+        """
         if not self.main_view:
             return
             
-        # Clear existing items except viewport rect
-        for item in self.scene.items():
-            if item != self.viewport_rect:
-                self.scene.removeItem(item)
+        if self._dirty:
+            if not self._sync_items():
+                return
+            self._dirty = False
+        
+        # Update viewport rectangle
+        scale = self._scale
+        visible_rect = self.main_view.mapToScene(self.main_view.viewport().rect()).boundingRect()
+        self.viewport_rect.setRect(
+            visible_rect.x() * scale,
+            visible_rect.y() * scale,
+            visible_rect.width() * scale,
+            visible_rect.height() * scale
+        )
+        
+        # Fit scene in view
+        self.fitInView(self.scene.itemsBoundingRect(), Qt.AspectRatioMode.KeepAspectRatio)
+        
+    def _sync_items(self):
+        """Diff the mini items against the main tree, reusing existing items
         
+        Returns:
+            False if the main scene is empty, True otherwise
+        """
         # Get main scene bounds
         main_bounds = self.main_view.scene.itemsBoundingRect()
         if main_bounds.isEmpty():
-            return
+            self._remove_stale(self._mini_nodes, ())
+            self._mini_edges_item.setPath(QPainterPath())
+            return False
             
         # Calculate scale factor to fit in minimap
         scale_x = self.width() / max(1, main_bounds.width())
         scale_y = self.height() / max(1, main_bounds.height())
-        scale = min(scale_x, scale_y) * 0.9  # 90% to leave some margin
-        
-        # Add simplified versions of all nodes
-        for node_id, node in self.main_view.nodes.items():
-            if not node.isVisible():
-                continue
+        scale = self._scale = min(scale_x, scale_y) * 0.9  # 90% to leave some margin
+        
+        nodes = self.main_view.nodes
+        visible = {node_id for node_id, node in nodes.items() if node.isVisible()}
+        
+        # Add or update simplified versions of all visible nodes
+        self._remove_stale(self._mini_nodes, visible)
+        for node_id in visible:
+            node = nodes[node_id]
+            mini_node = self._mini_nodes.get(node_id)
+            if mini_node is None:
+                mini_node = self._mini_nodes[node_id] = QGraphicsRectItem()
+                self.scene.addItem(mini_node)
                 
-            # Create mini node
-            mini_node = QGraphicsRectItem(
+            mini_node.setRect(
                 node.pos().x() * scale,
                 node.pos().y() * scale,
                 node.rect().width() * scale,
                 node.rect().height() * scale
             )
             
-            # Use same color as main node but slightly transparent
-            color = node._get_color_for_type(node.node_type)
-            mini_node.setBrush(QBrush(color))
-            mini_node.setPen(QPen(Qt.GlobalColor.black, 0.5))
-            
-            # Highlight current node
+            # Highlight current node, otherwise use same color as main node
             if node_id == self.main_view.current_node_id:
-                mini_node.setPen(QPen(Qt.GlobalColor.red, 1))
-                mini_node.setBrush(QBrush(QColor(255, 0, 0, 100)))
-            
-            self.scene.addItem(mini_node)
+                mini_node.setPen(self._CURRENT_PEN)
+                mini_node.setBrush(self._CURRENT_BRUSH)
+            else:
+                mini_node.setPen(self._NODE_PEN)
+                mini_node.setBrush(node._get_brush_for_type(node.node_type))
         
-        # Add simplified edges
-        for edge, src_id, dst_id in self.main_view.edges:
-            if src_id in self.main_view.nodes and dst_id in self.main_view.nodes:
-                src = self.main_view.nodes[src_id]
-                dst = self.main_view.nodes[dst_id]
-                
-                if not src.isVisible() or not dst.isVisible():
-                    continue
-                    
-                # Create path for edge
-                path = QPainterPath()
-                path.moveTo(
-                    (src.pos().x() + src.rect().width()/2) * scale,
-                    (src.pos().y() + src.rect().height()/2) * scale
-                )
-                path.lineTo(
-                    (dst.pos().x() + dst.rect().width()/2) * scale,
-                    (dst.pos().y() + dst.rect().height()/2) * scale
-                )
+        # Draw simplified edges between visible nodes as one path
+        path = QPainterPath()
+        for src_id, dst_id in self.main_view.edges:
+            if src_id not in visible or dst_id not in visible:
+                continue
+            src = nodes[src_id]
+            dst = nodes[dst_id]
+            path.moveTo(
+                (src.pos().x() + src.rect().width()/2) * scale,
+                (src.pos().y() + src.rect().height()/2) * scale
+            )
+            path.lineTo(
+                (dst.pos().x() + dst.rect().width()/2) * scale,
+                (dst.pos().y() + dst.rect().height()/2) * scale
+            )
+        self._mini_edges_item.setPath(path)
                 
-                # Add path to scene
-                edge_item = QGraphicsPathItem(path)
-                edge_item.setPen(QPen(Qt.GlobalColor.darkGray, 0.5))
-                self.scene.addItem(edge_item)
-        
-        # Update viewport rectangle
-        visible_rect = self.main_view.mapToScene(self.main_view.viewport().rect()).boundingRect()
-        self.viewport_rect.setRect(
-            visible_rect.x() * scale,
-            visible_rect.y() * scale,
-            visible_rect.width() * scale,
-            visible_rect.height() * scale
-        )
+        return True
         
-        # Fit scene in view
-        self.fitInView(self.scene.itemsBoundingRect(), Qt.AspectRatioMode.KeepAspectRatio)
+    def _remove_stale(self, items, keep):
+        """Remove mini items whose keys are not in keep"""
+        for key in [key for key in items if key not in keep]:
+            self.scene.removeItem(items.pop(key))
         
     def mousePressEvent(self, event):
         """Handle mouse press to navigate in main view"""
@@ -703,10 +1139,45 @@ class ConversationTreeView(QGraphicsView):
     node_clicked = pyqtSignal(object)  # Signal when a node is clicked
     node_collapsed = pyqtSignal(str, bool)  # Signal when a node is collapsed/expanded (node_id, is_collapsed)
     
+    # Zoom level at or below which node text is drawn from cached pixmaps
+    LOW_DETAIL_SCALE = 0.6
+    
+    # Scene units added around the viewport when culling edges, so small
+    # pans don't need a new cull
+    CULL_MARGIN = 64
+    
+    # Most node items kept for reuse after clear_tree
+    NODE_POOL_SIZE = 1000
+    
+    # No edges to cull until the first _update_all_edges
+    _edge_curves = np.empty((0, 6))
+    _edge_highlight = np.zeros(0, dtype=bool)
+    _edge_bounds = np.empty((0, 4))
+    _edge_mask = np.zeros(0, dtype=bool)
+    _cull_rect = QRectF()
+    
+    # Shared edge pens
+    _EDGE_PEN = QPen(Qt.GlobalColor.darkGray, 2)
+    _HIGHLIGHT_EDGE_PEN = QPen(QColor(0, 120, 215), 3)
+    
+    # Path highlight gradient from root (pale blue) towards the current
+    # node (pale violet), in ten steps
+    _PATH_BRUSHES = [
+        QBrush(QColor(int(220 + 35 * i / 9), int(240 - 40 * i / 9), 255))
+        for i in range(10)
+    ]
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if OPENGL_AVAILABLE:
+            # Rasterize on the GPU
+            self.setViewport(QOpenGLWidget())
+        # Many small nodes animate and edges redraw together, so repainting
+        # the whole viewport is cheaper than unioning dirty regions
         self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setOptimizationFlags(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing |
+                                  QGraphicsView.OptimizationFlag.DontSavePainterState)
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
         
         # Set tooltip with usage instructions
@@ -718,25 +1189,55 @@ class ConversationTreeView(QGraphicsView):
             "- Click the +/- button on a node to expand/collapse its children"
         )
         
-        # Create scene
+        # Create scene, letting Qt pick the BSP depth for the item count
         self.scene = QGraphicsScene(self)
+        self.scene.setBspTreeDepth(0)
         self.setScene(self.scene)
         
         # Initialize tree data
         self.nodes = {}
         self.current_node_id = None
-        self.edges = []  # Store edges for updating
+        self.edges = []  # (parent_id, child_id) pairs, drawn by the edge items
+        self.highlighted_edges = set()  # Edges on the path to the current node
+        self._path_cache = {}  # node_id -> tuple of node ids from root to the node
         self.collapsed_subtrees = set()  # Track collapsed subtrees
+        self._prev_highlighted_path = ()  # Path highlighted by _highlight_path_to_node
+        self._indicator_nodes = []  # Nodes currently showing a navigation number
+        self._node_pool = []  # Node items removed by clear_tree, see add_node
+        self._nodes_by_type = {}  # node_type -> node ids, in insertion order
+        self._nodes_by_keyword = {}  # Trigger keyword in content -> node ids, in insertion order
+        self._option_index = {}  # Option number referenced in content -> first such node id
+        self._reset_geometry()
+        self._create_scene_items()
         
         # Create layout manager
         self.layout_manager = TreeLayoutManager(self)
         
         # Set up zoom
         self.zoom_factor = 1.15
+        self._low_detail = False
+        
+        # Nesting depth of begin_batch_update calls
+        self._batch_depth = 0
+        
+        # Whether a deferred edge/minimap refresh is queued, see _schedule_flush
+        self._flush_scheduled = False
         
-        # Animation properties
-        self.node_animations = {}
-        self.edge_animations = {}
+        # Whether a minimap refresh is queued, see _schedule_minimap_update
+        self._minimap_scheduled = False
+        
+        # Whether a layout is queued, see request_layout
+        self._layout_pending = False
+        
+        # One timeline moves every animating node in lockstep, from
+        # _anim_from to _anim_to (node_id -> QPointF)
+        self._anim_timeline = QTimeLine(300, self)
+        self._anim_timeline.setUpdateInterval(16)
+        self._anim_timeline.setEasingCurve(QEasingCurve(QEasingCurve.Type.OutCubic))
+        self._anim_timeline.valueChanged.connect(self._on_animation_step)
+        self._anim_timeline.finished.connect(self._on_animation_finished)
+        self._anim_from = {}
+        self._anim_to = {}
         
         # Create minimap
         self.minimap = TreeMinimap(self)
@@ -751,63 +1252,141 @@ class ConversationTreeView(QGraphicsView):
                 self.scale(self.zoom_factor, self.zoom_factor)
             else:
                 self.scale(1 / self.zoom_factor, 1 / self.zoom_factor)
+            self.update_level_of_detail()
             event.accept()
         else:
             super().wheelEvent(event)
     
+    def update_level_of_detail(self):
+        """Refresh zoom-dependent drawing: edge culling and node text detail"""
+        self._cull_edges()
+        low_detail = self.transform().m11() <= self.LOW_DETAIL_SCALE
+        if low_detail == self._low_detail:
+            return
+        self._low_detail = low_detail
+        self.setRenderHint(QPainter.RenderHint.Antialiasing, not low_detail)
+        for node in self.nodes.values():
+            node.set_low_detail(low_detail)
+    
     def mousePressEvent(self, event):
         """Handle mouse press events"""
         if event.button() == Qt.MouseButton.LeftButton:
             # Get scene position
             scene_pos = self.mapToScene(event.pos())
             
-            # Check if we clicked on a node
-            for node_id, node in self.nodes.items():
-                hit_part = node.contains_point(scene_pos)
-                if hit_part == "node":
-                    self.node_clicked.emit(node)
-                    return
+            # Look up the item under the cursor through the scene's index,
+            # walking up from child items such as the highlight halo
+            item = self.scene.itemAt(scene_pos, self.transform())
+            while item is not None and not isinstance(item, ConversationNode):
+                item = item.parentItem()
+            if item is not None and item.contains_point(scene_pos) == "node":
+                self.node_clicked.emit(item)
+                return
                     
         # Allow panning with drag
         super().mousePressEvent(event)
     
     def clear_tree(self):
-        """Clear the tree"""
+        """Clear the tree, keeping node items in a pool for add_node to reuse"""
+        self._highlight_overlay.setParentItem(None)
+        for node in self.nodes.values():
+            if len(self._node_pool) >= self.NODE_POOL_SIZE:
+                break
+            node.geometry_listener = None
+            self.scene.removeItem(node)
+            self._node_pool.append(node)
         self.scene.clear()
         self.nodes = {}
+        self._nodes_by_type = {}
+        self._nodes_by_keyword = {}
+        self._option_index = {}
         self.edges = []
+        self.highlighted_edges = set()
+        self._path_cache = {}
+        self._reset_geometry()
+        self._create_scene_items()
+        self.minimap.mark_dirty()
         self.current_node_id = None
         self.collapsed_subtrees = set()
-        self.node_animations = {}
-        self.edge_animations = {}
+        self._prev_highlighted_path = ()
+        self._indicator_nodes = []
+        self._anim_timeline.stop()
+        self._anim_from = {}
+        self._anim_to = {}
+    
+    def _reset_geometry(self):
+        """Reset the node geometry arrays used to compute edges
+        
+        Each node gets a row of _geometry holding (x, y, width, height), kept
+        current by the node's geometry listener, and each edge is stored as
+        a pair of rows so edge curves can be computed without PyQt calls.
+        """
+        self._geometry = np.zeros((64, 4), dtype=np.float64)
+        self._geometry_count = 0
+        self._edge_parent_rows = []
+        self._edge_child_rows = []
+        
+    def _store_node_geometry(self, node):
+        """Copy a node's position and size into its geometry row"""
+        pos = node.pos()
+        rect = node.rect()
+        self._geometry[node.geometry_index] = (pos.x(), pos.y(), rect.width(), rect.height())
+        
+    def _create_scene_items(self):
+        """Create the shared edge and highlight items
+        
+        All edges share one QGraphicsPathItem, with edges on the highlighted
+        path drawn by a second one on top, instead of an item per edge.
+        """
+        self._edges_item = QGraphicsPathItem()
+        self._edges_item.setPen(self._EDGE_PEN)
+        self._edges_item.setZValue(-2)
+        self._edges_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.scene.addItem(self._edges_item)
+        
+        self._highlight_edges_item = QGraphicsPathItem()
+        self._highlight_edges_item.setPen(self._HIGHLIGHT_EDGE_PEN)
+        self._highlight_edges_item.setZValue(-1)
+        self._highlight_edges_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.scene.addItem(self._highlight_edges_item)
+        
+        # Edge curves and bounds for viewport culling, see _cull_edges
+        self._edge_curves = ConversationTreeView._edge_curves
+        self._edge_highlight = ConversationTreeView._edge_highlight
+        self._edge_bounds = ConversationTreeView._edge_bounds
+        self._edge_mask = ConversationTreeView._edge_mask
+        self._cull_rect = QRectF()
+        
+        # Glow drawn behind the current node; a static halo instead of a
+        # blur effect that would be recomputed on every repaint
+        self._highlight_overlay = QGraphicsRectItem()
+        self._highlight_overlay.setBrush(QBrush(QColor(255, 255, 0, 160)))  # Yellow glow
+        self._highlight_overlay.setPen(QPen(Qt.PenStyle.NoPen))
+        self._highlight_overlay.setFlag(QGraphicsItem.GraphicsItemFlag.ItemStacksBehindParent, True)
+        self._highlight_overlay.setVisible(False)
+        self.scene.addItem(self._highlight_overlay)
     
     def set_current_node(self, node_id):
         """Set the current active node"""
         # Reset previous current node
         if self.current_node_id and self.current_node_id in self.nodes:
             prev_node = self.nodes[self.current_node_id]
-            prev_node.setBrush(QBrush(prev_node._get_color_for_type(prev_node.node_type)))
-            prev_node.setGraphicsEffect(None)
+            prev_node.setBrush(prev_node._get_brush_for_type(prev_node.node_type))
+        self._highlight_overlay.setVisible(False)
         
         # Reset all edge styles
-        for edge, src, dst in self.edges:
-            edge.setPen(QPen(Qt.GlobalColor.darkGray, 2))
+        self.highlighted_edges.clear()
         
         # Set new current node
         if node_id in self.nodes:
             self.current_node_id = node_id
             current_node = self.nodes[node_id]
-            current_node.setBrush(QBrush(current_node._get_color_for_type("current")))
+            current_node.setBrush(current_node._get_brush_for_type("current"))
             
-            # Add a subtle highlight effect
-            from PyQt6.QtWidgets import QGraphicsDropShadowEffect
-            from PyQt6.QtGui import QColor
-            
-            glow = QGraphicsDropShadowEffect()
-            glow.setColor(QColor(255, 255, 0, 160))  # Yellow glow
-            glow.setOffset(0, 0)
-            glow.setBlurRadius(20)
-            current_node.setGraphicsEffect(glow)
+            # Add a subtle highlight, moving with the node as its child
+            self._highlight_overlay.setParentItem(current_node)
+            self._highlight_overlay.setRect(current_node.rect().adjusted(-6, -6, 6, 6))
+            self._highlight_overlay.setVisible(True)
             
             # Ensure node is visible
             self.ensureVisible(current_node)
@@ -821,25 +1400,41 @@ class ConversationTreeView(QGraphicsView):
             # Update navigation indicators
             self.update_navigation_indicators()
             
+        # Redraw edges with the new highlighting
+        self._update_all_edges()
+        
+        if node_id in self.nodes:
             # Update minimap to reflect changes
-            if hasattr(self, 'minimap'):
-                self.minimap.update_minimap()
+            self.minimap.mark_dirty()
+            self._schedule_minimap_update()
     
     def _highlight_path_to_node(self, node_id):
         """Highlight the path from root to the specified node"""
-        # Build the path from node to root
-        path = []
-        current = node_id
-        
-        while current:
-            path.insert(0, current)  # Add to beginning of path
-            node = self.nodes.get(current)
-            if not node or not node.parent_id:
-                break
-            current = node.parent_id
-            
-        # Highlight nodes and edges along the path
-        for i, path_node_id in enumerate(path):
+        # Path from root to node, recorded when the node was added
+        path = self._path_cache.get(node_id, ())
+        prev_path = self._prev_highlighted_path
+        
+        # Find where the new path leaves the previously highlighted one
+        prefix = 0
+        common = min(len(path), len(prev_path))
+        while prefix < common and path[prefix] == prev_path[prefix]:
+            prefix += 1
+            
+        # Un-highlight the part of the old path that is no longer on it
+        for path_node_id in prev_path[prefix:]:
+            node = self.nodes.get(path_node_id)
+            if node is not None:
+                node.setBrush(node._get_brush_for_type(node.node_type))
+        self._prev_highlighted_path = path
+        
+        # Edges on the path
+        self.highlighted_edges.update(zip(path, path[1:]))
+            
+        # Highlight nodes along the path. The shared prefix keeps its
+        # brushes unless the path length, and with it the gradient, changed
+        start = prefix if len(path) == len(prev_path) else 0
+        for i in range(start, len(path)):
+            path_node_id = path[i]
             if path_node_id not in self.nodes:
                 continue
                 
@@ -851,111 +1446,252 @@ class ConversationTreeView(QGraphicsView):
                 
             # Use a gradient from start to current
             progress = i / max(1, len(path) - 1)
-            color = QColor(
-                int(220 + 35 * progress),  # More red as we progress
-                int(240 - 40 * progress),  # Less green as we progress
-                255                         # Constant blue
-            )
             
             # Apply a subtle highlight to path nodes
-            node.setBrush(QBrush(color))
-            
-            # Highlight edges between path nodes
-            if i > 0:
-                prev_id = path[i-1]
-                for edge, src, dst in self.edges:
-                    if (src == prev_id and dst == path_node_id) or (src == path_node_id and dst == prev_id):
-                        edge.setPen(QPen(QColor(0, 120, 215), 3))
+            node.setBrush(self._PATH_BRUSHES[min(9, int(progress * 9))])
     
     def _ensure_parents_expanded(self, node_id):
         """Make sure all parent nodes are expanded to show this node"""
-        node = self.nodes.get(node_id)
-        if not node or not node.parent_id:
-            return
-            
-        # Check if parent is collapsed
-        parent = self.nodes.get(node.parent_id)
-        if parent and parent.is_collapsed:
-            # Expand parent
-            parent.is_collapsed = False
-            parent.update_collapse_button()
-            self.node_collapsed.emit(parent.node_id, False)
-            
-            # Update visibility
-            self._update_subtree_visibility(parent.node_id, True)
-            
-        # Recursively check parent's parents
-        self._ensure_parents_expanded(node.parent_id)
+        # Walk the cached path upwards from the immediate parent
+        for parent_id in reversed(self._path_cache.get(node_id, ())[:-1]):
+            # Check if parent is collapsed
+            parent = self.nodes.get(parent_id)
+            if parent and parent.is_collapsed:
+                # Expand parent
+                parent.is_collapsed = False
+                parent.update_collapse_button()
+                self.node_collapsed.emit(parent.node_id, False)
+                
+                # Update visibility
+                self._update_subtree_visibility(parent.node_id, True)
     
     def add_node(self, node_id, parent_id, text, node_type="statement", x=0, y=0, speaker=""):
         """Add a node to the tree"""
         # Create node with wider rectangle
         width = 200  # Increased from 150
         height = 80  # Increased from 60
-        node = ConversationNode(x, y, width, height, text, node_type)
+        if self._node_pool:
+            node = self._node_pool.pop()
+            node.reset(x, y, width, height, text, node_type)
+        else:
+            node = ConversationNode(x, y, width, height, text, node_type)
         node.node_id = node_id
         node.parent_id = parent_id
         node.node_number = len(self.nodes) + 1  # Assign sequential number
         if speaker:
             node.set_speaker(speaker)
+        node.set_low_detail(self._low_detail)
         
-        # Add to scene
+        # Add to scene, caching the rendered node until it calls update()
         self.scene.addItem(node)
+        node.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.nodes[node_id] = node
         
+        # Index the node for find_nodes
+        self._nodes_by_type.setdefault(node.node_type, []).append(node_id)
+        for keyword in set(_KEYWORD_PATTERN.findall(text.lower())):
+            self._nodes_by_keyword.setdefault(keyword, []).append(node_id)
+        for match in _OPTION_REF.finditer(text):
+            # "Option 12" also contains "Option 1", so index each number prefix
+            digits = match.group(1)
+            for end in range(1, len(digits) + 1):
+                number = int(digits[:end])
+                if str(number) == digits[:end]:
+                    self._option_index.setdefault(number, node_id)
+        
+        # Give the node a geometry row, growing the array as needed
+        if self._geometry_count == len(self._geometry):
+            self._geometry = np.concatenate((self._geometry, np.zeros_like(self._geometry)))
+        node.geometry_index = self._geometry_count
+        self._geometry_count += 1
+        node.geometry_listener = self._store_node_geometry
+        self._store_node_geometry(node)
+        self._path_cache[node_id] = self._path_cache.get(parent_id, ()) + (node_id,)
+        self.minimap.mark_dirty()
+        
         # Connect to parent if exists
         if parent_id and parent_id in self.nodes:
             parent = self.nodes[parent_id]
             parent.children.append(node_id)
             parent.update_collapse_button()
             
-            # Draw connection line
-            path = QPainterPath()
-            path.moveTo(parent.pos() + QPointF(parent.rect().width()/2, parent.rect().height()))
-            path.lineTo(node.pos() + QPointF(node.rect().width()/2, 0))
-            
-            line = QGraphicsPathItem(path)
-            line.setPen(QPen(Qt.GlobalColor.darkGray, 2))
-            self.scene.addItem(line)
-            self.edges.append((line, parent.node_id, node.node_id))
+            self.edges.append((parent.node_id, node.node_id))
+            self._edge_parent_rows.append(parent.geometry_index)
+            self._edge_child_rows.append(node.geometry_index)
             
             # Check if parent is collapsed
             if parent.is_collapsed:
                 node.setVisible(False)
+                
+        # Draw the new edge along with any others added this event loop pass
+        self._schedule_flush()
         
-        # Animate the new node
-        self._animate_new_node(node)
+        # Animate the new node, unless it is part of a bulk rebuild
+        if not self._batch_depth:
+            self._animate_new_node(node)
         
         return node
     
-    def _animate_new_node(self, node):
-        """Animate a new node appearing"""
-        try:
-            # Save original position
-            original_pos = node.pos()
-            
-            # Start from slightly above
-            node.setPos(original_pos.x(), original_pos.y() - 20)
+    def add_nodes_bulk(self, rows):
+        """Add several nodes in one batch update
+        
+        Args:
+            rows: Iterable of add_node argument tuples, parents before children
             
-            # Create position animation
-            pos_anim = QPropertyAnimation(node, b"pos")
-            pos_anim.setDuration(500)
-            pos_anim.setStartValue(node.pos())
-            pos_anim.setEndValue(original_pos)
-            pos_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        Returns:
+            List of the added nodes
+        """
+        self.begin_batch_update()
+        try:
+            return [self.add_node(*row) for row in rows]
+        finally:
+            self.end_batch_update()
+    
+    def find_nodes(self, node_type, keyword):
+        """Find nodes of a type or whose content contains a trigger keyword
+        
+        Args:
+            node_type: Node type to match
+            keyword: One of the words in _KEYWORD_TRIGGERS
             
-            # Start animation
-            pos_anim.start()
+        Returns:
+            List of matching node ids in the order they were added
+        """
+        matches = set(self._nodes_by_type.get(node_type, ()))
+        matches.update(self._nodes_by_keyword.get(keyword, ()))
+        return sorted(matches, key=lambda node_id: self.nodes[node_id].node_number)
+    
+    def find_option_node(self, number):
+        """Get the id of the first node whose content contains "Option <number>"
+        or "#<number>", or None if there is none"""
+        return self._option_index.get(number)
+    
+    def _animate_new_node(self, node):
+        """Animate a new node appearing, dropping in from slightly above"""
+        original_pos = node.pos()
+        start_pos = original_pos - QPointF(0, 20)
+        node.setPos(start_pos)
+        
+        self._anim_from[node.node_id] = start_pos
+        self._anim_to[node.node_id] = original_pos
+        self._restart_animation()
+        
+    def _restart_animation(self):
+        """(Re)start the shared timeline, continuing nodes already in flight"""
+        if self._anim_timeline.state() == QTimeLine.State.Running:
+            self._anim_timeline.stop()
+            for node_id in self._anim_from:
+                node = self.nodes.get(node_id)
+                if node:
+                    self._anim_from[node_id] = node.pos()
+        self._anim_timeline.start()
+        
+    def _retarget_animation(self):
+        """Point animating nodes at the positions just set by a layout"""
+        if not self._anim_to:
+            return
+        for node_id in list(self._anim_to):
+            node = self.nodes.get(node_id)
+            if not node:
+                del self._anim_from[node_id], self._anim_to[node_id]
+                continue
+            target = node.pos()
+            self._anim_to[node_id] = target
+            self._anim_from[node_id] = target - QPointF(0, 20)
+            node.setPos(self._anim_from[node_id])
+        self._anim_timeline.stop()
+        self._anim_timeline.start()
+        
+    def _on_animation_step(self, value):
+        """Move all animating nodes to their interpolated positions"""
+        for node_id, start_pos in self._anim_from.items():
+            node = self.nodes.get(node_id)
+            if node:
+                node.setPos(start_pos + (self._anim_to[node_id] - start_pos) * value)
+        self._update_all_edges()
+        
+    def _on_animation_finished(self):
+        """Forget finished animations"""
+        self._anim_from = {}
+        self._anim_to = {}
+    
+    def _schedule_flush(self):
+        """Queue one edge and minimap refresh for the next event loop pass
+        
+        A burst of add_node calls then redraws the scene once instead of
+        once per node.
+        """
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_pending)
+            
+    def _flush_pending(self):
+        """Apply the refresh queued by _schedule_flush"""
+        self._flush_scheduled = False
+        if self._batch_depth:
+            # end_batch_update lays out and redraws everything
+            return
+        self._update_all_edges()
+        self._schedule_minimap_update()
+        
+    def _schedule_minimap_update(self):
+        """Queue one minimap refresh for roughly the next frame
+        
+        Navigation, layout and scrolling all refresh the minimap; coalescing
+        them means a burst of changes re-renders it once.
+        """
+        if not self._minimap_scheduled:
+            self._minimap_scheduled = True
+            QTimer.singleShot(16, self._flush_minimap)
+            
+    def _flush_minimap(self):
+        """Apply the refresh queued by _schedule_minimap_update"""
+        self._minimap_scheduled = False
+        if self.nodes:
+            self.minimap.update_minimap()
+    
+    def begin_batch_update(self):
+        """Start adding or changing many nodes at once
+        
+        Scene signals and repaints are paused until the matching
+        end_batch_update, which then lays out the tree a single time.
+        Calls may be nested.
+        """
+        if self._batch_depth == 0:
+            self.scene.blockSignals(True)
+            self.setUpdatesEnabled(False)
+        self._batch_depth += 1
+        
+    def end_batch_update(self):
+        """Finish a batch update, laying out the tree and minimap once"""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
             
-            # Store animation to prevent garbage collection
-            self.node_animations[node.node_id] = pos_anim
-        except Exception as e:
-            print(f"Animation error: {str(e)}")
-            # Just set the final position without animation
-            node.setPos(original_pos)
+        self.scene.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self.layout_tree()
+    
+    def request_layout(self):
+        """Queue a layout_tree call for roughly the next frame
+        
+        Bursts of node additions or collapses then lay the tree out once.
+        """
+        if not self._layout_pending:
+            self._layout_pending = True
+            QTimer.singleShot(16, self._run_pending_layout)
+            
+    def _run_pending_layout(self):
+        """Apply the layout queued by request_layout"""
+        # Skip if layout_tree already ran since the request
+        if self._layout_pending:
+            self.layout_tree()
     
     def layout_tree(self):
         """Layout the tree using the layout manager"""
+        self._layout_pending = False
         try:
             # Use the layout manager to position all nodes
             self.layout_manager.layout_tree()
@@ -963,6 +1699,9 @@ class ConversationTreeView(QGraphicsView):
             # Apply force-directed adjustments to prevent overlap
             self.layout_manager.apply_force_directed_adjustments()
             
+            # Animate new nodes into their laid-out positions
+            self._retarget_animation()
+            
             # Update scene rect to fit all nodes
             self.scene.setSceneRect(self.scene.itemsBoundingRect().adjusted(-50, -50, 50, 50))
             
@@ -971,14 +1710,15 @@ class ConversationTreeView(QGraphicsView):
                 self.centerOn(self.nodes[self.current_node_id])
                 
             # Update minimap
+            self.minimap.mark_dirty()
             if len(self.nodes) > 0:
-                self.minimap.update_minimap()
+                self._schedule_minimap_update()
                 self.minimap.show()
             else:
                 self.minimap.hide()
                 
         except Exception as e:
-            print(f"Error in layout_tree: {str(e)}")
+            logger.exception("Error in layout_tree")
             
     def _navigate_to_minimap_position(self, scene_pos):
         """Navigate to the position clicked on the minimap"""
@@ -1000,7 +1740,7 @@ class ConversationTreeView(QGraphicsView):
         self.centerOn(target_x, target_y)
         
         # Update minimap
-        self.minimap.update_minimap()
+        self._schedule_minimap_update()
     
     def _update_subtree_visibility(self, node_id, visible):
         """Update visibility of a subtree
@@ -1009,53 +1749,119 @@ class ConversationTreeView(QGraphicsView):
             node_id: ID of the root of the subtree
             visible: Whether the subtree should be visible
         """
-        node = self.nodes.get(node_id)
-        if not node:
-            return
-            
-        # Update children recursively
-        for child_id in node.children:
-            child = self.nodes.get(child_id)
-            if child:
-                child.setVisible(visible)
+        stack = [node_id]
+        while stack:
+            node = self.nodes.get(stack.pop())
+            if not node:
+                continue
                 
-                # Only recurse if this child is expanded
-                if not child.is_collapsed:
-                    self._update_subtree_visibility(child_id, visible)
+            # Update children, descending only into expanded ones
+            for child_id in node.children:
+                child = self.nodes.get(child_id)
+                if child:
+                    child.setVisible(visible)
+                    if not child.is_collapsed:
+                        stack.append(child_id)
     
     def _update_all_edges(self):
-        """Update all edge connections after nodes have moved"""
-        for edge, parent_id, child_id in self.edges:
-            if parent_id in self.nodes and child_id in self.nodes:
-                parent = self.nodes[parent_id]
-                child = self.nodes[child_id]
-                
-                # Only update if both nodes are visible
-                if parent.isVisible() and child.isVisible():
-                    # Update path with a curved line
-                    path = QPainterPath()
-                    
-                    # Start and end points - connect at bottom center of parent and top center of child
-                    start_x = parent.pos().x() + parent.rect().width()/2
-                    start_y = parent.pos().y() + parent.rect().height()
-                    end_x = child.pos().x() + child.rect().width()/2
-                    end_y = child.pos().y()
-                    
-                    # Control points for curve
-                    ctrl1_x = start_x
-                    ctrl1_y = start_y + (end_y - start_y) / 3
-                    ctrl2_x = end_x
-                    ctrl2_y = end_y - (end_y - start_y) / 3
-                    
-                    # Create curved path
-                    path.moveTo(start_x, start_y)
-                    path.cubicTo(ctrl1_x, ctrl1_y, ctrl2_x, ctrl2_y, end_x, end_y)
-                    
-                    # Update edge
-                    edge.setPath(path)
-                    edge.setVisible(True)
-                else:
-                    edge.setVisible(False)
+        """Recompute edge curves after nodes have moved or changed visibility"""
+        if not self.edges:
+            self._edge_curves = np.empty((0, 6))
+            self._edge_highlight = np.zeros(0, dtype=bool)
+            self._edge_bounds = np.empty((0, 4))
+            self._cull_edges(force=True)
+            return
+            
+        geometry = self._geometry
+        node_visible = np.zeros(len(geometry), dtype=bool)
+        for node in self.nodes.values():
+            node_visible[node.geometry_index] = node.isVisible()
+        highlighted_rows = [self.nodes[child_id].geometry_index
+                            for _, child_id in self.highlighted_edges if child_id in self.nodes]
+        
+        # Only draw if both nodes are visible
+        parents = np.array(self._edge_parent_rows, dtype=np.intp)
+        children = np.array(self._edge_child_rows, dtype=np.intp)
+        drawn = node_visible[parents] & node_visible[children]
+        parents = parents[drawn]
+        children = children[drawn]
+        
+        # Start and end points - connect at bottom center of parent and top center of child
+        start_x = geometry[parents, 0] + geometry[parents, 2] / 2
+        start_y = geometry[parents, 1] + geometry[parents, 3]
+        end_x = geometry[children, 0] + geometry[children, 2] / 2
+        end_y = geometry[children, 1]
+        
+        # Control points for curve (the x's match the end points)
+        ctrl1_y = start_y + (end_y - start_y) / 3
+        ctrl2_y = end_y - (end_y - start_y) / 3
+        curves = np.column_stack((start_x, start_y, ctrl1_y, ctrl2_y, end_x, end_y))
+        
+        # A child has one parent edge, so highlighted edges are found by child
+        highlight = np.isin(children, highlighted_rows)
+        
+        # Nothing moved or changed highlighting: keep the current paths
+        if np.array_equal(curves, self._edge_curves) and np.array_equal(highlight, self._edge_highlight):
+            return
+        self._edge_curves = curves
+        self._edge_highlight = highlight
+        
+        # Curves stay inside the box spanned by their end points, which is
+        # all the culling needs
+        self._edge_bounds = np.column_stack((
+            np.minimum(start_x, end_x), np.minimum(start_y, end_y),
+            np.maximum(start_x, end_x), np.maximum(start_y, end_y)
+        ))
+        self._cull_edges(force=True)
+        
+    def _cull_edges(self, force=False):
+        """Rebuild the edge paths from only the edges inside the viewport
+        
+        Nodes are culled by the scene's item index, but the aggregated edge
+        items always intersect the view, so without this every edge in the
+        tree would be stroked on each repaint.
+        
+        The viewport is inflated by CULL_MARGIN, and nothing is recomputed
+        while the viewport stays inside the last culled area.
+        
+        Args:
+            force: Rebuild even if the set of visible edges hasn't changed
+        """
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        if not force and self._cull_rect.contains(visible):
+            return
+        margin = self.CULL_MARGIN
+        cull_rect = self._cull_rect = visible.adjusted(-margin, -margin, margin, margin)
+        
+        bounds = self._edge_bounds
+        mask = ((bounds[:, 2] >= cull_rect.left()) & (bounds[:, 0] <= cull_rect.right()) &
+                (bounds[:, 3] >= cull_rect.top()) & (bounds[:, 1] <= cull_rect.bottom()))
+        if not force and np.array_equal(mask, self._edge_mask):
+            return
+        self._edge_mask = mask
+        
+        path = QPainterPath()
+        highlight_path = QPainterPath()
+        curves = self._edge_curves[mask].tolist()
+        for highlighted, (start_x, start_y, ctrl1_y, ctrl2_y, end_x, end_y) in zip(
+                self._edge_highlight[mask].tolist(), curves):
+            # Add curved subpath to the matching edge path
+            target = highlight_path if highlighted else path
+            target.moveTo(start_x, start_y)
+            target.cubicTo(start_x, ctrl1_y, end_x, ctrl2_y, end_x, end_y)
+            
+        self._edges_item.setPath(path)
+        self._highlight_edges_item.setPath(highlight_path)
+        
+    def scrollContentsBy(self, dx, dy):
+        """Re-cull edges when the view scrolls"""
+        super().scrollContentsBy(dx, dy)
+        self._cull_edges()
+        
+    def resizeEvent(self, event):
+        """Re-cull edges when the viewport is resized"""
+        super().resizeEvent(event)
+        self._cull_edges()
     
     def focus_on_branch(self, root_node_id):
         """Programmatically focus on a specific branch
@@ -1086,14 +1892,15 @@ class ConversationTreeView(QGraphicsView):
         self.update_navigation_indicators()
         
         # Update minimap
-        self.minimap.update_minimap()
+        self._schedule_minimap_update()
         
     def update_navigation_indicators(self):
         """Update navigation indicators on nodes"""
-        # Clear all existing indicators
-        for node in self.nodes.values():
-            if hasattr(node, 'add_navigation_indicator'):
-                node.add_navigation_indicator(None)
+        # Clear existing indicators; only the previous current node's
+        # children can carry one
+        for node in self._indicator_nodes:
+            node.add_navigation_indicator(None)
+        self._indicator_nodes = []
         
         # Add indicators to children of current node
         if self.current_node_id and self.current_node_id in self.nodes:
@@ -1101,8 +1908,8 @@ class ConversationTreeView(QGraphicsView):
             for i, child_id in enumerate(current_node.children):
                 if child_id in self.nodes:
                     child = self.nodes[child_id]
-                    if hasattr(child, 'add_navigation_indicator'):
-                        child.add_navigation_indicator(i + 1)
+                    child.add_navigation_indicator(i + 1)
+                    self._indicator_nodes.append(child)
     
     def show_only_branch(self, root_node_id, levels=2):
         """Show only a specific branch up to specified levels
@@ -1125,40 +1932,48 @@ class ConversationTreeView(QGraphicsView):
             root_node_id: ID of the root node of the branch to show
             levels: Number of levels to show (0 = just the root node)
         """
-        # Reset visibility of all nodes
-        for node in self.nodes.values():
-            node.setVisible(False)
-            
-        # Show the specified branch
-        self._show_branch_recursive(root_node_id, 0, levels)
+        # Show the specified branch and hide everything else, only touching
+        # nodes whose visibility actually changes
+        branch = self._branch_node_ids(root_node_id, levels)
+        for node_id, node in self.nodes.items():
+            visible = node_id in branch
+            if node.isVisible() != visible:
+                node.setVisible(visible)
         
         # Update edges
         self._update_all_edges()
         
         # Update minimap
-        self.minimap.update_minimap()
+        self.minimap.mark_dirty()
+        self._schedule_minimap_update()
     
-    def _show_branch_recursive(self, node_id, current_level, max_levels):
-        """Recursively show nodes in a branch
+    def _branch_node_ids(self, root_node_id, max_levels):
+        """Collect the nodes in a branch
         
-        Helper method for show_only_branch that recursively shows nodes
-        up to the specified maximum level.
+        Helper method for show_only_branch that gathers nodes up to the
+        specified maximum level below the branch root.
         
         Args:
-            node_id: ID of the current node
-            current_level: Current depth level (0 for root)
-            max_levels: Maximum depth to show
+            root_node_id: ID of the branch root
+            max_levels: Maximum depth to include
+            
+        Returns:
+            Set of node IDs in the branch
         """
-        if node_id not in self.nodes or current_level > max_levels:
-            return
+        branch = set()
+        stack = [(root_node_id, 0)]  # (node_id, level below the branch root)
+        while stack:
+            node_id, level = stack.pop()
+            node = self.nodes.get(node_id)
+            if not node:
+                continue
+                
+            branch.add(node_id)
             
-        # Show this node
-        self.nodes[node_id].setVisible(True)
-        
-        # Show children if not at max level
-        if current_level < max_levels:
-            for child_id in self.nodes[node_id].children:
-                self._show_branch_recursive(child_id, current_level + 1, max_levels)
+            # Include children if not at max level
+            if level < max_levels:
+                stack.extend((child_id, level + 1) for child_id in node.children)
+        return branch
 
 class SuggestedResponseWidget(QFrame):
     """Widget for displaying suggested responses"""
@@ -1251,12 +2066,9 @@ class SuggestedResponseWidget(QFrame):
     
     def _copy_to_clipboard(self, text):
         """Copy text to clipboard"""
-        from PyQt6.QtWidgets import QApplication
         QApplication.clipboard().setText(text)
         
         # Show feedback when text is copied
-        from PyQt6.QtWidgets import QToolTip
-        from PyQt6.QtGui import QCursor
         QToolTip.showText(QCursor.pos(), "Copied to clipboard!", None, 2000)
     
     def _get_confidence_color(self, confidence):
@@ -1288,11 +2100,67 @@ class SuggestedResponseWidget(QFrame):
 class ConversationCompassWidget(QWidget):
     """Main widget for the Conversation Compass feature"""
     
+    # Session modes, as stored in the setup result's 'mode'
+    MODE_TRACKING = 0
+    MODE_GUIDANCE = 1
+    MODE_PREPARATION = 2
+    
+    # Starting branches for initialize_tree by conversation type, as
+    # (node_id, parent_id, text, node_type, x, y) rows for add_nodes_bulk
+    _FALLBACK_BRANCHES = {
+        "Sales Conversation": (
+            ("intro", "root", "Introduction and rapport building", "statement", -200, 100),
+            ("needs", "root", "Discover needs and pain points", "question", 0, 100),
+            ("present", "root", "Present solution", "statement", 200, 100),
+            ("objection1", "present", "Price objection", "objection", 100, 200),
+            ("decision", "present", "Decision point", "decision", 300, 200),
+        ),
+    }
+    
+    # Status label stylesheets by message type
+    _STATUS_STYLES = {
+        "success": "color: #4CAF50; font-weight: bold;",  # Green
+        "warning": "color: #FF9800; font-weight: bold;",  # Orange
+        "error": "color: #F44336; font-weight: bold;",    # Red
+        "info": "color: #2196F3; font-weight: bold;",     # Blue
+    }
+    
+    # Stylesheet last applied to the status label
+    _status_style = None
+    
+    # Floating notification stylesheets by message type, from
+    # (background, border, text) colors
+    _NOTIFICATION_STYLES = {
+        message_type: f"""
+                background-color: {bg_color};
+                color: {text_color};
+                border: 1px solid {border_color};
+                border-radius: 4px;
+                padding: 8px 12px;
+                font-weight: bold;
+            """
+        for message_type, (bg_color, border_color, text_color) in {
+            "success": ("#E8F5E9", "#4CAF50", "#2E7D32"),
+            "warning": ("#FFF3E0", "#FF9800", "#E65100"),
+            "error": ("#FFEBEE", "#F44336", "#C62828"),
+        }.items()
+    }
+    
     def __init__(self, parent=None, langchain_service=None):
         super().__init__(parent)
         self.langchain_service = langchain_service
         self.current_session = None
         self.tree_service = None
+        self.active_mode = self.MODE_TRACKING
+        self._is_guidance_mode = False
+        self._rendered_nodes = {}  # node_id -> tree service node shown in the tree view
+        self._notification = None  # Floating notification label, created on first use
+        
+        # Coalesces bursts of update_navigation_options calls into one refresh
+        self._nav_update_timer = QTimer(self)
+        self._nav_update_timer.setSingleShot(True)
+        self._nav_update_timer.setInterval(50)
+        self._nav_update_timer.timeout.connect(self._do_update_navigation_options)
         
         self.init_ui()
         
@@ -1358,6 +2226,9 @@ class ConversationCompassWidget(QWidget):
         export_action = options_menu.addAction("Export Tree", self.export_tree)
         export_action.setToolTip("Export the conversation tree in a different format")
         
+        clear_cache_action = options_menu.addAction("Clear Suggestion Cache", self.clear_suggestion_cache)
+        clear_cache_action.setToolTip("Delete suggestions saved from earlier conversations")
+        
         settings_action = options_menu.addAction("Settings", self.show_settings)
         settings_action.setToolTip("Configure conversation compass settings")
         self.options_btn.setMenu(options_menu)
@@ -1368,6 +2239,7 @@ class ConversationCompassWidget(QWidget):
         
         # Main content area with splitter
         splitter = QSplitter(Qt.Orientation.Horizontal)
+        self._splitter = splitter
         
         # Tree view container (to allow for minimap overlay)
         tree_container = QWidget()
@@ -1390,6 +2262,7 @@ class ConversationCompassWidget(QWidget):
         # Right panel with suggested responses
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
+        self._right_panel = right_panel
         
         # Current position
         self.position_label = QLabel("Current Position: Not started")
@@ -1433,25 +2306,67 @@ class ConversationCompassWidget(QWidget):
         # Initially hide the splitter until a session is started
         splitter.setVisible(False)
     
+    def _open_suggestion_cache(self):
+        """Open the persistent suggestion cache, or None if it is unavailable"""
+        from qt_version.services.suggestion_disk_cache import SuggestionDiskCache
+        
+        try:
+            return SuggestionDiskCache()
+        except Exception as e:
+            logger.warning("Suggestion disk cache unavailable: %s", e)
+            return None
+            
+    def _open_suggestion_embedder(self):
+        """Embeddings for the semantic suggestion cache, or None unless enabled
+        
+        Off by default: it sends every utterance to the embeddings provider.
+        """
+        from qt_version.utils.settings_manager import SettingsManager
+        
+        try:
+            if SettingsManager().get_setting('compass_semantic_cache', 'false').lower() != 'true':
+                return None
+            from langchain_openai import OpenAIEmbeddings
+            return OpenAIEmbeddings(model="text-embedding-3-small")
+        except Exception as e:
+            logger.warning("Semantic suggestion cache unavailable: %s", e)
+            return None
+            
+    def clear_suggestion_cache(self):
+        """Delete the suggestions cached from earlier LLM responses"""
+        if self.tree_service:
+            self.tree_service.clear_suggestion_cache()
+        else:
+            disk_cache = self._open_suggestion_cache()
+            if disk_cache:
+                disk_cache.clear()
+                disk_cache.close()
+        self._show_status_message("Suggestion cache cleared", "success")
+    
     def _initialize_tree_service(self):
         """Initialize the conversation tree service"""
         # Import here to avoid circular imports
         from qt_version.services.conversation_tree_service import ConversationTreeService
         
         try:
-            self.tree_service = ConversationTreeService(self.langchain_service)
+            self.tree_service = ConversationTreeService(
+                self.langchain_service,
+                disk_cache=self._open_suggestion_cache(),
+                embedder=self._open_suggestion_embedder()
+            )
             
             # Connect signals
             self.tree_service.tree_updated.connect(self._on_tree_updated)
             self.tree_service.node_added.connect(self._on_node_added)
             self.tree_service.suggestions_ready.connect(self._on_suggestions_ready)
+            self.tree_service.suggestions_batch_ready.connect(self._on_suggestions_batch_ready)
             self.tree_service.error_occurred.connect(self._on_error)
             if hasattr(self.tree_service, 'current_position_changed'):
                 self.tree_service.current_position_changed.connect(self._on_position_changed)
                 
-            print("Tree service initialized successfully")
+            logger.debug("Tree service initialized successfully")
         except Exception as e:
-            print(f"Error initializing tree service: {str(e)}")
+            logger.exception("Error initializing tree service")
             if hasattr(self, 'error_occurred'):
                 self.error_occurred.emit(f"Error initializing tree service: {str(e)}")
             else:
@@ -1461,15 +2376,16 @@ class ConversationCompassWidget(QWidget):
     def start_new_session(self):
         """Start a new conversation compass session"""
         try:
-            print("Starting new conversation compass session")
+            logger.debug("Starting new conversation compass session")
             dialog = ConversationCompassSetupDialog(self, self.langchain_service)
             if dialog.exec():
                 # Get setup result
                 self.current_session = dialog.get_setup_result()
-                print(f"Session setup completed: {self.current_session}")
+                logger.debug("Session setup completed: %s", self.current_session)
                 
                 # Get the selected mode
-                self.active_mode = self.current_session.get('mode', 0)
+                self.active_mode = self.current_session.get('mode', self.MODE_TRACKING)
+                self._is_guidance_mode = self.active_mode == self.MODE_GUIDANCE
                 mode_names = ["Tracking", "Guidance", "Preparation", "Analysis"]
                 mode_name = mode_names[self.active_mode]
                 
@@ -1501,16 +2417,15 @@ class ConversationCompassWidget(QWidget):
                 """)
                 
                 # Show content and hide empty state
-                self.findChild(QSplitter).setVisible(True)
+                self._splitter.setVisible(True)
                 self.empty_label.setVisible(False)
                 
                 # Initialize tree service
                 if not self.tree_service:
-                    print("Initializing tree service")
+                    logger.debug("Initializing tree service")
                     try:
                         self._initialize_tree_service()
                     except Exception as e:
-                        print(f"Error initializing tree service: {str(e)}")
                         self._show_status_message(f"Error initializing tree service: {str(e)}", "error")
                         return
                         
@@ -1530,39 +2445,41 @@ class ConversationCompassWidget(QWidget):
                         "mode": self.active_mode  # Use the selected mode
                     }
                     
-                    print(f"Creating new conversation with context: {context}")
+                    logger.debug("Creating new conversation with context: %s", context)
                     try:
                         success = self.tree_service.create_new_conversation(context)
                         if success:
                             self.position_label.setText("Current Position: Starting the conversation")
-                            print("Conversation created successfully")
+                            logger.debug("Conversation created successfully")
                             
                             # For Guidance and Preparation modes, pre-generate initial suggestions
-                            if self.active_mode in [1, 2]:  # Guidance or Preparation
+                            if self.active_mode in (self.MODE_GUIDANCE, self.MODE_PREPARATION):
                                 self._show_status_message("Generating initial conversation paths...", "info")
                                 self._generate_suggestions_for_current_node()
                                 
                                 # For Preparation mode, generate more extensive paths
-                                if self.active_mode == 2:
+                                if self.active_mode == self.MODE_PREPARATION:
                                     self._generate_deeper_conversation_paths()
                         else:
                             self.position_label.setText("Failed to create conversation")
-                            print("Failed to create conversation")
+                            logger.warning("Failed to create conversation")
                     except Exception as e:
-                        print(f"Error creating conversation: {str(e)}")
+                        logger.exception("Error creating conversation")
                         self._show_status_message(f"Error creating conversation: {str(e)}", "error")
                 else:
                     # Fallback to static initialization if tree service fails
-                    print("Tree service not available, using fallback initialization")
+                    logger.warning("Tree service not available, using fallback initialization")
                     self.initialize_tree()
         except Exception as e:
-            print(f"Error in start_new_session: {str(e)}")
+            logger.exception("Error in start_new_session")
             self._show_status_message(f"Error starting session: {str(e)}", "error")
     
     def initialize_tree(self):
         """Initialize the conversation tree based on current session (fallback method)"""
         # Clear existing tree
+        self.tree_view.begin_batch_update()
         self.tree_view.clear_tree()
+        self._rendered_nodes = {}
         
         # Create root node
         root = self.tree_view.add_node(
@@ -1574,47 +2491,12 @@ class ConversationCompassWidget(QWidget):
         )
         
         # Add initial branches based on session type
-        if self.current_session['conversation_type'] == "Sales Conversation":
-            self.tree_view.add_node(
-                "intro", 
-                "root", 
-                "Introduction and rapport building", 
-                "statement",
-                -200, 100
-            )
-            self.tree_view.add_node(
-                "needs", 
-                "root", 
-                "Discover needs and pain points", 
-                "question",
-                0, 100
-            )
-            self.tree_view.add_node(
-                "present", 
-                "root", 
-                "Present solution", 
-                "statement",
-                200, 100
-            )
-            
-            # Add some child nodes
-            self.tree_view.add_node(
-                "objection1", 
-                "present", 
-                "Price objection", 
-                "objection",
-                100, 200
-            )
-            self.tree_view.add_node(
-                "decision", 
-                "present", 
-                "Decision point", 
-                "decision",
-                300, 200
-            )
+        branches = self._FALLBACK_BRANCHES.get(self.current_session['conversation_type'])
+        if branches:
+            self.tree_view.add_nodes_bulk(branches)
         
         # Layout the tree
-        self.tree_view.layout_tree()
+        self.tree_view.end_batch_update()
         
         # Set current node
         self.tree_view.set_current_node("root")
@@ -1651,10 +2533,7 @@ class ConversationCompassWidget(QWidget):
         self.tree_view.set_current_node(node.node_id)
         
         # Get node text
-        if hasattr(node, 'speaker') and node.speaker:
-            position_text = f"{node.speaker}: {node.content}"
-        else:
-            position_text = node.text_item.toPlainText()
+        position_text = f"{node.speaker}: {node.content}" if node.speaker else node.plain_text()
             
         self.position_label.setText(f"Current Position: {position_text[:50]}...")
         
@@ -1707,7 +2586,7 @@ class ConversationCompassWidget(QWidget):
                 self._show_status_message(f"Added response from {speaker}", "success")
                 
                 # For Guidance mode, generate new suggestions after selecting a response
-                if hasattr(self, 'active_mode') and self.active_mode == 1:  # Guidance mode
+                if self._is_guidance_mode:
                     self._generate_suggestions_for_current_node()
         else:
             # Fallback behavior
@@ -1763,19 +2642,18 @@ class ConversationCompassWidget(QWidget):
         """Reset the tree view to default zoom and position"""
         self._show_status_message("Resetting view...", "info")
         self.tree_view.resetTransform()
+        self.tree_view.update_level_of_detail()
         self.tree_view.centerOn(0, 0)
         self._show_status_message("View reset to default", "success")
     
     def save_conversation_tree(self):
         """Save the current conversation tree to a file"""
         if not self.tree_service or not hasattr(self.tree_service, 'save_tree'):
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Save Failed", "Tree service not initialized or doesn't support saving")
             self._show_status_message("Save failed: Tree service not available", "error")
             return
             
         # Get file path from user
-        from PyQt6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Conversation Tree",
@@ -1796,24 +2674,20 @@ class ConversationCompassWidget(QWidget):
                 self.position_label.setText(f"Tree saved to {file_path}")
                 self._show_status_message("Tree saved successfully", "success")
             else:
-                from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.warning(self, "Save Failed", "Failed to save conversation tree")
                 self._show_status_message("Failed to save tree", "error")
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Error saving tree: {str(e)}")
             self._show_status_message(f"Error saving tree: {str(e)}", "error")
 
     def load_conversation_tree(self):
         """Load a conversation tree from a file"""
         if not self.tree_service or not hasattr(self.tree_service, 'load_tree'):
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Load Failed", "Tree service not initialized or doesn't support loading")
             self._show_status_message("Load failed: Tree service not available", "error")
             return
             
         # Get file path from user
-        from PyQt6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Load Conversation Tree",
@@ -1835,11 +2709,9 @@ class ConversationCompassWidget(QWidget):
                 self._update_visualization()
                 self._show_status_message("Tree loaded successfully", "success")
             else:
-                from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.warning(self, "Load Failed", "Failed to load conversation tree")
                 self._show_status_message("Failed to load tree", "error")
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Error loading tree: {str(e)}")
             self._show_status_message(f"Error loading tree: {str(e)}", "error")
             
@@ -1847,7 +2719,6 @@ class ConversationCompassWidget(QWidget):
         """Export the conversation tree"""
         # If using tree service, use its export functionality
         if self.tree_service:
-            from PyQt6.QtWidgets import QFileDialog
             file_path, _ = QFileDialog.getSaveFileName(
                 self, "Export Conversation Tree", "", "JSON Files (*.json)"
             )
@@ -1855,7 +2726,6 @@ class ConversationCompassWidget(QWidget):
                 self._show_status_message(f"Exporting tree to {file_path}...", "info")
                 success = self.tree_service.save_tree(file_path)
                 if success:
-                    from PyQt6.QtWidgets import QMessageBox
                     QMessageBox.information(self, "Export Successful", 
                                           f"Conversation tree exported to {file_path}")
                     self._show_status_message("Tree exported successfully", "success")
@@ -1863,7 +2733,6 @@ class ConversationCompassWidget(QWidget):
                     self._show_status_message("Failed to export tree", "error")
         else:
             # Fallback message
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.information(self, "Export Tree", "Tree export not implemented yet")
             self._show_status_message("Tree export not implemented yet", "warning")
     
@@ -1871,14 +2740,13 @@ class ConversationCompassWidget(QWidget):
         """Show settings dialog"""
         # This would show a settings dialog
         # For now, just show a message
-        from PyQt6.QtWidgets import QMessageBox
         QMessageBox.information(self, "Settings", "Settings dialog not implemented yet")
         self._show_status_message("Settings dialog not implemented yet", "info")
         
     def _on_tree_updated(self):
         """Handle tree updated signal"""
-        # Update visualization
-        self._update_visualization()
+        # Update visualization with just the nodes added since last time
+        self._update_visualization(self.tree_service.take_added_nodes())
         
     def _on_node_added(self, node_id):
         """Handle node added signal"""
@@ -1886,10 +2754,16 @@ class ConversationCompassWidget(QWidget):
         if self.tree_service:
             node = self.tree_service.get_node(node_id)
             if node:
-                self.position_label.setText(f"Added: {node.speaker}: {node.content[:30]}...")
+                self.position_label.setText(f"Added: {node.speaker}: {node.tiny_label}...")
+                
+                # Show just this node; tree_updated adds anything else
+                if node_id not in self._rendered_nodes and (
+                        not node.parent_id or node.parent_id in self._rendered_nodes):
+                    self._render_node(node_id, node)
+                    self.tree_view.request_layout()
                 
                 # For Guidance mode, generate new suggestions based on this node
-                if hasattr(self, 'active_mode') and self.active_mode == 1:  # Guidance mode
+                if self._is_guidance_mode:
                     self._generate_suggestions_for_current_node()
         
     def _on_suggestions_ready(self, suggestions):
@@ -1908,41 +2782,72 @@ class ConversationCompassWidget(QWidget):
             node = self.tree_service.get_node(node_id)
             if node:
                 # Update position label
-                if hasattr(node, 'speaker') and node.speaker:
-                    position_text = f"{node.speaker}: {node.content}"
-                else:
-                    position_text = node.content
-                    
-                self.position_label.setText(f"Current Position: {position_text[:50]}...")
+                self.position_label.setText(f"Current Position: {node.display_label[:50]}...")
                 
                 # Update tree view
                 self.tree_view.set_current_node(node_id)
         
-    def _update_visualization(self):
-        """Update the tree visualization"""
+    def _update_visualization(self, added_ids=None):
+        """Update the tree visualization
+        
+        Args:
+            added_ids: IDs of service nodes added since the last update, from
+                take_added_nodes, or None to compare against the whole tree
+        """
         if not self.tree_service:
             return
-            
-        # Clear existing visualization
-        self.tree_view.clear_tree()
+        service_nodes = self.tree_service.nodes
         
-        # Add all nodes to the visualization
-        for node_id, node in self.tree_service.nodes.items():
-            self.tree_view.add_node(
-                node_id=node_id,
-                parent_id=node.parent_id,
-                text=node.content,
-                node_type=node.node_type,
-                speaker=node.speaker
+        # The tree view was changed behind our back, e.g. by initialize_tree
+        rebuild = len(self.tree_view.nodes) != len(self._rendered_nodes)
+        
+        if added_ids is not None and not rebuild:
+            # Only look at the nodes the service reports as added
+            added = [
+                (node_id, service_nodes[node_id]) for node_id in added_ids
+                if node_id in service_nodes and node_id not in self._rendered_nodes
+            ]
+        else:
+            # Rebuild from scratch if shown nodes were removed or replaced,
+            # e.g. by loading a tree; otherwise only add the new ones
+            rebuild = rebuild or any(
+                service_nodes.get(node_id) is not node
+                for node_id, node in self._rendered_nodes.items()
             )
-            
-        # Layout the tree with the improved algorithm
-        self.tree_view.layout_tree()
+            if rebuild:
+                self._rendered_nodes = {}
+                
+            # Nodes are stored in creation order, so parents come first
+            added = [
+                (node_id, node) for node_id, node in service_nodes.items()
+                if node_id not in self._rendered_nodes
+            ]
+        
+        if rebuild or added:
+            self.tree_view.begin_batch_update()
+            if rebuild:
+                self.tree_view.clear_tree()
+            for node_id, node in added:
+                self._render_node(node_id, node)
+                
+            # Layout the tree with the improved algorithm
+            self.tree_view.end_batch_update()
         
         # Set current node
         if self.tree_service.current_node_id:
             self.tree_view.set_current_node(self.tree_service.current_node_id)
             
+    def _render_node(self, node_id, node):
+        """Add a tree service node to the tree view"""
+        self.tree_view.add_node(
+            node_id=node_id,
+            parent_id=node.parent_id,
+            text=node.content,
+            node_type=node.node_type,
+            speaker=node.speaker
+        )
+        self._rendered_nodes[node_id] = node
+            
     def _generate_suggestions_for_current_node(self):
         """Generate suggestions for the current node based on active mode"""
         if not self.tree_service or not self.tree_service.current_node_id:
@@ -1955,7 +2860,7 @@ class ConversationCompassWidget(QWidget):
         if hasattr(self.tree_service, '_generate_suggestions_for_current_node'):
             self.tree_service._generate_suggestions_for_current_node()
         else:
-            print("Tree service doesn't have _generate_suggestions_for_current_node method")
+            logger.warning("Tree service doesn't have _generate_suggestions_for_current_node method")
             
     def _generate_deeper_conversation_paths(self):
         """Generate deeper conversation paths for Preparation mode"""
@@ -1963,7 +2868,7 @@ class ConversationCompassWidget(QWidget):
             return
             
         # Only for Preparation mode
-        if not hasattr(self, 'active_mode') or self.active_mode != 2:
+        if self.active_mode != self.MODE_PREPARATION:
             return
             
         # Show loading state
@@ -1974,35 +2879,29 @@ class ConversationCompassWidget(QWidget):
         if not current_node:
             return
             
-        # Generate suggestions for each child node
-        for child_id in current_node.children:
-            # Temporarily set current node to child
-            original_node_id = self.tree_service.current_node_id
-            self.tree_service.set_current_node(child_id)
-            
-            # Generate suggestions for this child
-            if hasattr(self.tree_service, '_generate_suggestions_for_current_node'):
-                self.tree_service._generate_suggestions_for_current_node()
-                
-            # Restore original current node
-            self.tree_service.set_current_node(original_node_id)
-            
-        # Update visualization
-        self._update_visualization()
+        # Generate suggestions for all children in one background batch; the
+        # service emits tree_updated once, which refreshes the visualization,
+        # then suggestions_batch_ready
+        self.tree_service.generate_suggestions_batch(list(current_node.children))
         
-        # Show completion message
+    def _on_suggestions_batch_ready(self, node_ids):
+        """Handle a finished generate_suggestions_batch call"""
+        if not node_ids:
+            # The tree was replaced before the batch finished
+            self._show_status_message("Ready", "info")
+            return
         self._show_status_message("Deeper conversation paths generated", "success")
             
     def _on_node_collapsed(self, node_id, is_collapsed):
         """Handle when a node is collapsed or expanded"""
         # Update the tree layout
-        self.tree_view.layout_tree()
+        self.tree_view.request_layout()
         
         # Update status
         node = self.tree_service.get_node(node_id) if self.tree_service else None
         if node:
             action = "collapsed" if is_collapsed else "expanded"
-            self.position_label.setText(f"Node {action}: {node.content[:30]}...")
+            self.position_label.setText(f"Node {action}: {node.tiny_label}...")
             self._show_status_message(f"Node {action}", "info")
             
         # Update navigation options
@@ -2020,51 +2919,30 @@ class ConversationCompassWidget(QWidget):
         if self.status_label:
             self.status_label.setText(message)
             
-            # Set color based on message type
-            if message_type == "success":
-                self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")  # Green
-            elif message_type == "warning":
-                self.status_label.setStyleSheet("color: #FF9800; font-weight: bold;")  # Orange
-            elif message_type == "error":
-                self.status_label.setStyleSheet("color: #F44336; font-weight: bold;")  # Red
-            else:  # info
-                self.status_label.setStyleSheet("color: #2196F3; font-weight: bold;")  # Blue
+            # Set color based on message type, skipping the stylesheet
+            # re-parse when it hasn't changed
+            style = self._STATUS_STYLES.get(message_type, self._STATUS_STYLES["info"])
+            if style is not self._status_style:
+                self.status_label.setStyleSheet(style)
+                self._status_style = style
                 
-        # Create a temporary floating notification for important messages
-        if message_type in ["success", "error", "warning"]:
-            from PyQt6.QtWidgets import QLabel
-            from PyQt6.QtCore import Qt, QTimer
-            
-            notification = QLabel(message, self)
-            
-            # Style based on message type
-            if message_type == "success":
-                bg_color = "#E8F5E9"
-                border_color = "#4CAF50"
-                text_color = "#2E7D32"
-            elif message_type == "warning":
-                bg_color = "#FFF3E0"
-                border_color = "#FF9800"
-                text_color = "#E65100"
-            elif message_type == "error":
-                bg_color = "#FFEBEE"
-                border_color = "#F44336"
-                text_color = "#C62828"
-            else:  # info
-                bg_color = "#E3F2FD"
-                border_color = "#2196F3"
-                text_color = "#0D47A1"
-                
-            notification.setStyleSheet(f"""
-                background-color: {bg_color};
-                color: {text_color};
-                border: 1px solid {border_color};
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-weight: bold;
-            """)
-            
-            notification.setWindowFlags(Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint)
+        # Show a temporary floating notification for important messages,
+        # reusing one label since only the latest message matters
+        style = self._NOTIFICATION_STYLES.get(message_type)
+        if style:
+            if self._notification is None:
+                self._notification = QLabel(self)
+                self._notification.setWindowFlags(Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint)
+                self._notification_style = None
+                self._notification_timer = QTimer(self)
+                self._notification_timer.setSingleShot(True)
+                self._notification_timer.timeout.connect(self._notification.hide)
+            notification = self._notification
+            
+            notification.setText(message)
+            if style is not self._notification_style:
+                notification.setStyleSheet(style)
+                self._notification_style = style
             notification.adjustSize()
             
             # Position at the bottom of the widget
@@ -2074,8 +2952,8 @@ class ConversationCompassWidget(QWidget):
             
             notification.show()
             
-            # Auto-hide after 2 seconds
-            QTimer.singleShot(2000, notification.deleteLater)
+            # Auto-hide after 2 seconds, restarting for each new message
+            self._notification_timer.start(2000)
                 
     def focus_on_node(self, node_id):
         """Focus the tree view on a specific node
@@ -2159,8 +3037,9 @@ class ConversationCompassWidget(QWidget):
         # Get the most recent text (last few sentences)
         recent_text = self._get_recent_text(text)
         
-        # Check for number triggers (e.g., "option 1", "number 2")
-        if self._check_for_number_triggers(recent_text):
+        # Check for number triggers (e.g., "option 1", "number 2"), which
+        # all need a digit
+        if not _DIGITS.isdisjoint(recent_text) and self._check_for_number_triggers(recent_text):
             return True
             
         # Check for keyword triggers
@@ -2177,21 +3056,21 @@ class ConversationCompassWidget(QWidget):
     
     def _check_for_number_triggers(self, text):
         """Check for number triggers in text"""
-        import re
-        
-        # Look for patterns like "option 1", "number 2", "choice 3", or just "1", "2", "3"
-        patterns = [
-            r'option\s+(\d+)',
-            r'number\s+(\d+)',
-            r'choice\s+(\d+)',
-            r'\b(\d+)\b'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                number = matches[-1]  # Take the last match if multiple
-                return self._navigate_by_number(int(number))
+        
+        # Look for patterns like "option 1", "number 2", "choice 3", or just "1", "2", "3",
+        # keeping the last match of each kind (None for a bare number)
+        last = {}
+        for match in _NUMBER_TRIGGER.finditer(text):
+            kind = match.group('kind')
+            if kind:
+                last[kind.lower()] = match.group('num')
+            else:
+                last[None] = match.group('bare')
+                
+        # Keyword triggers win over bare numbers, in the original pattern order
+        for kind in _NUMBER_TRIGGER_PRIORITY:
+            if kind in last:
+                return self._navigate_by_number(int(last[kind]))
                 
         return False
     
@@ -2218,11 +3097,11 @@ class ConversationCompassWidget(QWidget):
                     return True
         
         # Fallback: Look for nodes with this number in their content
-        for node_id, node in self.tree_view.nodes.items():
-            if f"Option {number}" in node.content or f"#{number}" in node.content:
-                self._show_status_message(f"Found node with option {number}", "info")
-                self.focus_on_node(node_id)
-                return True
+        node_id = self.tree_view.find_option_node(number)
+        if node_id is not None:
+            self._show_status_message(f"Found node with option {number}", "info")
+            self.focus_on_node(node_id)
+            return True
                 
         self._show_status_message(f"No option {number} found", "warning")
         return False
@@ -2236,21 +3115,13 @@ class ConversationCompassWidget(QWidget):
         Returns:
             bool: True if a keyword was found and navigation occurred, False otherwise
         """
-        # Define keywords for different node types
-        keywords = {
-            "question": ["question", "ask", "inquiry", "wondering"],
-            "decision": ["decide", "decision", "choose", "select", "option"],
-            "objection": ["object", "concern", "issue", "problem", "disagree"],
-            "statement": ["statement", "point", "mention", "note"]
-        }
-        
-        # Check each keyword category
-        for node_type, word_list in keywords.items():
-            for word in word_list:
-                if word.lower() in text.lower():
-                    return self._navigate_by_keyword(word, node_type)
-                    
-        return False
+        # Find every keyword in one pass, then take the one listed first
+        found = set(_KEYWORD_PATTERN.findall(text.lower()))
+        if not found:
+            return False
+            
+        word = min(found, key=_KEYWORD_RANKS.__getitem__)
+        return self._navigate_by_keyword(word, _KEYWORD_RANKS[word][1])
     
     def _navigate_by_keyword(self, keyword, node_type):
         """Navigate the tree based on a keyword trigger
@@ -2262,12 +3133,8 @@ class ConversationCompassWidget(QWidget):
         Returns:
             bool: True if navigation was successful, False otherwise
         """
-        # Find nodes of this type
-        matching_nodes = []
-        
-        for node_id, node in self.tree_view.nodes.items():
-            if node.node_type == node_type or keyword.lower() in node.content.lower():
-                matching_nodes.append(node_id)
+        # Find nodes of this type or mentioning the keyword
+        matching_nodes = self.tree_view.find_nodes(node_type, keyword)
                 
         if matching_nodes:
             # Navigate to the first matching node
@@ -2280,8 +3147,9 @@ class ConversationCompassWidget(QWidget):
         
     def _create_navigation_panel(self):
         """Create a panel showing available navigation options"""
-        from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QSplitter
-        
+        if hasattr(self, 'nav_panel'):
+            return
+            
         # Create panel
         self.nav_panel = QFrame()
         self.nav_panel.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
@@ -2303,20 +3171,27 @@ class ConversationCompassWidget(QWidget):
         self.nav_options_layout = QVBoxLayout()
         layout.addLayout(self.nav_options_layout)
         
-        # Add to right panel (assuming there's a right panel in the splitter)
-        right_panel = None
-        splitter = self.findChild(QSplitter)
-        if splitter:
-            for i in range(splitter.count()):
-                widget = splitter.widget(i)
-                if i > 0:  # Assuming right panel is not the first widget
-                    right_panel = widget
-                    break
-                
-            if right_panel and hasattr(right_panel, 'layout'):
-                right_panel.layout().addWidget(self.nav_panel)
+        # Shown instead of the option rows when there are none
+        self._no_nav_options = QLabel("No navigation options available")
+        self._no_nav_options.setStyleSheet("color: #999; font-style: italic;")
+        self.nav_options_layout.addWidget(self._no_nav_options)
+        
+        # Option rows, reused across updates, as (row, num_btn, content_label),
+        # and the node id each row's button navigates to
+        self._nav_rows = []
+        self._nav_option_ids = []
+        
+        # Add to the right panel of the splitter
+        self._right_panel.layout().addWidget(self.nav_panel)
         
     def update_navigation_options(self):
+        """Schedule an update of the navigation options panel
+        
+        Calls within 50 ms of each other are coalesced into one update.
+        """
+        self._nav_update_timer.start()
+        
+    def _do_update_navigation_options(self):
         """Update the navigation options panel"""
         if not hasattr(self, 'nav_panel'):
             self._create_navigation_panel()
@@ -2324,12 +3199,6 @@ class ConversationCompassWidget(QWidget):
         if not hasattr(self, 'nav_options_layout'):
             return
             
-        # Clear existing options
-        while self.nav_options_layout.count():
-            item = self.nav_options_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-                
         # Get options from tree service
         options = []
         if hasattr(self, 'tree_service') and self.tree_service:
@@ -2367,31 +3236,50 @@ class ConversationCompassWidget(QWidget):
                             "type": child.node_type
                         })
                         
-        # Add options to panel
-        from PyQt6.QtWidgets import QLabel, QHBoxLayout, QPushButton
-        
-        if options:
-            for option in options:
-                # Create option row
-                option_layout = QHBoxLayout()
-                
-                # Number button
-                num_btn = QPushButton(str(option["number"]))
-                num_btn.setMaximumWidth(30)
-                num_btn.clicked.connect(lambda checked=False, id=option["node_id"]: self.focus_on_node(id))
-                option_layout.addWidget(num_btn)
-                
-                # Content label
-                content = option["content"]
-                if len(content) > 40:
-                    content = content[:37] + "..."
-                content_label = QLabel(content)
-                content_label.setWordWrap(True)
-                option_layout.addWidget(content_label, 1)
+        # Create rows only when there are more options than ever before
+        while len(self._nav_rows) < len(options):
+            self._nav_rows.append(self._create_navigation_row(len(self._nav_rows)))
+            
+        # Update the rows in place, hiding the ones not needed
+        self._nav_option_ids = [option["node_id"] for option in options]
+        for i, (row, num_btn, content_label) in enumerate(self._nav_rows):
+            if i >= len(options):
+                row.setVisible(False)
+                continue
                 
-                self.nav_options_layout.addLayout(option_layout)
-        else:
-            # No options available
-            no_options = QLabel("No navigation options available")
-            no_options.setStyleSheet("color: #999; font-style: italic;")
-            self.nav_options_layout.addWidget(no_options)
+            option = options[i]
+            content = option["content"]
+            if len(content) > 40:
+                content = content[:37] + "..."
+            num_btn.setText(str(option["number"]))
+            content_label.setText(content)
+            row.setVisible(True)
+            
+        self._no_nav_options.setVisible(not options)
+        
+    def _create_navigation_row(self, index):
+        """Create an option row for the navigation panel
+        
+        Args:
+            index: Position of the row, its button navigates to _nav_option_ids[index]
+            
+        Returns:
+            (row, num_btn, content_label) tuple
+        """
+        row = QWidget()
+        option_layout = QHBoxLayout(row)
+        option_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Number button
+        num_btn = QPushButton()
+        num_btn.setMaximumWidth(30)
+        num_btn.clicked.connect(lambda checked=False: self.focus_on_node(self._nav_option_ids[index]))
+        option_layout.addWidget(num_btn)
+        
+        # Content label
+        content_label = QLabel()
+        content_label.setWordWrap(True)
+        option_layout.addWidget(content_label, 1)
+        
+        self.nav_options_layout.addWidget(row)
+        return row, num_btn, content_label
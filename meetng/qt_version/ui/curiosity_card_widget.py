@@ -12,12 +12,111 @@ class CuriosityCardWidget(QFrame):
     
     answer_submitted = pyqtSignal(CuriosityQuestion, object)
     
+    # Stylesheet for the card and all its children, set once per card so Qt
+    # parses one sheet instead of one per child widget
+    _STYLE = """
+        CuriosityCardWidget {
+            background-color: #ffffff;
+            border-radius: 8px;
+            border: 1px solid #e0e0e0;
+            margin: 8px;
+        }
+        CuriosityCardWidget:hover {
+            border: 1px solid #c0c0c0;
+            background-color: #f9f9f9;
+        }
+        CuriosityCardWidget[answered="true"],
+        CuriosityCardWidget[answered="true"]:hover {
+            background-color: #f8f9fa;  /* Subtle background to indicate answered state */
+        }
+        QLabel#Question {
+            font-size: 14pt;
+            font-weight: bold;
+            color: #2c3e50;  /* Darker blue color that contrasts with backgrounds */
+            background-color: transparent;  /* Ensure background is transparent */
+        }
+        QPushButton#Expand {
+            border: none;
+            background-color: transparent;
+            color: #7f8c8d;
+        }
+        QPushButton#Expand:hover {
+            color: #2c3e50;
+        }
+        QFrame#Separator {
+            background-color: #e0e0e0;
+        }
+        QRadioButton {
+            padding: 8px;
+            border-radius: 4px;
+            font-size: 12pt;
+        }
+        QRadioButton:hover {
+            background-color: #f0f0f0;
+        }
+        QRadioButton:checked {
+            background-color: #d1e7dd;
+        }
+        QLineEdit#CustomAnswer {
+            padding: 8px;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+            font-size: 12pt;
+            background-color: #ffffff;  /* Explicitly set background */
+            color: #333333;  /* Explicitly set text color */
+        }
+        QLineEdit#CustomAnswer:focus {
+            border: 1px solid #80bdff;
+        }
+        QLineEdit#CustomAnswer:enabled {
+            /* Enabled only while "Other" is selected, make it more prominent */
+            border: 2px solid #80bdff;
+            background-color: #f8f9fa;
+        }
+        QPushButton#Skip, QPushButton#Submit {
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+        }
+        QPushButton#Skip {
+            background-color: #6c757d;
+        }
+        QPushButton#Skip:hover {
+            background-color: #5a6268;
+        }
+        QPushButton#Submit {
+            background-color: #28a745;
+        }
+        QPushButton#Submit:hover {
+            background-color: #218838;
+        }
+        QLabel#StatusIcon, QLabel#StatusText {
+            color: #28a745;
+        }
+        QLabel#StatusIcon {
+            font-size: 14pt;
+        }
+        QLabel#StatusIcon[skipped="true"], QLabel#StatusText[skipped="true"] {
+            color: #6c757d;
+        }
+    """
+    
+    # Question type indicator styles, other types (such as
+    # MULTIPLE_CHOICE_FILL) use the default
+    _INDICATOR_STYLES = {
+        QuestionType.YES_NO: "background-color: #3498db; border-radius: 6px;",
+        QuestionType.MULTIPLE_CHOICE: "background-color: #2ecc71; border-radius: 6px;",
+    }
+    _DEFAULT_INDICATOR_STYLE = "background-color: #9b59b6; border-radius: 6px;"
+    
     def __init__(self, question: CuriosityQuestion, parent=None):
         super().__init__(parent)
         self.question = question
         self.is_answered = False
         self.is_expanded = True
         self.answer = None
+        self._selected_button = None  # Checked answer option, tracked by _on_button_toggled
         
         # Set up frame appearance
         self.setFrameShape(QFrame.Shape.StyledPanel)
@@ -26,18 +125,7 @@ class CuriosityCardWidget(QFrame):
         self.setMidLineWidth(0)
         
         # Apply card styling
-        self.setStyleSheet("""
-            CuriosityCardWidget {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #e0e0e0;
-                margin: 8px;
-            }
-            CuriosityCardWidget:hover {
-                border: 1px solid #c0c0c0;
-                background-color: #f9f9f9;
-            }
-        """)
+        self.setStyleSheet(self._STYLE)
         
         # Set minimum size
         self.setMinimumHeight(100)
@@ -60,29 +148,13 @@ class CuriosityCardWidget(QFrame):
         # Question text
         self.question_label = QLabel(question.text)
         self.question_label.setWordWrap(True)
-        self.question_label.setStyleSheet("""
-            QLabel {
-                font-size: 14pt;
-                font-weight: bold;
-                color: #2c3e50;  /* Darker blue color that contrasts with backgrounds */
-                background-color: transparent;  /* Ensure background is transparent */
-            }
-        """)
+        self.question_label.setObjectName("Question")
         self.header_layout.addWidget(self.question_label, 1)
         
         # Expand/collapse button
         self.expand_button = QPushButton("▼")
         self.expand_button.setFixedSize(24, 24)
-        self.expand_button.setStyleSheet("""
-            QPushButton {
-                border: none;
-                background-color: transparent;
-                color: #7f8c8d;
-            }
-            QPushButton:hover {
-                color: #2c3e50;
-            }
-        """)
+        self.expand_button.setObjectName("Expand")
         self.expand_button.clicked.connect(self.toggle_expanded)
         self.header_layout.addWidget(self.expand_button)
         
@@ -92,7 +164,7 @@ class CuriosityCardWidget(QFrame):
         self.separator = QFrame()
         self.separator.setFrameShape(QFrame.Shape.HLine)
         self.separator.setFrameShadow(QFrame.Shadow.Sunken)
-        self.separator.setStyleSheet("background-color: #e0e0e0;")
+        self.separator.setObjectName("Separator")
         self.main_layout.addWidget(self.separator)
         
         # Content area (will be hidden when collapsed)
@@ -110,52 +182,34 @@ class CuriosityCardWidget(QFrame):
         
         # Skip button
         self.skip_button = QPushButton("Skip")
-        self.skip_button.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
+        self.skip_button.setObjectName("Skip")
         self.skip_button.clicked.connect(self.skip_question)
         self.button_layout.addWidget(self.skip_button)
         
         # Submit button
         self.submit_button = QPushButton("Submit")
-        self.submit_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
+        self.submit_button.setObjectName("Submit")
         self.submit_button.clicked.connect(self.submit_answer)
         self.button_layout.addWidget(self.submit_button)
         
         self.content_layout.addLayout(self.button_layout)
         self.main_layout.addWidget(self.content_widget)
         
-        # Status indicator (shows after answering)
+        # Status indicator (shows after answering), built on first answer
+        self.status_widget = None
+        
+    def _build_status_widget(self):
+        """Create the status indicator shown on collapsed answered cards"""
         self.status_widget = QWidget()
         self.status_widget.setVisible(False)
         self.status_layout = QHBoxLayout(self.status_widget)
         
         self.status_icon = QLabel("✓")
-        self.status_icon.setStyleSheet("color: #28a745; font-size: 14pt;")
+        self.status_icon.setObjectName("StatusIcon")
         self.status_layout.addWidget(self.status_icon)
         
         self.status_text = QLabel("Answered")
-        self.status_text.setStyleSheet("color: #28a745;")
+        self.status_text.setObjectName("StatusText")
         self.status_layout.addWidget(self.status_text)
         
         self.status_layout.addStretch()
@@ -164,12 +218,7 @@ class CuriosityCardWidget(QFrame):
         
     def _get_type_indicator_style(self) -> str:
         """Get the style for the question type indicator"""
-        if self.question.type == QuestionType.YES_NO:
-            return "background-color: #3498db; border-radius: 6px;"
-        elif self.question.type == QuestionType.MULTIPLE_CHOICE:
-            return "background-color: #2ecc71; border-radius: 6px;"
-        else:  # MULTIPLE_CHOICE_FILL
-            return "background-color: #9b59b6; border-radius: 6px;"
+        return self._INDICATOR_STYLES.get(self.question.type, self._DEFAULT_INDICATOR_STYLE)
     
     def _create_answer_widget(self) -> QWidget:
         """Create the appropriate answer widget based on question type"""
@@ -179,29 +228,14 @@ class CuriosityCardWidget(QFrame):
         
         if self.question.type == QuestionType.YES_NO:
             self.button_group = QButtonGroup()
+            self.button_group.buttonToggled.connect(self._on_button_toggled)
             
             for option in ["Yes", "No", "I don't know"]:
-                radio = QRadioButton(option)
-                radio.setStyleSheet("""
-                    QRadioButton {
-                        padding: 8px;
-                        border-radius: 4px;
-                        font-size: 12pt;
-                    }
-                    QRadioButton:hover {
-                        background-color: #f0f0f0;
-                    }
-                    QRadioButton:checked {
-                        background-color: #d1e7dd;
-                    }
-                """)
-                self.button_group.addButton(radio)
-                # Connect toggled signal to auto-submit
-                radio.toggled.connect(lambda checked, btn=radio: self.auto_submit(checked, btn))
-                layout.addWidget(radio)
+                self._add_radio(option, layout)
                 
         elif self.question.type in [QuestionType.MULTIPLE_CHOICE, QuestionType.MULTIPLE_CHOICE_FILL]:
             self.button_group = QButtonGroup()
+            self.button_group.buttonToggled.connect(self._on_button_toggled)
             
             # Add a scroll area if there are many choices
             if self.question.choices and len(self.question.choices) > 4:
@@ -211,74 +245,23 @@ class CuriosityCardWidget(QFrame):
                 scroll_layout = QVBoxLayout(scroll_content)
                 
                 for choice in self.question.choices:
-                    radio = QRadioButton(choice)
-                    radio.setStyleSheet("""
-                        QRadioButton {
-                            padding: 8px;
-                            border-radius: 4px;
-                            font-size: 12pt;
-                        }
-                        QRadioButton:hover {
-                            background-color: #f0f0f0;
-                        }
-                    """)
-                    self.button_group.addButton(radio)
-                    scroll_layout.addWidget(radio)
+                    self._add_radio(choice, scroll_layout, auto_submit=False)
                 
                 scroll_area.setWidget(scroll_content)
                 layout.addWidget(scroll_area)
             else:
                 # Original implementation for fewer choices
                 for choice in self.question.choices:
-                    radio = QRadioButton(choice)
-                    radio.setStyleSheet("""
-                        QRadioButton {
-                            padding: 8px;
-                            border-radius: 4px;
-                            font-size: 12pt;
-                        }
-                        QRadioButton:hover {
-                            background-color: #f0f0f0;
-                        }
-                    """)
-                    self.button_group.addButton(radio)
-                    # Connect toggled signal to auto-submit
-                    radio.toggled.connect(lambda checked, btn=radio: self.auto_submit(checked, btn))
-                    layout.addWidget(radio)
+                    self._add_radio(choice, layout)
                 
             if self.question.type == QuestionType.MULTIPLE_CHOICE_FILL:
-                # Add custom answer option
-                custom_radio = QRadioButton("Other:")
-                custom_radio.setStyleSheet("""
-                    QRadioButton {
-                        padding: 8px;
-                        border-radius: 4px;
-                        font-size: 12pt;
-                    }
-                    QRadioButton:hover {
-                        background-color: #f0f0f0;
-                    }
-                """)
-                self.button_group.addButton(custom_radio)
-                # Connect toggled signal to auto-submit (but not for custom option)
+                # Add custom answer option, which doesn't auto-submit
                 custom_layout = QHBoxLayout()
-                custom_layout.addWidget(custom_radio)
+                custom_radio = self._add_radio("Other:", custom_layout, auto_submit=False)
                 
                 self.custom_input = QLineEdit()
                 self.custom_input.setEnabled(False)
-                self.custom_input.setStyleSheet("""
-                    QLineEdit {
-                        padding: 8px;
-                        border: 1px solid #ddd;
-                        border-radius: 4px;
-                        font-size: 12pt;
-                        background-color: #ffffff;  /* Explicitly set background */
-                        color: #333333;  /* Explicitly set text color */
-                    }
-                    QLineEdit:focus {
-                        border: 1px solid #80bdff;
-                    }
-                """)
+                self.custom_input.setObjectName("CustomAnswer")
                 custom_layout.addWidget(self.custom_input)
                 
                 # Enable/disable custom input based on radio selection
@@ -288,43 +271,41 @@ class CuriosityCardWidget(QFrame):
         
         return widget
     
+    def _add_radio(self, text, layout, auto_submit=True) -> QRadioButton:
+        """Create an answer option radio button in the button group
+        
+        Args:
+            text: Option text
+            layout: Layout to add the radio button to
+            auto_submit: Whether selecting the option submits the answer
+        """
+        radio = QRadioButton(text)
+        self.button_group.addButton(radio)
+        if auto_submit:
+            # Connect toggled signal to auto-submit
+            radio.toggled.connect(self.auto_submit)
+        layout.addWidget(radio)
+        return radio
+    
+    def _on_button_toggled(self, button, checked):
+        """Remember the checked answer option"""
+        if checked:
+            self._selected_button = button
+    
     def _handle_custom_toggle(self, checked):
         """Handle toggling of the 'Other' option"""
+        # The stylesheet highlights the input while it is enabled
         self.custom_input.setEnabled(checked)
         if checked:
             self.custom_input.setFocus()
-            # Animate the custom input to make it more prominent
-            self.custom_input.setStyleSheet("""
-                QLineEdit {
-                    padding: 8px;
-                    border: 2px solid #80bdff;
-                    border-radius: 4px;
-                    font-size: 12pt;
-                    background-color: #f8f9fa;
-                }
-            """)
-        else:
-            self.custom_input.setStyleSheet("""
-                QLineEdit {
-                    padding: 8px;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    font-size: 12pt;
-                }
-            """)
     
     def get_answer(self):
         """Get the selected/entered answer"""
-        if self.question.type == QuestionType.YES_NO:
-            selected = self.button_group.checkedButton()
-            return selected.text() if selected else None
-            
-        elif self.question.type == QuestionType.MULTIPLE_CHOICE:
-            selected = self.button_group.checkedButton()
+        selected = self._selected_button
+        if self.question.type in (QuestionType.YES_NO, QuestionType.MULTIPLE_CHOICE):
             return selected.text() if selected else None
             
         elif self.question.type == QuestionType.MULTIPLE_CHOICE_FILL:
-            selected = self.button_group.checkedButton()
             if not selected:
                 return None
             if selected.text() == "Other:":
@@ -369,31 +350,34 @@ class CuriosityCardWidget(QFrame):
         self.content_widget.setVisible(self.is_expanded)
         
         # Show status if answered and collapsed
-        self.status_widget.setVisible(self.is_answered and not self.is_expanded)
+        if self.status_widget:
+            self.status_widget.setVisible(self.is_answered and not self.is_expanded)
         
         # Animate height change
         self.adjustSize()
     
-    def auto_submit(self, checked, button):
+    def auto_submit(self, checked):
         """Auto-submit when a radio button is selected"""
         if checked:  # Only submit when button is checked (not when unchecked)
             # Short delay to allow UI to update
-            QTimer.singleShot(100, lambda: self.submit_answer())
+            QTimer.singleShot(100, self.submit_answer)
     
     def _update_appearance(self):
         """Update appearance after answering"""
         if self.is_answered:
+            if not self.status_widget:
+                self._build_status_widget()
+                
             # Update status text
-            if self.answer == "skipped":
+            skipped = self.answer == "skipped"
+            if skipped:
                 self.status_icon.setText("⟳")
-                self.status_icon.setStyleSheet("color: #6c757d; font-size: 14pt;")
                 self.status_text.setText("Skipped")
-                self.status_text.setStyleSheet("color: #6c757d;")
             else:
                 self.status_icon.setText("✓")
-                self.status_icon.setStyleSheet("color: #28a745; font-size: 14pt;")
                 self.status_text.setText("Answered: " + self.answer[:20] + ("..." if len(self.answer) > 20 else ""))
-                self.status_text.setStyleSheet("color: #28a745;")
+            for label in (self.status_icon, self.status_text):
+                self._set_style_property(label, "skipped", skipped)
             
             # Disable input controls
             for button in self.button_group.buttons():
@@ -407,14 +391,11 @@ class CuriosityCardWidget(QFrame):
             self.skip_button.setEnabled(False)
             
             # Add subtle background color to indicate answered state
-            self.setStyleSheet("""
-                CuriosityCardWidget {
-                    background-color: #f8f9fa;
-                    border-radius: 8px;
-                    border: 1px solid #e0e0e0;
-                    margin: 8px;
-                }
-                CuriosityCardWidget:hover {
-                    border: 1px solid #c0c0c0;
-                }
-            """)
+            self._set_style_property(self, "answered", True)
+    
+    @staticmethod
+    def _set_style_property(widget, name, value):
+        """Set a property used by stylesheet selectors and restyle the widget"""
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
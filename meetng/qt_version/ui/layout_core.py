@@ -0,0 +1,77 @@
+"""
+Array-based tree layout kernels for the conversation compass.
+
+The hierarchical layout in TreeLayoutManager walks Python dicts, which is
+interpreter-bound on large trees. The kernel here runs the same two passes
+(bottom-up subtree widths, top-down slot placement) over flat arrays and is
+compiled with Numba when it is installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _compute_positions(first_child, next_sibling, child_counts, widths, level_y, sibling_x):
+    """Compute hierarchical layout positions for a tree stored as arrays
+
+    Nodes must be indexed in breadth-first order from the root at index 0,
+    so every child has a larger index than its parent.
+
+    Args:
+        first_child: Index of each node's first child, or -1 for leaves
+        next_sibling: Index of each node's next sibling, or -1 for the last
+        child_counts: Number of children each node lists, including ones
+            missing from the arrays; the spacing between child slots is
+            reserved for all of them, as TreeLayoutManager does
+        widths: Width of each node
+        level_y: Vertical spacing between levels
+        sibling_x: Horizontal spacing between sibling subtrees
+
+    Returns:
+        (x_out, y_out) arrays of node positions. The root is left at (0, 0)
+        for the caller to place; its subtree slot starts at x = 0.
+    """
+    n = widths.shape[0]
+    subtree_widths = np.empty(n, dtype=np.float64)
+
+    # Bottom-up: a subtree is as wide as its node or its children side by side
+    for i in range(n - 1, -1, -1):
+        total = 0.0
+        child = first_child[i]
+        while child != -1:
+            total += subtree_widths[child]
+            child = next_sibling[child]
+        count = child_counts[i]
+        if count > 1:
+            total += sibling_x * (count - 1)
+        subtree_widths[i] = max(widths[i], total)
+
+    # Top-down: center each node in its slot, laying child slots out left to right
+    x_out = np.zeros(n, dtype=np.float64)
+    y_out = np.zeros(n, dtype=np.float64)
+    offsets = np.zeros(n, dtype=np.float64)
+    levels = np.zeros(n, dtype=np.int64)
+    for i in range(n):
+        if i > 0:
+            x_out[i] = offsets[i] + (subtree_widths[i] - widths[i]) / 2
+            y_out[i] = levels[i] * level_y
+        current_x = offsets[i]
+        child = first_child[i]
+        while child != -1:
+            offsets[child] = current_x
+            levels[child] = levels[i] + 1
+            current_x += subtree_widths[child] + sibling_x
+            child = next_sibling[child]
+
+    return x_out, y_out
+
+
+if NUMBA_AVAILABLE:
+    compute_positions = njit(cache=True)(_compute_positions)
+else:
+    compute_positions = _compute_positions
@@ -378,6 +378,23 @@ class SettingsDialog(QDialog):
         debug_group.setLayout(debug_layout)
         advanced_layout.addWidget(debug_group)
         
+        # Conversation Compass Settings
+        compass_group = QGroupBox("Conversation Compass")
+        compass_layout = QVBoxLayout()
+        
+        self.compass_semantic_cache = QCheckBox("Reuse suggestions for similarly worded utterances")
+        self.compass_semantic_cache.setChecked(
+            self.settings_manager.get_setting('compass_semantic_cache', 'false').lower() == 'true'
+        )
+        self.compass_semantic_cache.setToolTip(
+            "Sends each utterance to OpenAI embeddings to find earlier suggestions; "
+            "takes effect for new Compass sessions"
+        )
+        compass_layout.addWidget(self.compass_semantic_cache)
+        
+        compass_group.setLayout(compass_layout)
+        advanced_layout.addWidget(compass_group)
+        
         # Add Statistics Reset section
         stats_group = QGroupBox("Template Statistics")
         stats_layout = QVBoxLayout()
@@ -444,6 +461,9 @@ Return a list of questions in the specified format.'''
             
             # Save debug mode setting
             self.settings_manager.save_setting('debug_mode', str(self.debug_mode.isChecked()).lower())
+            self.settings_manager.save_setting(
+                'compass_semantic_cache', str(self.compass_semantic_cache.isChecked()).lower()
+            )
             
             # Only validate and save API keys if they've been modified
             openai_key = self.openai_key.text().strip()
@@ -0,0 +1,99 @@
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QTest
+
+from qt_version.ui.conversation_compass_setup_dialog import ConversationCompassSetupDialog
+
+
+@pytest.fixture
+def dialog(qapp):
+    d = ConversationCompassSetupDialog()
+    yield d
+    d.deleteLater()
+
+
+def test_context_edits_emit_once_after_typing_pauses(dialog):
+    emitted = []
+    dialog.context_edited.connect(lambda: emitted.append(True))
+    dialog.go_next_step()
+
+    for text in ("c", "cl", "close the deal"):
+        dialog.goal_input.setText(text)
+    dialog.topics_input.setText("pricing, timeline")
+    dialog.additional_context.setPlainText("Second call with this customer")
+    assert emitted == []
+
+    QTest.qWait(400)
+    assert emitted == [True]
+    assert dialog.topics_input.styleSheet() == ""
+
+
+class TemplateService:
+    """Stands in for the LangChain service's template lookup"""
+
+    def get_template(self, name):
+        return {"name": name, "conversation_mode": "guided"}
+
+
+def _wait_for_templates(dialog):
+    for _ in range(20):
+        if dialog.templates_list.count():
+            return
+        QTest.qWait(50)
+
+
+def test_only_the_first_step_is_built_up_front(dialog):
+    assert dialog._built == [True, False, False, False]
+    assert dialog.steps.currentIndex() == 0
+    assert dialog.steps.currentWidget().findChild(type(dialog.type_combo)) is dialog.type_combo
+    assert not hasattr(dialog, "goal_input")
+
+
+def test_next_builds_and_shows_each_step(dialog):
+    for step in range(1, 4):
+        dialog.go_next_step()
+        assert dialog._built[step]
+        assert dialog.steps.currentIndex() == step
+    assert dialog.finish_btn.isVisibleTo(dialog)
+    assert not dialog.next_btn.isVisibleTo(dialog)
+
+    dialog.go_previous_step()
+    assert dialog.steps.currentIndex() == 2
+    assert dialog.back_btn.isEnabled()
+
+
+def test_finish_without_visiting_steps_uses_defaults(dialog):
+    dialog.finish_setup()
+    result = dialog.get_setup_result()
+
+    assert result["goal"] == ""
+    assert result["detail_level"] == "Medium"
+    assert result["layout_type"] == "Radial"
+    assert result["focus_questions"] is True
+    assert result["initial_tree_state"] == "expand_first_level"
+    assert result["templates"] == []
+
+
+def test_templates_load_from_the_source_off_the_ui_thread(qapp):
+    dialog = ConversationCompassSetupDialog(
+        langchain_service=TemplateService(), template_source=lambda: ["Custom - Renewal"]
+    )
+    try:
+        for _ in range(3):
+            dialog.go_next_step()
+        _wait_for_templates(dialog)
+        assert dialog.templates_list.item(0).text() == "Custom - Renewal"
+
+        dialog.templates_list.item(0).setCheckState(Qt.CheckState.Checked)
+        dialog._expand_group.button(2).setChecked(True)
+        dialog.finish_setup()
+        result = dialog.get_setup_result()
+
+        assert result["templates"] == ["Custom - Renewal"]
+        assert result["initial_tree_state"] == "collapse_all"
+        assert result["mode"] == 1  # Template's "guided" mode
+    finally:
+        dialog.deleteLater()
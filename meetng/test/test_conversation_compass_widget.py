@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtGui import QBrush, QColor, QFont, QImage, QPainter, QPen
+from PyQt6.QtWidgets import QStyleOptionGraphicsItem
+
+from qt_version.ui.conversation_compass_widget import (
+    ConversationNode, ConversationTreeView, TreeLayoutManager, _QuadTree,
+    _compile_keyword_triggers, _KEYWORD_PATTERN, _KEYWORD_RANKS
+)
+
+
+def _render(node, painter_setup=None):
+    image = QImage(240, 120, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.translate(10, 20)
+    if painter_setup:
+        painter_setup(painter)
+    option = QStyleOptionGraphicsItem()
+    option.exposedRect = node.boundingRect()
+    node.paint(painter, option, None)
+    painter.end()
+    return image
+
+
+def _leftover_state(painter):
+    """State an earlier item could leave behind under DontSavePainterState"""
+    painter.setFont(QFont("Arial", 30, QFont.Weight.Bold))
+    painter.setPen(QPen(QColor(255, 0, 0), 5))
+    painter.setBrush(QBrush(QColor(0, 0, 255)))
+
+
+def test_node_paint_ignores_leftover_painter_state(qapp):
+    node = ConversationNode(0, 0, 200, 80, "Hello there, how are you?")
+    node.add_navigation_indicator(3)
+
+    assert _render(node, _leftover_state) == _render(node)
+
+
+def _scattered_points(count, seed=7):
+    return np.random.default_rng(seed).uniform(0, 2000, size=(count, 2))
+
+
+def test_quadtree_tracks_mass_and_center_of_mass():
+    points = _scattered_points(50).tolist()
+    tree = _QuadTree.build(points)
+
+    assert tree.mass == 50
+    assert (tree.com_x, tree.com_y) == pytest.approx(tuple(np.mean(points, axis=0)))
+
+
+def test_quadtree_keeps_coincident_points_in_one_leaf():
+    tree = _QuadTree.build([(5.0, 5.0)] * 3 + [(100.0, 100.0)])
+    assert tree.mass == 4
+
+
+def test_barnes_hut_with_zero_theta_matches_pairwise_repulsion():
+    manager = TreeLayoutManager(None)
+    manager.barnes_hut_theta = 0.0
+    positions = _scattered_points(60)
+
+    exact = manager._pairwise_repulsion(positions, 5000)
+    approx = manager._barnes_hut_repulsion(positions, 5000)
+
+    np.testing.assert_allclose(approx, exact, rtol=1e-9, atol=1e-12)
+
+
+def test_barnes_hut_approximates_pairwise_repulsion():
+    manager = TreeLayoutManager(None)
+    positions = _scattered_points(300)
+
+    exact = manager._pairwise_repulsion(positions, 5000)
+    approx = manager._barnes_hut_repulsion(positions, 5000)
+
+    error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.median(error) < 0.05
+
+
+def test_pairwise_repulsion_is_equal_and_opposite():
+    manager = TreeLayoutManager(None)
+    positions = np.array([[0.0, 0.0], [100.0, 0.0], [0.0, 0.0], [40.0, 30.0]])
+
+    forces = manager._pairwise_repulsion(positions, 5000)
+
+    assert np.all(np.isfinite(forces))
+    np.testing.assert_allclose(forces.sum(axis=0), 0.0, atol=1e-9)
+    assert forces[1, 0] > 0  # Pushed away from the nodes on its left
+
+
+def test_keyword_pattern_finds_overlapping_keywords_longest_first():
+    ranks, pattern = _compile_keyword_triggers((
+        ("question", ("ask", "ask about")),
+        ("decision", ("about", "choose")),
+    ))
+
+    assert pattern.findall("let me ask about pricing") == ["ask about", "about"]
+    assert ranks == {
+        "ask": (0, "question"), "ask about": (1, "question"),
+        "about": (2, "decision"), "choose": (3, "decision"),
+    }
+
+
+def test_keyword_triggers_rank_in_table_order():
+    found = set(_KEYWORD_PATTERN.findall("i have a concern, so can we decide on a question?"))
+    assert found == {"concern", "decide", "question"}
+    assert _KEYWORD_RANKS[min(found, key=_KEYWORD_RANKS.__getitem__)][1] == "question"
+
+
+@pytest.fixture
+def tree_view(qapp):
+    view = ConversationTreeView()
+    yield view
+    view.deleteLater()
+
+
+def test_tree_view_indexes_nodes_by_type_keyword_and_option(tree_view):
+    tree_view.add_node("root", None, "Conversation Start", "actual")
+    tree_view.add_node("a", "root", "Option 12: raise a concern", "objection")
+    tree_view.add_node("b", "root", "Any question?", "statement")
+    tree_view.add_node("c", "root", "#3 let's decide", "decision")
+
+    assert tree_view.find_nodes("objection", "question") == ["a", "b"]
+    assert tree_view.find_nodes("decision", "concern") == ["a", "c"]
+    assert tree_view.find_option_node(12) == "a"
+    assert tree_view.find_option_node(1) == "a"
+    assert tree_view.find_option_node(3) == "c"
+    assert tree_view.find_option_node(2) is None
+    assert tree_view.nodes["root"].children == ["a", "b", "c"]
+
+
+def test_tree_view_reuses_pooled_nodes_after_clear(tree_view):
+    first = tree_view.add_node("root", None, "Conversation Start", "actual")
+    second = tree_view.add_node("a", "root", "Any question?", "question")
+    tree_view.clear_tree()
+
+    assert tree_view.nodes == {}
+    assert tree_view.find_nodes("question", "question") == []
+
+    reused = tree_view.add_node("root", None, "Fresh start", "statement")
+    assert reused in (first, second)
+    assert reused.scene() is tree_view.scene
+    assert reused.content == "Fresh start"
+    assert reused.node_type == "statement"
+    assert reused.children == []
+    assert len(tree_view._node_pool) == 1
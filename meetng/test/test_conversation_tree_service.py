@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+import zlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtTest import QTest
+
+from qt_version.services import conversation_tree_service
+from qt_version.services.conversation_tree_service import ConversationTreeService
+from qt_version.services.suggestion_disk_cache import SuggestionDiskCache
+
+
+class FakeLangChainService:
+    """Records how generate_conversation_suggestions is called"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.contexts = []
+
+    def generate_conversation_suggestions(self, prompt, num_suggestions=3, context=None, history=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.contexts.append(json.dumps(context, sort_keys=True))
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        said = history[-1]["content"] if history else "start"
+        return json.dumps([
+            {"speaker": "Sales", "content": f"Reply {i} to {said}"} for i in range(num_suggestions)
+        ])
+
+
+class StubEmbedder:
+    """Embeds texts that only differ in case and end punctuation identically"""
+
+    def embed_query(self, text):
+        vector = np.zeros(64, dtype=np.float32)
+        vector[zlib.crc32(text.lower().rstrip(".!?").encode()) % 64] = 1.0
+        return vector
+
+
+SUGGESTIONS = [{"speaker": "Sales", "content": "Great, shall we look at the contract?"}]
+
+
+def _history(previous, latest):
+    return [{"speaker": "Sales", "content": previous}, {"speaker": "Customer", "content": latest}]
+
+
+@pytest.fixture
+def service():
+    service = ConversationTreeService(embedder=StubEmbedder())
+    service.conversation_context = {"title": "Renewal", "goals": ["Close the deal"]}
+    similar, entry = service._find_similar_suggestions(
+        _history("Does the price work?", "Okay."), 3, service._context_hash()
+    )
+    assert similar is None
+    service._cache_suggestions("key", SUGGESTIONS, entry)
+    return service
+
+
+def test_semantic_cache_is_off_without_embedder():
+    service = ConversationTreeService()
+    assert service._semantic_cache is None
+    assert service._find_similar_suggestions(_history("Hi", "Okay."), 3, "hash") == (None, None)
+
+
+def test_semantic_cache_matches_reworded_utterance(service):
+    similar, _ = service._find_similar_suggestions(
+        _history("Does the price work?", "okay!"), 3, service._context_hash()
+    )
+    assert similar == SUGGESTIONS
+
+
+@pytest.mark.parametrize("previous,num_suggestions", [
+    ("Shall we end the call?", 3),  # another branch
+    ("Does the price work?", 5),  # another suggestion count
+])
+def test_semantic_cache_misses_other_branches_and_counts(service, previous, num_suggestions):
+    similar, _ = service._find_similar_suggestions(
+        _history(previous, "Okay."), num_suggestions, service._context_hash()
+    )
+    assert similar is None
+
+
+def test_semantic_cache_misses_other_goals(service):
+    service.conversation_context = {"title": "Renewal", "goals": ["Upsell support"]}
+    similar, _ = service._find_similar_suggestions(
+        _history("Does the price work?", "Okay."), 3, service._context_hash()
+    )
+    assert similar is None
+
+
+CONTEXT = {"title": "Renewal", "participants": ["Sales", "Customer"], "goals": ["Close the deal"]}
+
+
+def _wait_for_batch(service):
+    done = []
+    service.suggestions_batch_ready.connect(done.append)
+    for _ in range(50):
+        if done:
+            break
+        QTest.qWait(100)
+    return done
+
+
+def test_batch_serializes_llm_calls_on_a_context_snapshot(qapp):
+    langchain = FakeLangChainService()
+    service = ConversationTreeService(langchain)
+    assert service.create_new_conversation(json.loads(json.dumps(CONTEXT)))
+    children = list(service.get_node(service.root_id).children)
+    langchain.contexts.clear()
+
+    service.generate_suggestions_batch(children)
+    service.conversation_context["goals"].append("Upsell support")
+    done = _wait_for_batch(service)
+
+    assert done == [children]
+    assert langchain.max_active == 1
+    assert langchain.contexts == [json.dumps(CONTEXT, sort_keys=True)] * len(children)
+    assert all(service.get_node(child).children for child in children)
+
+
+def test_batch_reports_done_when_tree_is_replaced(qapp):
+    service = ConversationTreeService(FakeLangChainService())
+    assert service.create_new_conversation(dict(CONTEXT))
+    children = list(service.get_node(service.root_id).children)
+
+    service.generate_suggestions_batch(children)
+    service.create_new_conversation(dict(CONTEXT, title="Another call"))
+    done = _wait_for_batch(service)
+
+    assert done == [[]]
+
+
+def test_cache_key_depends_on_prompt_and_count():
+    service = ConversationTreeService()
+    key = service._suggestion_cache_key("prompt", 3)
+
+    assert key == service._suggestion_cache_key("prompt", 3)
+    assert key != service._suggestion_cache_key("prompt", 5)
+    assert key != service._suggestion_cache_key("other prompt", 3)
+
+
+def test_memory_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(conversation_tree_service, "SUGGESTION_CACHE_SIZE", 2)
+    service = ConversationTreeService()
+    for key in ("a", "b"):
+        service._cache_suggestions(key, SUGGESTIONS)
+    service._get_cached_suggestions("a")  # Now the most recently used
+
+    service._cache_suggestions("c", SUGGESTIONS)
+
+    assert service._get_cached_suggestions("b") is None
+    assert service._get_cached_suggestions("a") == SUGGESTIONS
+    assert service._get_cached_suggestions("c") == SUGGESTIONS
+
+
+def test_failed_responses_are_not_cached():
+    service = ConversationTreeService()
+    service._cache_suggestions("key", [])
+    assert service._get_cached_suggestions("key") is None
+
+
+def test_memory_misses_fall_back_to_disk_cache(tmp_path):
+    disk_cache = SuggestionDiskCache(str(tmp_path / "suggestions.db"))
+    try:
+        ConversationTreeService(disk_cache=disk_cache)._cache_suggestions("key", SUGGESTIONS)
+
+        service = ConversationTreeService(disk_cache=disk_cache)
+        assert service._get_cached_suggestions("key") == SUGGESTIONS
+        assert "key" in service._suggestion_cache
+
+        service.clear_suggestion_cache()
+        assert disk_cache.get("key") is None
+    finally:
+        disk_cache.close()
+
+
+def test_request_suggestions_reuses_cached_responses():
+    langchain = FakeLangChainService()
+    service = ConversationTreeService(langchain)
+    history = _history("Does the price work?", "Okay.")
+
+    first = service._request_suggestions("prompt", 3, history)
+    assert service._request_suggestions("prompt", 3, history) == first
+    assert len(langchain.contexts) == 1
+
+    service._request_suggestions("prompt", 3, history, use_cache=False)
+    assert len(langchain.contexts) == 2
+
+
+def test_take_added_nodes_reports_additions_since_last_call(qapp):
+    service = ConversationTreeService(FakeLangChainService())
+    assert service.create_new_conversation(dict(CONTEXT))
+    assert service.take_added_nodes() is None  # Whole tree replaced
+
+    node_id = service.add_utterance("Does the price work?", "Sales")
+    added = service.take_added_nodes()
+    assert added[0] == node_id
+    assert set(added[1:]) == set(service.get_node(node_id).children)
+    assert service.take_added_nodes() == []
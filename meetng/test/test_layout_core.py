@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from qt_version.ui import layout_core
+from qt_version.ui.conversation_compass_widget import ConversationNode, TreeLayoutManager
+
+
+class TreeViewStub:
+    """Just the node dict TreeLayoutManager reads"""
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+
+# node_id -> (width, children); "gone" is listed as a child but has no node
+TREE = {
+    "root": (150, ["a", "b", "gone"]),
+    "a": (120, ["c", "d", "e"]),
+    "b": (300, ["f"]),
+    "c": (100, []),
+    "d": (140, ["g", "gone"]),
+    "e": (90, []),
+    "f": (110, []),
+    "g": (130, []),
+}
+
+
+@pytest.fixture
+def manager(qapp):
+    nodes = {}
+    for node_id, (width, children) in TREE.items():
+        node = ConversationNode(0, 0, width, 60, node_id)
+        node.node_id = node_id
+        node.children = list(children)
+        nodes[node_id] = node
+    for node_id, (_, children) in TREE.items():
+        for child_id in children:
+            if child_id in nodes:
+                nodes[child_id].parent_id = node_id
+    return TreeLayoutManager(TreeViewStub(nodes))
+
+
+def _python_layout(manager, geometry):
+    positions = dict.fromkeys(geometry, (0.0, 0.0))
+    subtree_sizes = {}
+    manager._calculate_subtree_sizes("root", subtree_sizes, geometry)
+    manager._position_subtree("root", subtree_sizes, geometry, positions)
+    return positions
+
+
+@pytest.mark.parametrize("kernel", [
+    layout_core._compute_positions,
+    pytest.param(layout_core.compute_positions, marks=pytest.mark.skipif(
+        not layout_core.NUMBA_AVAILABLE, reason="numba not installed")),
+], ids=["python", "compiled"])
+def test_array_layout_matches_python_layout(manager, monkeypatch, kernel):
+    monkeypatch.setattr("qt_version.ui.conversation_compass_widget.compute_positions", kernel)
+    geometry = manager._snapshot_geometry()
+    expected = _python_layout(manager, geometry)
+
+    positions = dict.fromkeys(geometry, (0.0, 0.0))
+    manager._position_subtree_compiled("root", geometry, positions)
+
+    assert positions.keys() == expected.keys()
+    for node_id, position in expected.items():
+        assert positions[node_id] == pytest.approx(position), node_id
+
+
+def test_compute_positions_reserves_spacing_for_listed_children():
+    # Root lists three children, one of them missing from the arrays
+    first_child = np.array([1, -1, -1], dtype=np.int64)
+    next_sibling = np.array([-1, 2, -1], dtype=np.int64)
+    child_counts = np.array([3, 0, 0], dtype=np.int64)
+    widths = np.array([50.0, 100.0, 100.0])
+
+    xs, ys = layout_core._compute_positions(first_child, next_sibling, child_counts, widths, 120.0, 180.0)
+
+    assert xs.tolist() == [0.0, 0.0, 280.0]
+    assert ys.tolist() == [0.0, 120.0, 120.0]
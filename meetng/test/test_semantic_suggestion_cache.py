@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from qt_version.services.semantic_suggestion_cache import SemanticSuggestionCache
+
+SUGGESTIONS = [{"speaker": "Sales", "content": "Shall we look at pricing?"}]
+
+
+class StubEmbedder:
+    """Embeds known texts to fixed vectors"""
+
+    VECTORS = {
+        "budget": [1.0, 0.0, 0.0],
+        "our budget": [0.99, 0.1, 0.0],  # cosine ~0.995 with "budget"
+        "timeline": [0.0, 1.0, 0.0],
+        "budget and timeline": [1.0, 1.0, 0.0],  # cosine ~0.71 with "budget"
+        "zero": [0.0, 0.0, 0.0],
+    }
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_query(self, text):
+        self.calls += 1
+        if text not in self.VECTORS:
+            raise RuntimeError("embeddings service unavailable")
+        return self.VECTORS[text]
+
+
+@pytest.fixture
+def cache():
+    return SemanticSuggestionCache(StubEmbedder(), capacity=2)
+
+
+def _add(cache, text, tag=None, suggestions=SUGGESTIONS):
+    similar, entry = cache.lookup(text, tag)
+    cache.add(entry, suggestions)
+    return similar
+
+
+def test_lookup_hits_similar_text_only(cache):
+    assert _add(cache, "budget") is None
+
+    assert cache.lookup("our budget")[0] == SUGGESTIONS
+    assert cache.lookup("budget and timeline")[0] is None
+    assert cache.lookup("timeline")[0] is None
+
+
+def test_lookup_only_matches_the_same_tag(cache):
+    _add(cache, "budget", tag=3)
+    assert cache.lookup("budget", tag=5)[0] is None
+    assert cache.lookup("budget", tag=3)[0] == SUGGESTIONS
+
+
+def test_entry_from_lookup_is_added_without_embedding_again(cache):
+    _, entry = cache.lookup("budget")
+    calls = cache.embedder.calls
+    cache.add(entry, SUGGESTIONS)
+    assert cache.embedder.calls == calls
+
+
+def test_oldest_entry_is_overwritten_when_full(cache):
+    first = [{"speaker": "Sales", "content": "first"}]
+    _add(cache, "budget", suggestions=first)
+    _add(cache, "timeline")
+    _add(cache, "budget and timeline")
+
+    assert cache.lookup("budget")[0] is None
+    assert cache.lookup("timeline")[0] == SUGGESTIONS
+    assert cache._vectors.dtype == np.float16
+
+
+def test_failed_or_zero_embeddings_are_not_cached(cache):
+    assert cache.lookup("unknown") == (None, None)
+    assert cache.lookup("zero") == (None, None)
+    cache.add(None, SUGGESTIONS)
+    assert cache._count == 0
+
+
+def test_clear_forgets_entries(cache):
+    _add(cache, "budget")
+    cache.clear()
+    assert cache.lookup("budget")[0] is None
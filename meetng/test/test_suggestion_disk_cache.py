@@ -0,0 +1,58 @@
+import itertools
+
+import pytest
+
+from qt_version.services import suggestion_disk_cache
+from qt_version.services.suggestion_disk_cache import SuggestionDiskCache
+
+SUGGESTIONS = [{"speaker": "Sales", "content": "Shall we look at pricing?"}]
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    # A strictly increasing clock, so recency never ties
+    clock = itertools.count(1000.0)
+    monkeypatch.setattr(suggestion_disk_cache.time, "time", lambda: next(clock))
+    cache = SuggestionDiskCache(str(tmp_path / "suggestions.db"), max_entries=3)
+    yield cache
+    cache.close()
+
+
+def test_get_returns_what_set_stored(cache):
+    assert cache.get("missing") is None
+    cache.set("key", SUGGESTIONS)
+    assert cache.get("key") == SUGGESTIONS
+
+
+def test_entries_survive_reopening(cache):
+    cache.set("key", SUGGESTIONS)
+    reopened = SuggestionDiskCache(cache.db_path)
+    try:
+        assert reopened.get("key") == SUGGESTIONS
+    finally:
+        reopened.close()
+
+
+def test_evict_keeps_most_recently_used(cache):
+    for key in ("a", "b", "c", "d"):
+        cache.set(key, SUGGESTIONS)
+    cache.get("a")  # Now the most recently used
+
+    cache.evict()
+
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in ("a", "c", "d")] == [True] * 3
+
+
+def test_set_evicts_periodically(cache, monkeypatch):
+    monkeypatch.setattr(SuggestionDiskCache, "EVICT_INTERVAL", 5)
+    for i in range(5):
+        cache.set(f"key{i}", SUGGESTIONS)
+
+    assert [cache.get(f"key{i}") is not None for i in range(5)] == [False, False, True, True, True]
+
+
+def test_clear_removes_everything(cache):
+    cache.set("key", SUGGESTIONS)
+    cache.clear()
+    assert cache.get("key") is None
@@ -0,0 +1,102 @@
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from qt_version.ui.components import word_cloud_widget
+from qt_version.ui.components.word_cloud_widget import WordCloudWidget
+
+ASCII_SAMPLE = (
+    "Meeting notes: abc123 foo_bar 42abc x_y the budget review.\n"
+    "Hello hello HELLO world, budget budget; it's fine! Don't stop.\n"
+)
+UNICODE_SAMPLE = (
+    "\ufeff«bonjour» great👍 ¡hola ©company hello→world middle·dot\n"
+    "café naïve résumé Ümlaut don’t stop—keep going… “quoted words” here.\n"
+)
+
+
+@pytest.fixture
+def widget(qapp):
+    w = WordCloudWidget()
+    yield w
+    w.deleteLater()
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("«bonjour»", ["bonjour"]),
+    ("great👍", ["great"]),
+    ("¡hola", ["hola"]),
+    ("©company", ["company"]),
+    ("hello→world", ["hello", "world"]),
+    ("middle·dot", ["middle", "dot"]),
+    ("don’t stop—keep going…", ["don", "stop", "keep", "going"]),
+    ("café naïve résumé", []),
+    ("abc123 foo_bar 42abc", []),
+])
+def test_preprocess_text_word_boundaries(widget, text, expected):
+    widget.custom_stopwords = set()
+    widget.stopwords = frozenset()
+    assert widget.preprocess_text(text) == expected
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("sample", [ASCII_SAMPLE, UNICODE_SAMPLE], ids=["ascii", "unicode"])
+def test_large_and_small_transcripts_count_alike(widget, tmp_path, sample):
+    repeat = word_cloud_widget._NUMBA_MIN_BYTES // len(sample.encode("utf-8")) + 1
+    small = _write(tmp_path / "small_transcript.txt", sample)
+    large = _write(tmp_path / "large_transcript.txt", sample * repeat)
+
+    assert widget.process_transcripts({small: {}})
+    small_counts = Counter(widget.word_counts)
+    assert small_counts
+
+    assert widget.process_transcripts({large: {}})
+    assert widget.word_counts == Counter({w: c * repeat for w, c in small_counts.items()})
+
+
+@pytest.mark.skipif(not word_cloud_widget.NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("min_length,custom_stopwords", [(3, ""), (1, ""), (4, "budget, café")])
+def test_jit_kernel_matches_regex(widget, tmp_path, min_length, custom_stopwords):
+    widget.update_min_length(str(min_length))
+    widget.update_custom_stopwords(custom_stopwords)
+    path = _write(tmp_path / "meeting_transcript.txt", ASCII_SAMPLE)
+
+    total = widget._count_file_jit(path)
+
+    expected = Counter(widget.preprocess_text(ASCII_SAMPLE))
+    assert widget.word_counts == expected
+    assert total == sum(expected.values())
+
+
+def test_jit_path_falls_back_to_regex_for_non_ascii(widget, tmp_path):
+    path = _write(tmp_path / "meeting_transcript.txt", UNICODE_SAMPLE)
+
+    total = widget._count_file_jit(path)
+
+    expected = Counter(widget.preprocess_text(UNICODE_SAMPLE))
+    assert widget.word_counts == expected
+    assert total == sum(expected.values())
+
+
+def test_finished_workers_are_released(widget, monkeypatch):
+    from PyQt6.QtCore import QCoreApplication, QEvent
+    from PyQt6.QtTest import QTest
+
+    monkeypatch.setattr(word_cloud_widget._WCWorker, "run", lambda self: None)
+    widget.word_counts = Counter({"budget": 3, "review": 1})
+    for _ in range(3):
+        widget.generate_wordcloud()
+
+    for _ in range(20):
+        if not widget._wc_workers:
+            break
+        QTest.qWait(100)
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    assert widget._wc_workers == set()
+    assert widget.findChildren(word_cloud_widget._WCWorker) == []